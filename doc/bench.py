@@ -0,0 +1,936 @@
+# Import future.
+from __future__ import annotations
+
+# Import typing.
+from typing import Any
+from typing import Tuple as MultiReturn
+from typing import List, Dict, Union
+
+# Import dependencies.
+import sys
+import os
+import re
+import time
+import random
+import json
+import shutil
+import tempfile
+import argparse
+import resource
+import tracemalloc
+
+# Add development library to path.
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+))
+
+# Import logging.
+from pytorch.logging import debug, info1, info2, focus, warning, error
+
+# Import dependencies.
+from doc.index import ClassIndex
+from doc.code import Code, RECOVERS, update_recover
+from doc.code import SENTENCE as REGEX
+from doc.code import scan_sentence
+from doc.config import default
+from doc.main import DirectoryDocument, FileDocument
+from doc.main import ReadmeWriter, CONSISTENT, REFERS
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Synthetic Trees >>
+# Generate style-conforming package trees of configurable sizes.
+#
+# Files are spread over packages, and every file defines classes with
+# documented methods.
+# Classes of a file inherit classes of the same position in its previous file
+# until inheritance depth is reached, thus every method is an override with
+# consistent descriptions.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+# Constant head of every synthetic file.
+HEAD = [
+    "# Import future.",
+    "from __future__ import annotations",
+    "",
+    "# Import typing.",
+    "from typing import Any",
+    "from typing import Tuple as MultiReturn",
+    "",
+    "# Import dependencies.",
+    "import sys",
+    "import os",
+    "",
+    "# Add development library to path.",
+    "if (os.path.basename(os.getcwd()) == \"MLRepo\"):",
+    "    sys.path.append(os.path.join(\".\"))",
+    "else:",
+    "    pass",
+    "",
+    "# Import logging.",
+    "from pytorch.logging import debug, info1, info2, focus, warning, error",
+    "",
+    "# Import dependencies.",
+]
+
+
+# Constant introduction of every synthetic file.
+INTRO = [
+    "# {:s}".format("=" * 77),
+    "# {:s}".format("*" * 77),
+    "# {:s}".format("-" * 77),
+    "# << Synthetic Objects >>",
+    "# Synthetic classes for benchmark.",
+    "# {:s}".format("-" * 77),
+    "# {:s}".format("*" * 77),
+    "# {:s}".format("=" * 77),
+]
+
+
+# A sentence filling descriptions.
+SENTENCE = "This is a synthetic sentence of benchmark descriptions."
+
+
+def layer(
+    fid: int, cid: int, *args: object, **kargs: object,
+) -> str:
+    r"""
+    Get name of a synthetic class.
+
+    Args
+    ----
+    - fid
+        File index.
+    - cid
+        Class index in the file.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - name
+        Class name.
+
+    """
+    # Name by both indices so that imported names never conflict.
+    return "Layer{:d}Unit{:d}".format(fid, cid)
+
+
+def spell(num: int, *args: object, **kargs: object) -> str:
+    r"""
+    Spell an index by letters.
+
+    Args
+    ----
+    - num
+        Index.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - word
+        Spelled index.
+
+    Description sentences do not allow digits.
+    """
+    # Map every digit to a letter.
+    return "".join(chr(ord("a") + int(itr)) for itr in str(num))
+
+
+def synthesize(
+    root: str, *args: object, files: int, dirs: int, classes: int,
+    methods: int, lines: int, depth: int, **kargs: object,
+) -> int:
+    r"""
+    Generate a synthetic tree.
+
+    Args
+    ----
+    - root
+        Root directory of the tree.
+    - *args
+    - files
+        Number of files.
+    - dirs
+        Number of packages.
+    - classes
+        Number of classes per file.
+    - methods
+        Number of methods per class.
+    - lines
+        Number of lines of every attached description paragraph.
+    - depth
+        Inheritance depth.
+    - **kargs
+
+    Returns
+    -------
+    - num
+        Number of generated lines.
+
+    """
+    # Generate file by file.
+    num = 0
+    for fid in range(files):
+        # Locate file and its super file.
+        package = "pkg{:d}".format(fid % dirs)
+        module = "{:s}.mod{:d}".format(package, fid)
+        if (fid % depth == 0):
+            supmod = ""
+        else:
+            supmod = "pkg{:d}.mod{:d}".format((fid - 1) % dirs, fid - 1)
+
+        # Import supers.
+        buf = list(HEAD)
+        for cid in range(classes):
+            if (len(supmod) > 0):
+                buf.append(
+                    "from {:s} import {:s}".format(
+                        supmod, layer(fid - 1, cid),
+                    ),
+                )
+            else:
+                pass
+        buf.extend(["", ""])
+        buf.extend(INTRO)
+
+        # Define classes.
+        for cid in range(classes):
+            name = layer(fid, cid)
+            supname = layer(fid - 1, cid) if len(supmod) > 0 else "object"
+            buf.extend(["", ""])
+            buf.append("class {:s}({:s}):".format(name, supname))
+            buf.extend(["    r\"\"\"", "    Synthetic class.", "    \"\"\""])
+            chain = [
+                "layer {:s} unit {:s}".format(spell(itr), spell(cid))
+                for itr in range(fid - fid % depth, fid + 1)
+            ]
+            for mid in range(methods):
+                if (mid > 0):
+                    buf.append("")
+                else:
+                    pass
+                buf.extend(method(name, mid, lines=lines, chain=chain))
+
+        # Write file.
+        path = os.path.join(root, package, "mod{:d}.py".format(fid))
+        if (os.path.isdir(os.path.dirname(path))):
+            pass
+        else:
+            os.makedirs(os.path.dirname(path))
+        file = open(path, "w")
+        file.write("\n".join(buf))
+        file.close()
+        num += len(buf)
+        debug("Generate \"{:s}\".", module)
+    return num
+
+
+def method(
+    name: str, mid: int, *args: object, lines: int, chain: List[str],
+    **kargs: object,
+) -> List[str]:
+    r"""
+    Generate a synthetic method.
+
+    Args
+    ----
+    - name
+        Class name.
+    - mid
+        Method index.
+    - *args
+    - lines
+        Number of lines of every attached description paragraph.
+    - chain
+        Spelled names of classes from the root of inheritance to this
+        class.
+    - **kargs
+
+    Returns
+    -------
+    - buf
+        Code lines.
+
+    Every class in the chain extends attached text by a paragraph, thus
+    descriptions are consistent but never the same.
+    """
+    # Define method with documented arguments and return.
+    text = "        {:s}".format(SENTENCE)
+    buf = [
+        "    def method{:d}(".format(mid),
+        "        self: {:s}, x: int, *args: object, y: int,".format(name),
+        "        **kargs: object,",
+        "    ) -> int:",
+        "        r\"\"\"",
+        "        Compute synthetic result {:s}.".format(spell(mid)),
+        "",
+        "        Args",
+        "        ----",
+        "        - self",
+        "        - x",
+    ]
+    buf.extend(["    {:s}".format(text)] * lines)
+    buf.extend(["        - *args", "        - y"])
+    buf.extend(["    {:s}".format(text)] * lines)
+    buf.extend([
+        "        - **kargs",
+        "",
+        "        Returns",
+        "        -------",
+        "        - z",
+    ])
+    buf.extend(["    {:s}".format(text)] * lines)
+    buf.append("")
+    buf.extend([text] * lines)
+    for itr in chain:
+        buf.extend(["", "        Extended by {:s}.".format(itr)])
+    buf.extend([
+        "        \"\"\"",
+        "        # Compute directly.",
+        "        return x + y",
+    ])
+    return buf
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Sentence Scanning >>
+# Compare sentence scanner with sentence regex it replaces.
+#
+# Random sentences are composed of fragments close to the sentence grammar,
+# and both of them should always give the same validity.
+# Pathological sentences repeat a valid pattern and break it only at the end,
+# thus they are the worst cases for backtracking.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+# Fragments composing random sentences.
+FRAGMENTS = [
+    "Word", "word", "Multi-word", "multi-", "-word", "W", "a", "12", "0",
+    "$x$", "$\\$$", "`y`", "`\\``", "\"z\"", "\"\\\"\"", "$", "`", "\"",
+    "\\", " ", "  ", ", ", ",", ".", "-", "(", ")", "(word)", "(a, $x$)",
+    "\n", "\u00e9",
+]
+
+
+def fuzz(num: int, *args: object, seed: int, **kargs: object) -> List[str]:
+    r"""
+    Generate random sentences.
+
+    Args
+    ----
+    - num
+        Number of sentences.
+    - *args
+    - seed
+        Random seed.
+    - **kargs
+
+    Returns
+    -------
+    - texts
+        Sentences.
+
+    """
+    # Compose random number of random fragments.
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(num):
+        texts.append("".join(
+            rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 12))
+        ))
+    return texts
+
+
+def pathological(
+    size: int, *args: object, **kargs: object,
+) -> Dict[str, str]:
+    r"""
+    Generate pathological sentences.
+
+    Args
+    ----
+    - size
+        Approximate number of characters of every sentence.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - texts
+        Invalid sentences of every pattern.
+
+    """
+    # Repeat a pattern and break it right before the last character.
+    texts = {}
+    for name, pattern, tail in (
+        ("words", " word", "  ."),
+        ("hyphens", "-word", "-."),
+        ("parentheses", " word (word, word)", " (word ."),
+        ("quotes", " \"quoted\"", " \"."),
+    ):
+        texts[name] = "Word{:s}{:s}".format(
+            pattern * (size // len(pattern)), tail,
+        )
+    return texts
+
+
+def mismatch(texts: List[str], *args: object, **kargs: object) -> List[str]:
+    r"""
+    Get sentences whose validity differs between scanner and regex.
+
+    Args
+    ----
+    - texts
+        Sentences.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - texts
+        Mismatched sentences.
+
+    """
+    # Compare validity directly.
+    return [
+        itr for itr in texts
+        if (scan_sentence(itr) < 0) != (re.match(REGEX, itr) is not None)
+    ]
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Stage Timing >>
+# Run document pipeline stage by stage on a synthetic tree, and record time of
+# every stage.
+#
+# Review stage includes streaming tokens and recoverable check, and both of
+# them are also timed alone right before and after the review.
+# Every token is also scanned by keyword and fast scanning interfaces alone,
+# and they are not parts of the pipeline.
+# Pathological sentences are checked by sentence regex and scanner alone.
+# Inheritance is checked before notes, thus checks inside notes are skipped
+# as already consistent pairs.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+# Stages in pipeline order.
+STAGES = [
+    "load_texts", "load_tokens", "review", "recoverable", "scan_keyword",
+    "scan_fast", "modules", "sections", "inheritance", "notes", "readme",
+    "sentence_regex", "sentence_scan",
+]
+
+
+# Stages timed alone, which are not counted in total time.
+ALONE = [
+    "load_tokens", "recoverable", "scan_keyword", "scan_fast",
+    "sentence_regex", "sentence_scan",
+]
+
+
+class Stopwatch(object):
+    r"""
+    Stopwatch accumulating time of stages.
+    """
+    def __init__(self: Stopwatch, *args: object, **kargs: object) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Every stage starts from zero.
+        self.seconds = {name: 0.0 for name in STAGES}
+        self.last = time.perf_counter()
+
+    def start(self: Stopwatch, *args: object, **kargs: object) -> None:
+        r"""
+        Start timing.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Remember current time.
+        self.last = time.perf_counter()
+
+    def stop(
+        self: Stopwatch, name: str, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Stop timing of a stage, and start timing of next stage.
+
+        Args
+        ----
+        - self
+        - name
+            Stage name.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Accumulate time since last start or stop.
+        now = time.perf_counter()
+        self.seconds[name] += now - self.last
+        self.last = now
+
+
+def scan(code: Code, *args: object, fast: bool, **kargs: object) -> None:
+    r"""
+    Scan every token of a code.
+
+    Args
+    ----
+    - code
+        Code scanner.
+    - *args
+    - fast
+        If True, fast scanning interface is used.
+        Otherwise, keyword scanning interface is used.
+    - **kargs
+
+    Returns
+    -------
+
+    Every token is checked and matched by its own token integer, thus it
+    only measures overhead of scanning interface.
+    """
+    # Scan line by line.
+    for line in code.memory:
+        line.reset()
+        if (fast):
+            while (not line.eol()):
+                val = line.get().token
+                line.expect_type(val, line.level)
+                line.take_type(val, line.level)
+        else:
+            while (not line.eol()):
+                val = line.get().token
+                line.check(val, level=line.level)
+                line.match(val, level=line.level)
+        line.reset()
+
+
+def run(
+    root: str, *args: object, sentences: List[str], **kargs: object,
+) -> Dict[str, float]:
+    r"""
+    Run document pipeline on a tree.
+
+    Args
+    ----
+    - root
+        Root directory of the tree.
+    - *args
+    - sentences
+        Pathological sentences.
+    - **kargs
+
+    Returns
+    -------
+    - seconds
+        Time of every stage in seconds.
+
+    """
+    # Memories of earlier runs should not help.
+    CONSISTENT.clear()
+    REFERS.clear()
+    stopwatch = Stopwatch()
+
+    # Parse every file stage by stage.
+    config = default(root)
+    doc = DirectoryDocument(config.ROOT, config=config, rootdoc=None)
+    for dirdoc, path in doc.traverse():
+        # Tokenize.
+        filedoc = FileDocument(path, config=config, rootdoc=None)
+        code = filedoc.code
+        code.path = filedoc.PATH
+        code.root = config.ROOT
+        stopwatch.start()
+        code.load_buffer()
+        code.load_texts()
+        code.rule_texts()
+        stopwatch.stop("load_texts")
+        for _ in code.load_tokens():
+            pass
+        stopwatch.stop("load_tokens")
+        stopwatch.start()
+        code.review()
+        stopwatch.stop("review")
+        stopwatch.start()
+        code.recoverable()
+        stopwatch.stop("recoverable")
+        scan(code, fast=False)
+        stopwatch.stop("scan_keyword")
+        scan(code, fast=True)
+        stopwatch.stop("scan_fast")
+
+        # Parse.
+        code.reset()
+        stopwatch.start()
+        filedoc.modules.parse(code)
+        stopwatch.stop("modules")
+        stopwatch.start()
+        filedoc.sections.parse(code)
+        filedoc.register_classes()
+        stopwatch.stop("sections")
+
+        # Attach to directory.
+        filedoc.ROOTDOC = dirdoc
+        filedoc.KEY = ""
+        dirdoc.files.append(filedoc)
+
+    # Check inheritance over the whole tree.
+    doc.CACHE = None
+    doc.CHECK = False
+    doc.INDEX = ClassIndex()
+    doc.register()
+    stopwatch.start()
+    doc.check()
+    stopwatch.stop("inheritance")
+
+    # Generate notes and write README of every directory.
+    stack = [doc]
+    while (len(stack) > 0):
+        dirdoc = stack.pop()
+        stack.extend(dirdoc.subdirs)
+        writer = ReadmeWriter(os.path.join(dirdoc.PATH, "README.md"))
+        for filedoc in dirdoc.files:
+            stopwatch.start()
+            filedoc.notes()
+            stopwatch.stop("notes")
+            stopwatch.start()
+            writer.write(
+                ["", "---", ""] + filedoc.markdown, headers=filedoc.headers,
+            )
+            filedoc.markdown.clear()
+            stopwatch.stop("readme")
+        stopwatch.start()
+        writer.close(save=True)
+        stopwatch.stop("readme")
+
+    # Check pathological sentences by regex and scanner.
+    stopwatch.start()
+    for itr in sentences:
+        re.match(REGEX, itr)
+    stopwatch.stop("sentence_regex")
+    for itr in sentences:
+        scan_sentence(itr)
+    stopwatch.stop("sentence_scan")
+    return stopwatch.seconds
+
+
+def compare(
+    results: Dict[str, Any], baseline: Dict[str, Any], *args: object,
+    **kargs: object,
+) -> None:
+    r"""
+    Compare results with a baseline.
+
+    Args
+    ----
+    - results
+        Benchmark results.
+    - baseline
+        Benchmark results of baseline.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+
+    Baseline of a different configuration is still compared, but a warning is
+    given.
+    """
+    # Configurations should be the same.
+    if (results["config"] == baseline["config"]):
+        pass
+    else:
+        warning("Baseline is generated by a different configuration.")
+
+    # Compare stage by stage.
+    for name in STAGES:
+        old = baseline["seconds"].get(name, 0.0)
+        new = results["seconds"][name]
+        info1(
+            "Stage \"{:s}\": {:.4f}s -> {:.4f}s ({:s}).", name, old, new,
+            "{:.2f}x".format(new / old) if old > 0 else "new",
+        )
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Memory Footprint >>
+# Measure memory of tokenized code with and without slots of words and lines.
+#
+# Loose words and lines are copies of slotted classes without slots, and they
+# replace slotted classes in code scanner only during measurement.
+# Memory is traced by allocations, thus it is not affected by memory already
+# owned by interpreter.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+def loose(base: type, *args: object, **kargs: object) -> type:
+    r"""
+    Get a copy of a slotted class without slots.
+
+    Args
+    ----
+    - base
+        Slotted class.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - cls
+        Class saving attributes in dictionary.
+
+    """
+    # Copy everything except slots and their descriptors.
+    slots = getattr(base, "__slots__")
+    return type(base.__name__, base.__bases__, {
+        key: val for key, val in vars(base).items()
+        if key != "__slots__" and key not in slots
+    })
+
+
+def footprint(
+    root: str, *args: object, slotted: bool, **kargs: object,
+) -> float:
+    r"""
+    Measure memory of tokenized code.
+
+    Args
+    ----
+    - root
+        Root directory of the tree.
+    - *args
+    - slotted
+        If False, words and lines are loose objects without slots.
+    - **kargs
+
+    Returns
+    -------
+    - size
+        Traced memory in KB per ten thousand lines.
+
+    Tokenized code of every file is kept until all files are loaded, thus it
+    measures footprint of the whole tree.
+    """
+    # Replace scanner classes by loose copies if necessary.
+    module = sys.modules[Code.__module__]
+    classes = {name: getattr(module, name) for name in ("Word", "Line")}
+    if (slotted):
+        pass
+    else:
+        for name, cls in classes.items():
+            setattr(module, name, loose(cls))
+
+    # Keep tokenized code of every file.
+    config = default(root)
+    doc = DirectoryDocument(config.ROOT, config=config, rootdoc=None)
+    codes = []
+    tracemalloc.start()
+    try:
+        for _, path in doc.traverse():
+            code = Code()
+            code.load_file(
+                os.path.relpath(path, config.ROOT), root=config.ROOT,
+            )
+            codes.append(code)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        for name, cls in classes.items():
+            setattr(module, name, cls)
+    num = sum(len(itr.memory) for itr in codes)
+    return size / 1024 / max(num, 1) * 10000
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Main >>
+# Main branch starts from here.
+# Timing and throughput are also saved as JSON for regression comparison.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+# Main branch.
+if (__name__ == "__main__"):
+    # Parse console arguments.
+    console = argparse.ArgumentParser(description="Benchmark MLRepo notes.")
+    console.add_argument(
+        "--files", type=int, default=40, help="Number of files.",
+    )
+    console.add_argument(
+        "--dirs", type=int, default=4, help="Number of packages.",
+    )
+    console.add_argument(
+        "--classes", type=int, default=4, help="Number of classes per file.",
+    )
+    console.add_argument(
+        "--methods", type=int, default=6,
+        help="Number of methods per class.",
+    )
+    console.add_argument(
+        "--lines", type=int, default=2,
+        help="Number of lines of every description paragraph.",
+    )
+    console.add_argument(
+        "--depth", type=int, default=4, help="Inheritance depth.",
+    )
+    console.add_argument(
+        "--repeat", type=int, default=3,
+        help="Number of runs, and the fastest one of every stage is kept.",
+    )
+    console.add_argument(
+        "--output", type=str, default="", help="JSON file saving results.",
+    )
+    console.add_argument(
+        "--baseline", type=str, default="",
+        help="JSON file of earlier results to compare with.",
+    )
+    console.add_argument(
+        "--recover", type=str, choices=RECOVERS, default="full",
+        help="Recoverability verification level.",
+    )
+    console.add_argument(
+        "--keep", action="store_true", help="Keep synthetic tree.",
+    )
+    console.add_argument(
+        "--fuzz", type=int, default=100000,
+        help="Number of random sentences checked by regex and scanner.",
+    )
+    console.add_argument(
+        "--sentence", type=int, default=100000,
+        help="Number of characters of every pathological sentence.",
+    )
+    args = console.parse_args()
+    update_recover(val=args.recover)
+
+    # Sentence scanner should accept exactly what sentence regex accepts.
+    sentences = pathological(args.sentence)
+    mismatches = mismatch(
+        fuzz(args.fuzz, seed=0) + list(sentences.values()),
+    )
+    for itr in mismatches[:10]:
+        error("Sentence regex and scanner differ on {:s}.", repr(itr))
+    info1(
+        "Sentence regex and scanner differ on {:d} of {:d} sentences.",
+        len(mismatches), args.fuzz + len(sentences),
+    )
+
+    # Synthetic tree is a standalone repository.
+    root = tempfile.mkdtemp(prefix="bench")
+    try:
+        num = synthesize(
+            root, files=args.files, dirs=args.dirs, classes=args.classes,
+            methods=args.methods, lines=args.lines, depth=args.depth,
+        )
+        info1("Synthesize {:d} lines in \"{:s}\".", num, root)
+
+        # Keep the fastest time of every stage.
+        best: Dict[str, float] = {}
+        for _ in range(args.repeat):
+            for name, val in run(
+                root, sentences=list(sentences.values()),
+            ).items():
+                best[name] = min(best.get(name, val), val)
+
+        # Measure memory of the same tree with and without slots.
+        memory = {
+            "slotted": footprint(root, slotted=True),
+            "loose": footprint(root, slotted=False),
+        }
+    finally:
+        if (args.keep):
+            pass
+        else:
+            shutil.rmtree(root)
+
+    # Summarize throughput and memory, and total time should not count
+    # stages already included by review or timed alone.
+    results: Dict[str, Any] = {
+        "config": {
+            "files": args.files, "dirs": args.dirs, "classes": args.classes,
+            "methods": args.methods, "lines": args.lines,
+            "depth": args.depth, "recover": args.recover,
+            "fuzz": args.fuzz, "sentence": args.sentence,
+        },
+        "lines": num, "seconds": best,
+        "throughput": {
+            name: num / val if val > 0 else 0.0 for name, val in best.items()
+        },
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "sentence_mismatches": len(mismatches),
+        "memory_kb_per_10k_lines": memory,
+    }
+    for name in STAGES:
+        info1(
+            "Stage \"{:s}\": {:.4f}s, {:.0f} lines/s.", name, best[name],
+            results["throughput"][name],
+        )
+    info1(
+        "Total: {:.4f}s.", sum(
+            val for name, val in best.items() if name not in ALONE
+        ),
+    )
+    info1("Peak RSS: {:d} KB.", results["peak_rss_kb"])
+    info1(
+        "Memory per 10k lines: {:.1f} KB with slots, {:.1f} KB without" \
+        " slots.", memory["slotted"], memory["loose"],
+    )
+
+    # Save and compare results.
+    if (len(args.output) > 0):
+        file = open(args.output, "w")
+        json.dump(results, file, indent=4)
+        file.close()
+    else:
+        pass
+    if (len(args.baseline) > 0):
+        file = open(args.baseline, "r")
+        compare(results, json.load(file))
+        file.close()
+    else:
+        pass
+else:
+    pass
\ No newline at end of file
@@ -0,0 +1,388 @@
+# Import future.
+from __future__ import annotations
+
+# Import typing.
+from typing import Any
+from typing import Tuple as MultiReturn
+from typing import Union, List, Dict
+
+# Import dependencies.
+import sys
+import os
+import hashlib
+import pickle
+
+# Add development library to path.
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+))
+
+# Import logging.
+from pytorch.logging import debug, info1, info2, focus, warning, error
+
+# Import dependencies.
+from doc.fetch import read
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Cache Objects >>
+# Parsed documents are cached on disk so that unchanged files need not to be
+# tokenized and parsed again.
+#
+# Each entry is keyed by the content of its source file and the version of
+# the document tool itself, thus any change of either of them will invalidate
+# the entry automatically.
+#
+# A long-running process can also keep entries resident in memory, so that
+# only changed files are parsed again without touching disk.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+class Cache(object):
+    r"""
+    On-disk cache of parsed documents.
+    """
+    def __init__(
+        self: Cache, path: str, *args: object, settings: List[str],
+        **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - path
+            Path of cache directory.
+        - *args
+        - settings
+            Settings changing parsed documents.
+        - **kargs
+
+        Returns
+        -------
+
+        Settings are folded into version, thus a document parsed by weaker
+        settings is never loaded by a stricter run.
+        """
+        # Save necessary attributes.
+        self.PATH = path
+        self.VERSION = version(settings)
+
+        # Cache directory should exist.
+        if (os.path.isdir(self.PATH)):
+            pass
+        else:
+            os.makedirs(self.PATH)
+
+    def key(self: Cache, path: str, *args: object, **kargs: object) -> str:
+        r"""
+        Get key of a source file.
+
+        Args
+        ----
+        - self
+        - path
+            Path of source file.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - key
+            Key of the source file.
+
+        Key is a hash of tool version, file path and file content.
+        """
+        # Hash content with version and path.
+        content = read(path)
+        return fingerprint([self.VERSION.encode(), path.encode(), content])
+
+    def entry(self: Cache, name: str, *args: object, **kargs: object) -> str:
+        r"""
+        Get entry path of a name.
+
+        Args
+        ----
+        - self
+        - name
+            Name of caching object.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - path
+            Path of entry file.
+
+        """
+        # Entry file is named by hash of the name.
+        return os.path.join(
+            self.PATH, "{:s}.pkl".format(fingerprint([name.encode()])),
+        )
+
+    def load(
+        self: Cache, name: str, key: str, *args: object, **kargs: object,
+    ) -> Any:
+        r"""
+        Load cached object.
+
+        Args
+        ----
+        - self
+        - name
+            Name of caching object.
+        - key
+            Required key of caching object.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - obj
+            Cached object.
+            If it is None, the object is not cached or its key is outdated.
+
+        """
+        # Missing entry is not cached.
+        path = self.entry(name)
+        if (os.path.isfile(path)):
+            pass
+        else:
+            return None
+
+        # Broken entry is treated as not cached.
+        file = open(path, "rb")
+        try:
+            cached, obj = pickle.load(file)
+        except:
+            cached, obj = "", None
+        file.close()
+
+        # Outdated entry is treated as not cached.
+        if (cached == key):
+            return obj
+        else:
+            return None
+
+    def save(
+        self: Cache, name: str, key: str, obj: Any, *args: object,
+        **kargs: object,
+    ) -> None:
+        r"""
+        Save caching object.
+
+        Args
+        ----
+        - self
+        - name
+            Name of caching object.
+        - key
+            Key of caching object.
+        - obj
+            Caching object.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Write to temporary file first, and then replace the old entry, so
+        # that concurrent writers never leave a broken entry.
+        path = self.entry(name)
+        temp = "{:s}.{:d}".format(path, os.getpid())
+        file = open(temp, "wb")
+        pickle.dump((key, obj), file, protocol=pickle.HIGHEST_PROTOCOL)
+        file.close()
+        os.replace(temp, path)
+
+
+def fingerprint(blobs: List[bytes], *args: object, **kargs: object) -> str:
+    r"""
+    Get fingerprint of a list of bytes.
+
+    Args
+    ----
+    - blobs
+        A list of bytes.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - digest
+        Hexadecimal digest.
+
+    """
+    # Hash every bytes with its length so that concatenation is unique.
+    hasher = hashlib.sha256()
+    for itr in blobs:
+        hasher.update("{:d}:".format(len(itr)).encode())
+        hasher.update(itr)
+    return hasher.hexdigest()
+
+
+def version(settings: List[str], *args: object, **kargs: object) -> str:
+    r"""
+    Get version of document tool.
+
+    Args
+    ----
+    - settings
+        Settings changing parsed documents.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - digest
+        Hexadecimal digest of all source files of document tool and given
+        settings.
+
+    """
+    # Hash all python files of document tool in a fixed order.
+    root = os.path.dirname(os.path.abspath(__file__))
+    blobs = []
+    for itr in sorted(os.listdir(root)):
+        if (os.path.splitext(itr)[1] == ".py"):
+            file = open(os.path.join(root, itr), "rb")
+            blobs.append(itr.encode())
+            blobs.append(file.read())
+            file.close()
+        else:
+            pass
+    blobs.extend(itr.encode() for itr in settings)
+    return fingerprint(blobs)
+
+
+class Resident(Cache):
+    r"""
+    In-memory cache of parsed documents.
+    """
+    def __init__(
+        self: Resident, path: str, *args: object, settings: List[str],
+        **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - path
+            Path of cache directory.
+            It is only a label since nothing is written to disk.
+        - *args
+        - settings
+            Settings changing parsed documents.
+        - **kargs
+
+        Returns
+        -------
+
+        Settings are folded into version, thus a document parsed by weaker
+        settings is never loaded by a stricter run.
+
+        It keeps documents resident in a long-running process.
+        """
+        # Save necessary attributes.
+        self.PATH = path
+        self.VERSION = version(settings)
+
+        # Map names to keys and objects, and map source files to their
+        # modification times, sizes and keys.
+        self.entries: Dict[str, MultiReturn[str, Any]] = {}
+        self.stamps: Dict[str, MultiReturn[int, int, str]] = {}
+
+    def key(self: Resident, path: str, *args: object, **kargs: object) -> str:
+        r"""
+        Get key of a source file.
+
+        Args
+        ----
+        - self
+        - path
+            Path of source file.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - key
+            Key of the source file.
+
+        Key is a hash of tool version, file path and file content.
+
+        Content is hashed again only if modification time or size changes.
+        """
+        # Reuse key of unchanged file.
+        status = os.stat(path)
+        mtime, size, key = self.stamps.get(path, (-1, -1, ""))
+        if (mtime == status.st_mtime_ns and size == status.st_size):
+            return key
+        else:
+            key = Cache.key(self, path)
+            self.stamps[path] = (status.st_mtime_ns, status.st_size, key)
+            return key
+
+    def load(
+        self: Resident, name: str, key: str, *args: object, **kargs: object,
+    ) -> Any:
+        r"""
+        Load cached object.
+
+        Args
+        ----
+        - self
+        - name
+            Name of caching object.
+        - key
+            Required key of caching object.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - obj
+            Cached object.
+            If it is None, the object is not cached or its key is outdated.
+
+        """
+        # Outdated entry is treated as not cached.
+        cached, obj = self.entries.get(name, ("", None))
+        if (cached == key):
+            return obj
+        else:
+            return None
+
+    def save(
+        self: Resident, name: str, key: str, obj: Any, *args: object,
+        **kargs: object,
+    ) -> None:
+        r"""
+        Save caching object.
+
+        Args
+        ----
+        - self
+        - name
+            Name of caching object.
+        - key
+            Key of caching object.
+        - obj
+            Caching object.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        Object itself rather than its copy is saved.
+        """
+        # Replace directly.
+        self.entries[name] = (key, obj)
\ No newline at end of file
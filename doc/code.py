@@ -4,26 +4,28 @@ from __future__ import annotations
 # Import typing.
 from typing import Any
 from typing import Tuple as MultiReturn
-from typing import Union, List
+from typing import Union, List, Iterator, Dict, Tuple, Callable
 
 # Import dependencies.
 import sys
 import os
+import io
 import tokenize
 import token
 import re
+import string
 
 # Add development library to path.
-if (os.path.basename(os.getcwd()) == "MLRepo"):
-    sys.path.append(os.path.join("."))
-else:
-    print("Code must strictly work in \"MLRepo\".")
-    exit()
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+))
 
 # Import logging.
 from pytorch.logging import debug, info1, info2, focus, warning, error
 
 # Import dependencies.
+from doc.diagnose import report
+from doc.fetch import read
 
 
 # =============================================================================
@@ -45,6 +47,9 @@ class Word(object):
     r"""
     Token word.
     """
+    # Define compact attributes since there are a huge number of words.
+    __slots__ = ("token", "text", "row", "column")
+
     def set(
         self: Word, *args: object,
         val: int, text: str, row: int, column: int, **kargs: object,
@@ -72,7 +77,6 @@ class Word(object):
         """
         # Save necessary attributes.
         self.token = val
-        self.token_string = token.tok_name[self.token]
         self.text = text
         self.row = row
         self.column = column
@@ -127,6 +131,9 @@ class Line(object):
     r"""
     Line of tokens.
     """
+    # Define compact attributes since there are a huge number of lines.
+    __slots__ = ("level", "implicit", "text", "path", "row", "memory", "scan")
+
     def set(
         self: Line, *args: object, level: int, text: str, path: str, row: int,
         **kargs: object,
@@ -254,10 +261,9 @@ class Line(object):
         """
         # Check indent level.
         if (self.level != level):
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " wrong indent level.",
-                self.path, "line {:d}".format(self.row),
+            report(
+                self.path, row=self.row, column=-1, rule="indent-level",
+                message="wrong indent level",
             )
             raise RuntimeError
         else:
@@ -268,19 +274,21 @@ class Line(object):
         if (obj.check(target)):
             pass
         elif (isinstance(target, int)):
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " expect {:s}, but get {:s}.",
-                self.path, obj.position(),
-                token.tok_name[target], obj.token_string,
+            report(
+                self.path, row=obj.row, column=obj.column,
+                rule="unexpected-token",
+                message="expect {:s}, but get {:s}".format(
+                    token.tok_name[target], token.tok_name[obj.token],
+                ),
             )
             raise RuntimeError
         else:
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " expect \"{:s}\", but get \"{:s}\".",
-                self.path, obj.position(),
-                repr(target)[1:-1], repr(obj.text)[1:-1],
+            report(
+                self.path, row=obj.row, column=obj.column,
+                rule="unexpected-token",
+                message="expect \"{:s}\", but get \"{:s}\"".format(
+                    repr(target)[1:-1], repr(obj.text)[1:-1],
+                ),
             )
             raise RuntimeError
 
@@ -344,12 +352,187 @@ class Line(object):
         # Get directly.
         return self.scan == len(self.memory)
 
+    def expect_type(
+        self: Line, val: int, level: int, *args: object, **kargs: object,
+    ) -> bool:
+        r"""
+        Check token integer of scanning word.
+
+        Args
+        ----
+        - self
+        - val
+            Token integer.
+        - level
+            Required indent level.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - flag
+            If True, the token integer is satisfied by scanning word.
+
+        It is a fast version of check function on token integer.
+        Arguments are given by order without type dispatching.
+        """
+        # Check indent level and scanning word inline.
+        return self.level == level and self.memory[self.scan].token == val
+
+    def expect_text(
+        self: Line, text: str, level: int, *args: object, **kargs: object,
+    ) -> bool:
+        r"""
+        Check text content of scanning word.
+
+        Args
+        ----
+        - self
+        - text
+            Token text content.
+        - level
+            Required indent level.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - flag
+            If True, the text content is satisfied by scanning word.
+
+        It is a fast version of check function on token text content.
+        Arguments are given by order without type dispatching.
+        """
+        # Check indent level and scanning word inline.
+        return self.level == level and self.memory[self.scan].text == text
+
+    def take_type(
+        self: Line, val: int, level: int, *args: object, **kargs: object,
+    ) -> str:
+        r"""
+        Match token integer of scanning word, and move to next word.
+
+        Args
+        ----
+        - self
+        - val
+            Token integer.
+        - level
+            Required indent level.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - text
+            Text content of matched word.
+
+        It is a fast version of match function on token integer.
+        Failure falls back to match function for the same report.
+        """
+        # Match and move to next non-trivial pointer inline.
+        word = self.memory[self.scan]
+        if (self.level == level and word.token == val):
+            self.scan += 1
+            while (
+                self.scan < len(self.memory) and
+                self.memory[self.scan].token == token.INDENT
+            ):
+                self.scan += 1
+            return word.text
+        else:
+            self.match(val, level=level)
+            raise RuntimeError
+
+    def take_text(
+        self: Line, text: str, level: int, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Match text content of scanning word, and move to next word.
+
+        Args
+        ----
+        - self
+        - text
+            Token text content.
+        - level
+            Required indent level.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        It is a fast version of match function on token text content.
+        Failure falls back to match function for the same report.
+        """
+        # Match and move to next non-trivial pointer inline.
+        if (self.level == level and self.memory[self.scan].text == text):
+            self.scan += 1
+            while (
+                self.scan < len(self.memory) and
+                self.memory[self.scan].token == token.INDENT
+            ):
+                self.scan += 1
+        else:
+            self.match(text, level=level)
+            raise RuntimeError
+
 
 # Define essential constants.
 UNIT = 4
 MAX = 79
 
 
+# Recoverability verification levels, current level and sampling stride.
+RECOVERS = ("full", "sample", "fast")
+RECOVER = "full"
+STRIDE = 16
+
+
+def update_recover(*args: object, val: str, **kargs: object) -> None:
+    r"""
+    Update recoverability verification level.
+
+    Args
+    ----
+    - *args
+    - val
+        Verification level.
+    - **kargs
+
+    Returns
+    -------
+
+    Full level compares every statement with its raw code by strings.
+    Fast level only compares token offsets with raw code line by line.
+    Sample level compares every line by offsets, and some statements by
+    strings.
+    """
+    # Replace directly.
+    global RECOVER
+    RECOVER = val
+
+
+def recovering(*args: object, **kargs: object) -> str:
+    r"""
+    Get recoverability verification level.
+
+    Args
+    ----
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - level
+        Verification level.
+
+    """
+    # Get directly.
+    return RECOVER
+
+
 # Define single word regex.
 NUMBER = r"[1-9][0-9]*"
 INITIAL = r"([A-Z][A-Za-z]*|{:s})".format(NUMBER)
@@ -373,6 +556,10 @@ LATER = r"({:s}|{:s}|{:s}|{:s})".format(INSIDE, MATH, CODE, STRING)
 BREAK = r"( |, )"
 
 
+# Define non-zero digits for linear-time sentence scanner.
+NONZEROS = string.digits[1:]
+
+
 # Define sentence regex.
 PARANTHESE = r"\({:s}({:s}{:s})*\)".format(LATER, BREAK, LATER)
 SENTENCE = r"^{:s}({:s}{:s}({:s}{:s})?)*.$".format(
@@ -402,7 +589,7 @@ class Code(object):
         pass
 
     def load_file(
-        self: Code, path: str, *args: object, **kargs: object,
+        self: Code, path: str, *args: object, root: str, **kargs: object,
     ) -> None:
         r"""
         Load code tokens from given file.
@@ -411,8 +598,10 @@ class Code(object):
         ----
         - self
         - path
-            File path.
+            File path relative to root directory.
         - *args
+        - root
+            Root directory.
         - **kargs
 
         Returns
@@ -421,20 +610,42 @@ class Code(object):
         """
         # Save loaded path.
         self.path = path
+        self.root = root
+
+        # Read file content only once.
+        self.load_buffer()
 
         # Load file text lines.
         self.load_texts()
         self.rule_texts()
 
-        # Load file tokens.
-        self.load_tokens()
-
-        # Review text lines and file tokens as lines of tokens.
+        # Review text lines and streaming file tokens as lines of tokens.
         self.review()
 
+    def load_buffer(self: Code, *args: object, **kargs: object) -> None:
+        r"""
+        Load raw lines from given file.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        The buffer is shared by text lines and tokens, thus the file is only
+        read once.
+        It will be released after tokens are reviewed.
+        """
+        # Read all raw lines at once, and content may be prefetched.
+        content = read(os.path.join(self.root, self.path))
+        self.buffer = io.TextIOWrapper(io.BytesIO(content)).readlines()
+
     def load_texts(self: Code, *args: object, **kargs: object) -> None:
         r"""
-        Load text lines from given file.
+        Load text lines from loaded buffer.
 
         Args
         ----
@@ -448,15 +659,14 @@ class Code(object):
         """
         # Read text lines along with indent level.
         self.texts = []
-        file = open(self.path, "r")
         eof = False
-        for i, line in enumerate(file):
+        weird = False
+        for i, line in enumerate(self.buffer):
             # Should not read in anything after EOF.
             if (eof):
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " read after EOF (line w.o. tail \"\\n\").",
-                    self.path, "line {:d}".format(i + 1),
+                report(
+                    self.path, row=i + 1, column=-1, rule="read-after-eof",
+                    message="read after EOF (line w.o. tail \"\\n\")",
                 )
                 raise RuntimeError
             else:
@@ -470,12 +680,10 @@ class Code(object):
             elif (len(rclean) + 1 == len(line) and line[-1] == "\n"):
                 pass
             else:
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " find tail spaces.",
-                    self.path, "line {:d}".format(i + 1),
+                report(
+                    self.path, row=i + 1, column=len(rclean),
+                    rule="tail-space", message="find tail spaces",
                 )
-                raise RuntimeError
 
             # Numer of spaces must fit the unit.
             lclean = rclean.lstrip()
@@ -483,23 +691,30 @@ class Code(object):
             if (num_spaces % UNIT == 0):
                 level = num_spaces // UNIT
             else:
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " weird indent.",
-                    self.path, "line {:d}".format(i + 1),
+                report(
+                    self.path, row=i + 1, column=num_spaces,
+                    rule="weird-indent", message="weird indent",
                 )
-                raise RuntimeError
+                level = num_spaces // UNIT
+                weird = True
 
             # Blank line is special.
             if (len(lclean) == 0):
                 self.texts.append((-1, rclean))
             else:
                 self.texts.append((level, rclean))
-        file.close()
 
-    def load_tokens(self: Code, *args: object, **kargs: object) -> None:
+        # Weird indent can not be parsed, but all of them are reported.
+        if (weird):
+            raise RuntimeError
+        else:
+            pass
+
+    def load_tokens(
+        self: Code, *args: object, **kargs: object,
+    ) -> Iterator[tokenize.TokenInfo]:
         r"""
-        Load tokens from given file.
+        Load tokens from loaded buffer.
 
         Args
         ----
@@ -509,19 +724,19 @@ class Code(object):
 
         Returns
         -------
+        - tokens
+            Streaming tokens.
 
+        Tokens are generated on demand, thus they are never held together in
+        memory.
         """
-        # Load tokens except indent or dedent.
-        self.tokens = []
-        file = open(self.path, "r")
-        buf = tokenize.generate_tokens(file.readline)
-        for itr in buf:
+        # Yield tokens except indent or dedent.
+        for itr in tokenize.generate_tokens(iter(self.buffer).__next__):
             if (itr[0] in (token.INDENT, token.DEDENT)):
                 # Indent token is modified for other usage.
                 pass
             else:
-                self.tokens.append(itr)
-        file.close()
+                yield itr
 
     def rule_texts(self: Code, *args: object, **kargs: object) -> None:
         r"""
@@ -537,11 +752,17 @@ class Code(object):
         -------
 
         """
-        # Check each text lines.
-        for i, (_, text) in enumerate(self.texts):
-            line_rule_length(text=text, index=i + 1, path=self.path)
-            line_rule_char(text=text, index=i + 1, path=self.path)
-            line_rule_break(text=text, index=i + 1, path=self.path)
+        # Every rule checks all text lines at once.
+        texts = [text for _, text in self.texts]
+        violations = []
+        for name, rule in LINE_RULES.items():
+            for row, column, msg in rule(texts, path=self.path):
+                violations.append((row, column, name, msg))
+
+        # Report all violations in line order.
+        violations.sort(key=lambda x: (x[0], x[1]))
+        for row, column, name, msg in violations:
+            report(self.path, row=row, column=column, rule=name, message=msg)
 
     def review(self: Code, *args: object, **kargs: object) -> None:
         r"""
@@ -567,14 +788,15 @@ class Code(object):
             self.ptrs.append(0)
         del self.texts
 
-        # Traverse tokens and put to corresponding lines.
-        scan = 0
-        while (scan < len(self.tokens) - 1):
-            # Get the starting token.
-            val, text, head, tail, _ = self.tokens[scan]
+        # Traverse streaming tokens and put to corresponding lines.
+        for val, text, head, tail, _ in self.load_tokens():
+            # The ending token is not a part of code.
+            if (val == token.ENDMARKER):
+                break
+            else:
+                pass
             head_row, head_col = head
             tail_row, tail_col = tail
-            scan += 1
 
             # Get the space ahead.
             self.clear_space_until(head_row, head_col)
@@ -591,14 +813,13 @@ class Code(object):
                 # Update single-line token.
                 self.clear_common(word)
             else:
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " only string allows multiple-line code.",
-                    self.path,
-                    "line {:d}, column: {:d}".format(head_row, head_col),
+                report(
+                    self.path, row=head_row, column=head_col,
+                    rule="multiple-line-token",
+                    message="only string allows multiple-line code",
                 )
                 raise RuntimeError
-        del self.tokens
+        del self.buffer
         del self.ptrs
 
         # Ensure that multiple-line string only involves in definition.
@@ -609,12 +830,12 @@ class Code(object):
                 ):
                     pass
                 else:
-                    error(
-                        "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                        " Only end of statement can be multiple-line string.",
-                        self.path, "line {:d}".format(itr.row),
+                    report(
+                        self.path, row=itr.row, column=-1,
+                        rule="multiple-line-string",
+                        message="only end of statement can be multiple-line" \
+                        " string",
                     )
-                    raise RuntimeError
             else:
                 pass
 
@@ -657,14 +878,16 @@ class Code(object):
             # Spaces of line indent should be ignored.
             pass
         elif (length != 1):
-            # Space break can at most have 1 space.
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " space break can at most have 1 space.",
-                self.path,
-                "line {:d}, column: {:d}".format(row + 1, ptr),
+            # Space break can at most have 1 space, but keep them to recover.
+            report(
+                self.path, row=row + 1, column=ptr, rule="space-break",
+                message="space break can at most have 1 space",
             )
-            raise RuntimeError
+            word = Word()
+            word.set(
+                val=token.INDENT, text=" " * length, row=row + 1, column=ptr,
+            )
+            buf.append(word)
         else:
             # Use None to represent single-space break token.
             word = Word()
@@ -763,8 +986,19 @@ class Code(object):
         -------
 
         """
+        # Compare offsets unless every statement is compared by strings.
+        if (RECOVER == "full"):
+            stride = 1
+        elif (RECOVER == "sample"):
+            self.recover_offsets()
+            stride = STRIDE
+        else:
+            self.recover_offsets()
+            return
+
         # Traverse the memory.
         ptr = 0
+        cnt = 0
         while (ptr < len(self.memory)):
             # Get tokens and raw codes.
             tokens = []
@@ -781,6 +1015,13 @@ class Code(object):
                 raws.append(obj.text)
                 ptr += 1
 
+            # Only sampled statements are compared.
+            cnt += 1
+            if ((cnt - 1) % stride == 0):
+                pass
+            else:
+                continue
+
             # Generate by tokens
             texts = [" " * level * UNIT]
             for word in tokens:
@@ -796,18 +1037,75 @@ class Code(object):
             else:
                 pass
 
-            # Ensure matching.
+            # Ensure matching, and only report the first mismatch.
             for i in range(max(len(raws), len(generates))):
-                if (raws[i] != generates[i]):
-                    error(
-                        "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                        " fail to recover code.",
-                        self.path, "line {:d}".format(position + i),
+                if (
+                    i >= len(raws) or i >= len(generates) or
+                    raws[i] != generates[i]
+                ):
+                    report(
+                        self.path, row=position + min(i, len(raws) - 1),
+                        column=-1, rule="unrecoverable",
+                        message="fail to recover code",
                     )
-                    raise RuntimeError
+                    break
                 else:
                     pass
 
+    def recover_offsets(self: Code, *args: object, **kargs: object) -> None:
+        r"""
+        Ensure token offsets to cover raw code.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        Tokens of a line are contiguous by scanning, thus only the first token
+        should start from indent and the last token should end at line end.
+        Token contents are trusted without building any string.
+        """
+        # Traverse the memory line by line.
+        for obj in self.memory:
+            # Lines inside multiple-line string may have no token.
+            words = obj.memory
+            if (len(words) == 0):
+                if (obj.implicit):
+                    continue
+                else:
+                    report(
+                        self.path, row=obj.row, column=-1,
+                        rule="unrecoverable", message="fail to recover code",
+                    )
+                    continue
+            else:
+                pass
+
+            # Get the first token start and the last token end.
+            head = words[0].column
+            word = words[-1]
+            tail = word.text.find("\n")
+            if (tail < 0):
+                tail = word.column + len(word.text)
+            else:
+                tail = word.column + tail
+
+            # Ensure covering, and indent of string tail is not checked.
+            if (
+                not obj.implicit and head != max(obj.level, 0) * UNIT or
+                tail != len(obj.text)
+            ):
+                report(
+                    self.path, row=obj.row, column=-1, rule="unrecoverable",
+                    message="fail to recover code",
+                )
+            else:
+                pass
+
     def reset(self: Code, *args: object, **kargs: object) -> None:
         r"""
         Reset scanning status.
@@ -861,6 +1159,28 @@ class Code(object):
         # Move directly.
         self.scan += 1
 
+    def next_line(self: Code, *args: object, **kargs: object) -> Line:
+        r"""
+        Move pointer to next line, and get it scanning from the start.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - line
+            Scanning line.
+
+        """
+        # Move and reset directly.
+        self.scan += 1
+        line = self.memory[self.scan]
+        line.scan = 0
+        return line
+
     def eof(self: Code, *args: object, **kargs: object) -> bool:
         r"""
         Get EOF signal.
@@ -942,113 +1262,147 @@ class Code(object):
                 else:
                     self.next()
         else:
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " expect {:d} blank lines.",
-                self.path, "line {:d}".format(self.get().row), num,
+            # Skip existing blank lines to continue.
+            report(
+                self.path, row=self.get().row, column=-1, rule="blank-lines",
+                message="expect {:d} blank lines".format(num),
             )
-            raise RuntimeError
+            while (not self.eof() and self.blank_top(1)):
+                self.next()
 
 
 def line_rule_length(
-    text: str, *args: object, index: int, path: str, **kargs: object,
-) -> None:
+    texts: List[str], *args: object, path: str, **kargs: object,
+) -> List[Tuple[int, int, str]]:
     r"""
-    Check length rule over a text line.
+    Check length rule over text lines.
 
     Args
     ----
-    - text
-        Line content.
+    - texts
+        All line contents of a file.
     - *args
-    - index
-        Line index.
     - path
         File path.
     - **kargs
 
     Returns
     -------
+    - violations
+        A list of violation rows, columns and messages.
 
     """
-    # Text length is limited.
-    if (len(text) > MAX):
-        error(
-            "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-            " too long (>{:d}).",
-            path, "line {:d}".format(index),
-            MAX,
-        )
-        raise RuntimeError
-    else:
+    # Text length is limited, and all lengths are computed at once.
+    lengths = list(map(len, texts))
+    if (max(lengths, default=0) > MAX):
         pass
+    else:
+        return []
+    return [
+        (i + 1, MAX, "too long (>{:d})".format(MAX))
+        for i, length in enumerate(lengths) if length > MAX
+    ]
 
 
 def line_rule_char(
-    text: str, *args: object, index: int, path: str, **kargs: object,
-) -> None:
+    texts: List[str], *args: object, path: str, **kargs: object,
+) -> List[Tuple[int, int, str]]:
     r"""
-    Check character rule over a text line.
+    Check character rule over text lines.
 
     Args
     ----
-    - text
-        Line content.
+    - texts
+        All line contents of a file.
     - *args
-    - index
-        Line index.
     - path
         File path.
     - **kargs
 
     Returns
     -------
+    - violations
+        A list of violation rows, columns and messages.
 
     """
-    # Some charaters are rejected.
-    if (chr(39) in text):
-        error(
-            "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-            " invalid char \"{:s}\".",
-            path, "line {:d}".format(index),
-            chr(39),
-        )
-        raise RuntimeError
-    else:
+    # Some charaters are rejected, and most files have none of them.
+    if (chr(39) in "\n".join(texts)):
         pass
+    else:
+        return []
+    return [
+        (i + 1, text.index(chr(39)), "invalid char \"{:s}\"".format(chr(39)))
+        for i, text in enumerate(texts) if chr(39) in text
+    ]
 
 
 def line_rule_break(
-    text: str, *args: object, index: int, path: str, **kargs: object,
-) -> None:
+    texts: List[str], *args: object, path: str, **kargs: object,
+) -> List[Tuple[int, int, str]]:
     r"""
-    Check line break rule over a text line.
+    Check line break rule over text lines.
 
     Args
     ----
-    - text
-        Line content.
+    - texts
+        All line contents of a file.
     - *args
-    - index
-        Line index.
     - path
         File path.
     - **kargs
 
     Returns
     -------
+    - violations
+        A list of violation rows, columns and messages.
 
     """
     # Line break is rejected except for strings.
-    if (text[-2:] == " \\" and text[-3] != "\""):
+    return [
+        (i + 1, len(text) - 1, "line break is disabled")
+        for i, text in enumerate(texts)
+        if text[-2:] == " \\" and text[-3:-2] != "\""
+    ]
+
+
+def register_line_rule(
+    name: str, rule: Callable, *args: object, **kargs: object,
+) -> None:
+    r"""
+    Register a rule over text lines.
+
+    Args
+    ----
+    - name
+        Rule name.
+    - rule
+        Rule function.
+        It takes all line contents of a file and a keyword file path, and
+        returns a list of violation rows, columns and messages.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+
+    Extra rules can be registered by any module before files are loaded.
+    """
+    # Rule name should be unique.
+    if (name in LINE_RULES):
         error(
-            "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-            " line break is disabled.",
-            path, "line {:s}".format(index),
+            "Line rule \"{:s}\" has already been registered.",
+            name,
         )
         raise RuntimeError
     else:
-        pass
+        LINE_RULES[name] = rule
+
+
+# Register default rules over text lines.
+LINE_RULES: Dict[str, Callable] = {}
+register_line_rule("too-long", line_rule_length)
+register_line_rule("invalid-char", line_rule_char)
+register_line_rule("line-break", line_rule_break)
 
 
 def recover(
@@ -1080,7 +1434,7 @@ def recover(
 
 
 def paragraphize(
-    texts: List[str], *args: object, **kargs: object,
+    texts: List[str], *args: object, path: str, row: int, **kargs: object,
 ) -> List[List[str]]:
     r"""
     Transfer a list of texts into paragraphs.
@@ -1090,6 +1444,10 @@ def paragraphize(
     - texts
         Texts.
     - *args
+    - path
+        Path to the file of the texts.
+    - row
+        Row of the first text in the file.
     - **kargs
 
     Returns
@@ -1111,13 +1469,15 @@ def paragraphize(
     ptr = 0
     paragraphs = []
     while (ptr < len(buf)):
-        # Reject empty paragraph.
+        # Reject empty paragraph, and skip all blank lines to continue.
         if (len(buf[ptr]) == 0):
-            error(
-                "At comment line {:d}, empty paragraph is rejected.",
-                ptr + 1,
+            report(
+                path, row=row + ptr, column=-1, rule="empty-paragraph",
+                message="empty paragraph is rejected",
             )
-            raise RuntimeError
+            while (ptr < len(buf) and len(buf[ptr]) == 0):
+                ptr += 1
+            continue
         else:
             pass
 
@@ -1130,11 +1490,11 @@ def paragraphize(
 
         # Decode according to different flags.
         if (decoding[0] == "$$"):
-            paragraphs.extend(mathize(decoding, start=start + 1))
+            paragraphs.extend(mathize(decoding, path=path, row=row + start))
         elif (decoding[0][0:3] == "```"):
-            paragraphs.extend(codize(decoding, start=start + 1))
+            paragraphs.extend(codize(decoding, path=path, row=row + start))
         else:
-            paragraphs.extend(textize(decoding, start=start + 1))
+            paragraphs.extend(textize(decoding, path=path, row=row + start))
 
         # Go over the blank line to move to next.
         ptr += 1
@@ -1142,7 +1502,7 @@ def paragraphize(
 
 
 def mathize(
-    texts: List[str], *args: object, start: int, **kargs: object,
+    texts: List[str], *args: object, path: str, row: int, **kargs: object,
 ) -> List[List[str]]:
     r"""
     Transfer a list of texts into math block.
@@ -1152,8 +1512,10 @@ def mathize(
     - texts
         Texts.
     - *args
-    - start
-        Starting line in original text.
+    - path
+        Path to the file of the texts.
+    - row
+        Row of the first text in the file.
     - **kargs
 
     Returns
@@ -1164,12 +1526,11 @@ def mathize(
     """
     # Block must end properly.
     if (texts[-1] != "$$"):
-        error(
-            "At comment line {:d}, multiple-line math starts from" \
-            " line {:d} but ends nowhere.",
-            start + len(texts) - 1, start,
+        report(
+            path, row=row + len(texts) - 1, column=-1, rule="math-block",
+            message="multiple-line math starts from line {:d} but ends" \
+            " nowhere".format(row),
         )
-        raise RuntimeError
     else:
         pass
 
@@ -1178,7 +1539,7 @@ def mathize(
 
 
 def codize(
-    texts: List[str], *args: object, start: int, **kargs: object,
+    texts: List[str], *args: object, path: str, row: int, **kargs: object,
 ) -> List[List[str]]:
     r"""
     Transfer a list of texts into code block.
@@ -1188,8 +1549,10 @@ def codize(
     - texts
         Texts.
     - *args
-    - start
-        Starting line in original text.
+    - path
+        Path to the file of the texts.
+    - row
+        Row of the first text in the file.
     - **kargs
 
     Returns
@@ -1200,12 +1563,11 @@ def codize(
     """
     # Block must end properly.
     if (texts[-1] != "```"):
-        error(
-            "At comment line {:d}, multiple-line code starts from" \
-            " line {:d} but ends nowhere.",
-            start + len(texts) - 1, start,
+        report(
+            path, row=row + len(texts) - 1, column=-1, rule="code-block",
+            message="multiple-line code starts from line {:d} but ends" \
+            " nowhere".format(row),
         )
-        raise RuntimeError
     else:
         pass
 
@@ -1214,7 +1576,7 @@ def codize(
 
 
 def textize(
-    texts: List[str], *args: object, start: int, **kargs: object,
+    texts: List[str], *args: object, path: str, row: int, **kargs: object,
 ) -> List[List[str]]:
     r"""
     Transfer a list of texts into text block.
@@ -1224,8 +1586,10 @@ def textize(
     - texts
         Texts.
     - *args
-    - start
-        Starting line in original text.
+    - path
+        Path to the file of the texts.
+    - row
+        Row of the first text in the file.
     - **kargs
 
     Returns
@@ -1247,19 +1611,254 @@ def textize(
             buf.clear()
 
             # Check sentence regex.
-            if (re.match(SENTENCE, sentence) is None):
-                error(
-                    "At comment line {:d}, wrong senetence regex.\n" \
-                    "\"\"\"\n{:s}\n\"\"\".",
-                    start + i, sentence,
-                )
-                raise RuntimeError
-            else:
+            column = scan_sentence(sentence)
+            if (column < 0):
                 pass
+            else:
+                report(
+                    path, row=row + i, column=-1, rule="sentence-regex",
+                    message="wrong senetence regex at column {:d}.\n" \
+                    "\"\"\"\n{:s}\n\"\"\"".format(column, sentence),
+                )
 
             # Append sentence to the block.
             block.append(sentence)
         else:
             # A sentence is not ending, continue.
             pass
-    return [block]
\ No newline at end of file
+    return [block]
+
+
+def scan_sentence(text: str, *args: object, **kargs: object) -> int:
+    r"""
+    Scan a sentence for its first offending character.
+
+    Args
+    ----
+    - text
+        Sentence text.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - column
+        Column of the first offending character.
+        If it is negative, the sentence is valid.
+
+    It accepts exactly the same language as `SENTENCE` regex, but it visits
+    each character at most once without backtracking.
+    """
+    # The last character can be anything except a new line, and regex allows
+    # a tail new line after it.
+    if (len(text) > 0 and text[-1] == "\n"):
+        end = len(text) - 2
+    else:
+        end = len(text) - 1
+    if (end < 0 or text[end] == "\n"):
+        return max(end, 0)
+    else:
+        pass
+
+    # The first word is followed by breaks and later words, and a paranthese
+    # can only follow a later word.
+    flag, ptr = scan_word(text, 0, limit=end, initial=True)
+    paranthese = False
+    while (flag and ptr < end):
+        flag, ptr = scan_break(text, ptr, limit=end)
+        if (not flag):
+            break
+        elif (paranthese and ptr < end and text[ptr] == "("):
+            flag, ptr = scan_paranthese(text, ptr, limit=end)
+            paranthese = False
+        else:
+            flag, ptr = scan_word(text, ptr, limit=end, initial=False)
+            paranthese = True
+    return -1 if flag else ptr
+
+
+def scan_word(
+    text: str, ptr: int, *args: object, limit: int, initial: bool,
+    **kargs: object,
+) -> MultiReturn[bool, int]:
+    r"""
+    Scan a sentence word.
+
+    Args
+    ----
+    - text
+        Sentence text.
+    - ptr
+        Starting column.
+    - *args
+    - limit
+        Ending column (exclusive).
+    - initial
+        If True, the word should be the first word of a sentence.
+    - **kargs
+
+    Returns
+    -------
+    - flag
+        If True, a word is scanned.
+    - ptr
+        Column after the scanned word, or the offending column.
+
+    """
+    # Math, code and string are special words.
+    if (ptr < limit and text[ptr] in ("$", "`", "\"")):
+        return scan_quote(text, ptr, limit=limit)
+    else:
+        pass
+
+    # Word is a list of components concatenated by "-".
+    first = True
+    while (True):
+        # Component is a number or a list of letters.
+        if (ptr == limit):
+            return False, ptr
+        elif (text[ptr] in NONZEROS):
+            ptr += 1
+            while (ptr < limit and text[ptr] in string.digits):
+                ptr += 1
+        elif (
+            text[ptr] in string.ascii_uppercase or
+            (text[ptr] in string.ascii_lowercase and not (initial and first))
+        ):
+            ptr += 1
+            while (ptr < limit and text[ptr] in string.ascii_letters):
+                ptr += 1
+        else:
+            return False, ptr
+        first = False
+
+        # Stop if there is no more concatenation.
+        if (ptr < limit and text[ptr] == "-"):
+            ptr += 1
+        else:
+            return True, ptr
+
+
+def scan_quote(
+    text: str, ptr: int, *args: object, limit: int, **kargs: object,
+) -> MultiReturn[bool, int]:
+    r"""
+    Scan a sentence quoted word.
+
+    Args
+    ----
+    - text
+        Sentence text.
+    - ptr
+        Starting column.
+    - *args
+    - limit
+        Ending column (exclusive).
+    - **kargs
+
+    Returns
+    -------
+    - flag
+        If True, a quoted word is scanned.
+    - ptr
+        Column after the scanned word, or the offending column.
+
+    Quoted content can not be empty, and it can escape any character except
+    a new line.
+    """
+    # Scan until the first unescaped quotation mark.
+    mark = text[ptr]
+    ptr += 1
+    start = ptr
+    while (ptr < limit):
+        if (text[ptr] == "\n"):
+            return False, ptr
+        elif (text[ptr] == "\\"):
+            if (ptr + 1 < limit and text[ptr + 1] != "\n"):
+                ptr += 2
+            else:
+                return False, ptr + 1
+        elif (text[ptr] == mark):
+            if (ptr == start):
+                return False, ptr
+            else:
+                return True, ptr + 1
+        else:
+            ptr += 1
+    return False, ptr
+
+
+def scan_break(
+    text: str, ptr: int, *args: object, limit: int, **kargs: object,
+) -> MultiReturn[bool, int]:
+    r"""
+    Scan a sentence break.
+
+    Args
+    ----
+    - text
+        Sentence text.
+    - ptr
+        Starting column.
+    - *args
+    - limit
+        Ending column (exclusive).
+    - **kargs
+
+    Returns
+    -------
+    - flag
+        If True, a break is scanned.
+    - ptr
+        Column after the scanned break, or the offending column.
+
+    """
+    # Break is a single space with an optional leading comma.
+    if (ptr < limit and text[ptr] == ","):
+        ptr += 1
+    else:
+        pass
+    if (ptr < limit and text[ptr] == " "):
+        return True, ptr + 1
+    else:
+        return False, ptr
+
+
+def scan_paranthese(
+    text: str, ptr: int, *args: object, limit: int, **kargs: object,
+) -> MultiReturn[bool, int]:
+    r"""
+    Scan a sentence paranthese.
+
+    Args
+    ----
+    - text
+        Sentence text.
+    - ptr
+        Starting column.
+    - *args
+    - limit
+        Ending column (exclusive).
+    - **kargs
+
+    Returns
+    -------
+    - flag
+        If True, a paranthese is scanned.
+    - ptr
+        Column after the scanned paranthese, or the offending column.
+
+    """
+    # Paranthese wraps later words with breaks.
+    ptr += 1
+    flag, ptr = scan_word(text, ptr, limit=limit, initial=False)
+    while (flag):
+        if (ptr < limit and text[ptr] == ")"):
+            return True, ptr + 1
+        else:
+            flag, ptr = scan_break(text, ptr, limit=limit)
+        if (flag):
+            flag, ptr = scan_word(text, ptr, limit=limit, initial=False)
+        else:
+            pass
+    return False, ptr
\ No newline at end of file
@@ -0,0 +1,177 @@
+# Import future.
+from __future__ import annotations
+
+# Import typing.
+from typing import Any
+from typing import Tuple as MultiReturn
+from typing import List
+
+# Import dependencies.
+import sys
+import os
+
+# Add development library to path.
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+))
+
+# Import logging.
+from pytorch.logging import debug, info1, info2, focus, warning, error
+
+# Import dependencies.
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Configuration Objects >>
+# Configuration of a repository to documentize.
+#
+# Documents get root path, Github URL and project name from configuration
+# rather than current working directory, thus the same process can
+# documentize several repositories.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+class Config(object):
+    r"""
+    Configuration of a repository.
+    """
+    def __init__(
+        self: Config, root: str, *args: object, github: str, project: str,
+        standalone: List[str], **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - root
+            Root directory of the repository.
+        - *args
+        - github
+            Github URL of the repository.
+        - project
+            Project name.
+            It is also the directory name required by development library
+            path adding of older versions.
+        - standalone
+            Modules requiring only standard library.
+            They have neither development library path adding nor logging
+            import, thus they can run without the repository.
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Save necessary attributes.
+        self.ROOT = os.path.abspath(root)
+        self.GITHUB = github
+        self.PROJECT = project
+        self.STANDALONE = standalone
+
+    def adding(
+        self: Config, path: str, *args: object, **kargs: object,
+    ) -> List[str]:
+        r"""
+        Get code texts adding development library to path.
+
+        Args
+        ----
+        - self
+        - path
+            Path of the file relative to root directory.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - texts
+            Accepted code texts.
+            The first one is preferred.
+
+        Preferred code text resolves root directory from the file itself, thus
+        the file works in any working directory.
+        Older versions only add development library in project directory, and
+        they are still accepted.
+        """
+        # Walk up from directory of the file to root directory.
+        parents = []
+        directory = os.path.dirname(path)
+        while (len(directory) > 0):
+            parents.append("\"..\",")
+            directory = os.path.dirname(directory)
+        text = (
+            "# Add development library to path.\n" \
+            "sys.path.append(os.path.join(\n" \
+            "    os.path.dirname(os.path.abspath(__file__)),{:s}\n" \
+            "))"
+        ).format("".join(" " + itr for itr in parents))
+
+        # Older versions only work in project directory.
+        passing = (
+            "# Add development library to path.\n" \
+            "if (os.path.basename(os.getcwd()) == \"{:s}\"):\n" \
+            "    sys.path.append(os.path.join(\".\"))\n" \
+            "else:\n" \
+            "    pass"
+        ).format(self.PROJECT)
+        exiting = (
+            "# Add development library to path.\n" \
+            "if (os.path.basename(os.getcwd()) == \"{0:s}\"):\n" \
+            "    sys.path.append(os.path.join(\".\"))\n" \
+            "else:\n" \
+            "    print(\"Code must strictly work in \\\"{0:s}\\\".\")\n" \
+            "    exit()"
+        ).format(self.PROJECT)
+        return [text, passing, exiting]
+
+    def path(self: Config, path: str, *args: object, **kargs: object) -> str:
+        r"""
+        Get absolute path of a path relative to root directory.
+
+        Args
+        ----
+        - self
+        - path
+            Path relative to root directory.
+            If it is absolute, it is returned directly.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - path
+            Absolute path.
+
+        """
+        # Join with root directory.
+        return os.path.join(self.ROOT, path)
+
+
+def default(root: str, *args: object, **kargs: object) -> Config:
+    r"""
+    Get default configuration of MLRepo.
+
+    Args
+    ----
+    - root
+        Root directory of the repository.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - config
+        Configuration.
+
+    """
+    # Use Github of MLRepo, and server client is light.
+    return Config(
+        root, github="https://github.com/gao462/MLRepo", project="MLRepo",
+        standalone=["doc.server"],
+    )
\ No newline at end of file
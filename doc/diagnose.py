@@ -0,0 +1,522 @@
+# Import future.
+from __future__ import annotations
+
+# Import typing.
+from typing import Any
+from typing import Tuple as MultiReturn
+from typing import List, Dict, Union
+
+# Import dependencies.
+import sys
+import os
+import json
+
+# Add development library to path.
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+))
+
+# Import logging.
+from pytorch.logging import debug, info1, info2, focus, warning, error
+
+# Import dependencies.
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Diagnostic Objects >>
+# Every style violation is reported as a structured diagnostic with its file
+# path, position, rule name and message.
+#
+# By default, the first diagnostic stops the run immediately.
+# In collecting mode, diagnostics are recorded and the run continues wherever
+# recovery is possible, so that a single run reports all of them.
+#
+# Diagnostics can also be streamed into a machine-readable file as soon as
+# they are found, either as JSON lines or as a SARIF log.
+# Rule names are stable, thus they can be used as rule IDs of such files.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+class Diagnostic(object):
+    r"""
+    Structured diagnostic.
+    """
+    # Define compact attributes since they are sent between processes.
+    __slots__ = ("path", "row", "column", "rule", "message")
+
+    def __init__(
+        self: Diagnostic, *args: object,
+        path: str, row: int, column: int, rule: str, message: str,
+        **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - *args
+        - path
+            File path.
+        - row
+            Row of diagnostic.
+            If it is zero, the whole file is reported.
+        - column
+            Column of diagnostic.
+            If it is negative, the whole row is reported.
+        - rule
+            Rule name.
+        - message
+            Message.
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Save necessary attributes.
+        self.path = path
+        self.row = row
+        self.column = column
+        self.rule = rule
+        self.message = message
+
+    def position(self: Diagnostic, *args: object, **kargs: object) -> str:
+        r"""
+        Get position string.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - msg
+            Position string.
+
+        """
+        # Row and column are only given when they are known.
+        if (self.row == 0):
+            return "whole file"
+        elif (self.column < 0):
+            return "line {:d}".format(self.row)
+        else:
+            return "line {:d}, column: {:d}".format(self.row, self.column)
+
+    def serialize(
+        self: Diagnostic, *args: object, **kargs: object,
+    ) -> Dict[str, Union[str, int]]:
+        r"""
+        Serialize into a JSON object.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - obj
+            JSON object.
+
+        """
+        # Save all attributes.
+        return {
+            "path": self.path, "row": self.row, "column": self.column,
+            "rule": self.rule, "message": self.message,
+        }
+
+    def sarif(
+        self: Diagnostic, *args: object, **kargs: object,
+    ) -> Dict[str, Any]:
+        r"""
+        Serialize into a SARIF result object.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - obj
+            SARIF result object.
+
+        SARIF rows and columns start from 1, and unknown ones are omitted.
+        """
+        # Locate by rows and columns only when they are known.
+        region: Dict[str, int] = {}
+        if (self.row > 0):
+            region["startLine"] = self.row
+        else:
+            pass
+        if (self.row > 0 and self.column >= 0):
+            region["startColumn"] = self.column + 1
+        else:
+            pass
+        location: Dict[str, Any] = {"artifactLocation": {"uri": self.path}}
+        if (len(region) > 0):
+            location["region"] = region
+        else:
+            pass
+        return {
+            "ruleId": self.rule, "level": "error",
+            "message": {"text": self.message},
+            "locations": [{"physicalLocation": location}],
+        }
+
+
+# Schema of SARIF log.
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+class Stream(object):
+    r"""
+    Streaming output of diagnostics.
+    """
+    def __init__(
+        self: Stream, path: str, *args: object, form: str, **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - path
+            Path of output file.
+        - *args
+        - form
+            Output format.
+            It should be either "jsonl" or "sarif".
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Save necessary attributes.
+        self.PATH = path
+        self.FORM = form
+        self.PID = os.getpid()
+
+        # Open output and write the head.
+        self.file = open(self.PATH, "w")
+        self.empty = True
+        if (self.FORM == "sarif"):
+            self.file.write(
+                "{{\"$schema\": {:s}, \"version\": \"2.1.0\", \"runs\":" \
+                " [{{\"tool\": {:s}, \"results\": [".format(
+                    json.dumps(SARIF_SCHEMA),
+                    json.dumps({"driver": {"name": "MLRepo-doc"}}),
+                ),
+            )
+        else:
+            pass
+        self.file.flush()
+
+    def write(
+        self: Stream, obj: Diagnostic, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Write a diagnostic.
+
+        Args
+        ----
+        - self
+        - obj
+            Diagnostic.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        Only the process opening the output can write, and diagnostics of
+        worker processes should be written after they are sent back.
+        """
+        # Worker processes share the file but should never write.
+        if (os.getpid() == self.PID):
+            pass
+        else:
+            return
+
+        # Write and flush immediately for streaming.
+        if (self.FORM == "sarif"):
+            self.file.write(
+                "{:s}\n{:s}".format(
+                    "" if self.empty else ",", json.dumps(obj.sarif()),
+                ),
+            )
+        else:
+            self.file.write("{:s}\n".format(json.dumps(obj.serialize())))
+        self.empty = False
+        self.file.flush()
+
+    def close(self: Stream, *args: object, **kargs: object) -> None:
+        r"""
+        Close output.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Write the tail and close.
+        if (self.FORM == "sarif"):
+            self.file.write("\n]}]}\n")
+        else:
+            pass
+        self.file.close()
+
+
+# Collecting status, recorded diagnostics and streaming output.
+COLLECT = False
+DIAGNOSTICS: List[Diagnostic] = []
+STREAM: Union[Stream, None] = None
+
+
+def update_collect(*args: object, val: bool, **kargs: object) -> None:
+    r"""
+    Update collecting status.
+
+    Args
+    ----
+    - *args
+    - val
+        Collecting status.
+    - **kargs
+
+    Returns
+    -------
+
+    """
+    # Replace directly.
+    global COLLECT
+    COLLECT = val
+
+
+def update_stream(
+    *args: object, val: Union[Stream, None], **kargs: object,
+) -> None:
+    r"""
+    Update streaming output.
+
+    Args
+    ----
+    - *args
+    - val
+        Streaming output.
+        If it is None, diagnostics are only logged.
+    - **kargs
+
+    Returns
+    -------
+
+    """
+    # Replace directly.
+    global STREAM
+    STREAM = val
+
+
+def collecting(*args: object, **kargs: object) -> bool:
+    r"""
+    Get collecting status.
+
+    Args
+    ----
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - flag
+        Collecting status.
+
+    """
+    # Get directly.
+    return COLLECT
+
+
+def report(
+    path: str, *args: object, row: int, column: int, rule: str, message: str,
+    **kargs: object,
+) -> None:
+    r"""
+    Report a diagnostic.
+
+    Args
+    ----
+    - path
+        File path.
+    - *args
+    - row
+        Row of diagnostic.
+        If it is zero, the whole file is reported.
+    - column
+        Column of diagnostic.
+        If it is negative, the whole row is reported.
+    - rule
+        Rule name.
+    - message
+        Message.
+    - **kargs
+
+    Returns
+    -------
+
+    If it is not collecting, runtime error will be raised immediately.
+    Otherwise, caller should continue if it is recoverable, and raise runtime
+    error by itself if it is not.
+    """
+    # Log and record.
+    obj = Diagnostic(
+        path=path, row=row, column=column, rule=rule, message=message,
+    )
+    error(
+        "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m, {:s}.",
+        obj.path, obj.position(), obj.message,
+    )
+    DIAGNOSTICS.append(obj)
+    if (STREAM is None):
+        pass
+    else:
+        STREAM.write(obj)
+
+    # Stop immediately unless it is collecting.
+    if (COLLECT):
+        pass
+    else:
+        raise RuntimeError
+
+
+def count(*args: object, **kargs: object) -> int:
+    r"""
+    Get number of recorded diagnostics.
+
+    Args
+    ----
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - num
+        Number of recorded diagnostics.
+
+    """
+    # Get directly.
+    return len(DIAGNOSTICS)
+
+
+def since(*args: object, start: int, **kargs: object) -> List[Diagnostic]:
+    r"""
+    Get recorded diagnostics since given index.
+
+    Args
+    ----
+    - *args
+    - start
+        Index of the first getting diagnostic.
+    - **kargs
+
+    Returns
+    -------
+    - diagnostics
+        Diagnostics since given index.
+
+    It is used to send diagnostics from a worker process back to its caller.
+    """
+    # Get all diagnostics after given index.
+    return DIAGNOSTICS[start:]
+
+
+def clear(*args: object, **kargs: object) -> None:
+    r"""
+    Forget all recorded diagnostics.
+
+    Args
+    ----
+    - *args
+    - **kargs
+
+    Returns
+    -------
+
+    It is used by a long-running process before every run.
+    """
+    # Clear directly.
+    DIAGNOSTICS.clear()
+
+
+def extend(
+    diagnostics: List[Diagnostic], *args: object, **kargs: object,
+) -> None:
+    r"""
+    Record diagnostics without logging.
+
+    Args
+    ----
+    - diagnostics
+        Diagnostics reported by other processes.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+
+    """
+    # Extend and stream directly.
+    DIAGNOSTICS.extend(diagnostics)
+    if (STREAM is None):
+        pass
+    else:
+        for itr in diagnostics:
+            STREAM.write(itr)
+
+
+def summary(*args: object, **kargs: object) -> int:
+    r"""
+    Summarize recorded diagnostics.
+
+    Args
+    ----
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - num
+        Number of recorded diagnostics.
+
+    """
+    # Nothing to summarize for a clean run.
+    if (len(DIAGNOSTICS) == 0):
+        return 0
+    else:
+        pass
+
+    # Count diagnostics by rules.
+    counts: Dict[str, int] = {}
+    for itr in DIAGNOSTICS:
+        counts[itr.rule] = counts.get(itr.rule, 0) + 1
+    error(
+        "Find {:d} diagnostics in {:d} files.",
+        len(DIAGNOSTICS), len(set(itr.path for itr in DIAGNOSTICS)),
+    )
+    for name in sorted(counts.keys()):
+        error("Rule \"{:s}\" is violated {:d} times.", name, counts[name])
+    return len(DIAGNOSTICS)
\ No newline at end of file
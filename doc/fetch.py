@@ -0,0 +1,339 @@
+# Import future.
+from __future__ import annotations
+
+# Import typing.
+from typing import Any
+from typing import Tuple as MultiReturn
+from typing import List, Dict, Union, Callable
+
+# Import dependencies.
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor, Future
+
+# Add development library to path.
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+))
+
+# Import logging.
+from pytorch.logging import debug, info1, info2, focus, warning, error
+
+# Import dependencies.
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Fetcher Objects >>
+# Overlap file access with parsing and note generation by a thread pool.
+#
+# Contents of source files are prefetched before they are hashed or parsed,
+# so that reading a file is not a blocking round trip on network storage.
+# Writing of README files is submitted to the same pool, so that it overlaps
+# with notes of the next directory.
+#
+# Only a bounded window of files ahead of current position is prefetched,
+# thus memory does not grow with the tree.
+#
+# Without a fetcher, everything falls back to blocking access in caller thread.
+# Worker processes also fall back since threads are not inherited.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+# Number of files prefetched ahead of current position.
+WINDOW = 32
+
+
+def load(path: str, *args: object, **kargs: object) -> bytes:
+    r"""
+    Load file content.
+
+    Args
+    ----
+    - path
+        Path of the file.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - content
+        Content.
+
+    """
+    # Read all at once.
+    file = open(path, "rb")
+    content = file.read()
+    file.close()
+    return content
+
+
+class Fetcher(object):
+    r"""
+    Thread pool of file access.
+    """
+    def __init__(
+        self: Fetcher, *args: object, workers: int, **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - *args
+        - workers
+            Number of access threads.
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Save necessary attributes.
+        self.PID = os.getpid()
+
+        # Allocate pool and prefetching contents.
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.contents: Dict[str, Future] = {}
+
+    def prefetch(
+        self: Fetcher, paths: List[str], *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Prefetch contents of files.
+
+        Args
+        ----
+        - self
+        - paths
+            Paths of files.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Submit every file which is not prefetching.
+        for itr in paths:
+            if (itr in self.contents):
+                pass
+            else:
+                self.contents[itr] = self.pool.submit(load, itr)
+
+    def read(
+        self: Fetcher, path: str, *args: object, **kargs: object,
+    ) -> bytes:
+        r"""
+        Read content of a file.
+
+        Args
+        ----
+        - self
+        - path
+            Path of the file.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - content
+            Content.
+
+        Prefetched content is kept until it is forgotten, thus a file can be
+        read several times by a single access.
+        """
+        # Only prefetched file in the process owning the pool is shared.
+        if (os.getpid() == self.PID and path in self.contents):
+            return self.contents[path].result()
+        else:
+            return load(path)
+
+    def forget(
+        self: Fetcher, paths: List[str], *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Forget prefetched contents of files.
+
+        Args
+        ----
+        - self
+        - paths
+            Paths of files.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Remove directly.
+        for itr in paths:
+            self.contents.pop(itr, None)
+
+    def submit(
+        self: Fetcher, function: Callable, *args: object, **kargs: object,
+    ) -> Future:
+        r"""
+        Submit a function.
+
+        Args
+        ----
+        - self
+        - function
+            Function accessing files.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - future
+            Future of the function.
+
+        """
+        # Run in the pool.
+        return self.pool.submit(function, *args, **kargs)
+
+    def close(self: Fetcher, *args: object, **kargs: object) -> None:
+        r"""
+        Close fetcher.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Wait for all submitted functions.
+        self.contents.clear()
+        self.pool.shutdown()
+
+
+# Fetcher of current process.
+FETCHER: Union[Fetcher, None] = None
+
+
+def update_fetcher(
+    *args: object, val: Union[Fetcher, None], **kargs: object,
+) -> None:
+    r"""
+    Update fetcher.
+
+    Args
+    ----
+    - *args
+    - val
+        Fetcher.
+        If it is None, all file access is blocking.
+    - **kargs
+
+    Returns
+    -------
+
+    """
+    # Replace directly.
+    global FETCHER
+    FETCHER = val
+
+
+def prefetch(paths: List[str], *args: object, **kargs: object) -> None:
+    r"""
+    Prefetch contents of files.
+
+    Args
+    ----
+    - paths
+        Paths of files.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+
+    """
+    # Only fetcher can prefetch.
+    if (FETCHER is None):
+        pass
+    else:
+        FETCHER.prefetch(paths)
+
+
+def read(path: str, *args: object, **kargs: object) -> bytes:
+    r"""
+    Read content of a file.
+
+    Args
+    ----
+    - path
+        Path of the file.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - content
+        Content.
+
+    """
+    # Read by fetcher if it exists.
+    if (FETCHER is None):
+        return load(path)
+    else:
+        return FETCHER.read(path)
+
+
+def forget(paths: List[str], *args: object, **kargs: object) -> None:
+    r"""
+    Forget prefetched contents of files.
+
+    Args
+    ----
+    - paths
+        Paths of files.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+
+    """
+    # Only fetcher has contents.
+    if (FETCHER is None):
+        pass
+    else:
+        FETCHER.forget(paths)
+
+
+def submit(function: Callable, *args: object, **kargs: object) -> Future:
+    r"""
+    Submit a function accessing files.
+
+    Args
+    ----
+    - function
+        Function accessing files.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - future
+        Future of the function.
+
+    Without fetcher, the function is done before returning.
+    """
+    # Run in caller thread without fetcher.
+    if (FETCHER is None):
+        future: Future = Future()
+        future.set_result(function(*args, **kargs))
+        return future
+    else:
+        return FETCHER.submit(function, *args, **kargs)
\ No newline at end of file
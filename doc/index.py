@@ -0,0 +1,308 @@
+# Import future.
+from __future__ import annotations
+
+# Import typing.
+from typing import Any
+from typing import Tuple as MultiReturn
+from typing import Union, List, Dict, Tuple
+
+# Import dependencies.
+import sys
+import os
+
+# Add development library to path.
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+))
+
+# Import logging.
+from pytorch.logging import debug, info1, info2, focus, warning, error
+
+# Import dependencies.
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Index Objects >>
+# Class definitions of the whole tree are indexed by their module-qualified
+# names, so that a super can be found by an exact lookup from any directory.
+#
+# Each indexed class keeps its file, row and a summary of its function
+# descriptions, which is all that inheritance check requires.
+# Each indexed class also keeps its super, and supers keep their inheriting
+# classes as reverse edges, thus classes inheriting a changed file can be
+# checked again without parsing the whole tree.
+# Summary keeps fingerprints of paragraphs rather than paragraphs themselves,
+# thus it is compact and can be compared by equality directly.
+# The index is persisted with the file keys it is built from, thus only
+# outdated files need to be parsed again.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+class FuncSummary(object):
+    r"""
+    Summary of a function description.
+    """
+    # Define compact attributes since there are a huge number of functions.
+    __slots__ = (
+        "name", "digest", "title", "arg_names", "arg_descs", "return_names",
+        "return_descs", "attach",
+    )
+
+    def __init__(
+        self: FuncSummary, *args: object, name: str, digest: str,
+        title: List[str], arg_names: List[str], arg_descs: List[List[str]],
+        return_names: List[str], return_descs: List[List[str]],
+        attach: List[str], **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - *args
+        - name
+            Function name.
+        - digest
+            Digest of the whole description.
+        - title
+            Fingerprints of title paragraphs.
+        - arg_names
+            Argument names.
+        - arg_descs
+            Fingerprints of argument description paragraphs.
+        - return_names
+            Return names.
+        - return_descs
+            Fingerprints of return description paragraphs.
+        - attach
+            Fingerprints of attached paragraphs.
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Save necessary attributes.
+        self.name = name
+        self.digest = digest
+        self.title = title
+        self.arg_names = arg_names
+        self.arg_descs = arg_descs
+        self.return_names = return_names
+        self.return_descs = return_descs
+        self.attach = attach
+
+
+class ClassIndex(object):
+    r"""
+    Index of class definitions.
+    """
+    def __init__(self: ClassIndex, *args: object, **kargs: object) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Map module-qualified class names to their files, rows and summaries.
+        self.locations: Dict[str, Tuple[str, int]] = {}
+        self.summaries: Dict[str, Dict[str, FuncSummary]] = {}
+
+        # Map module-qualified class names to their supers, and supers to
+        # their inheriting classes.
+        self.supers: Dict[str, str] = {}
+        self.inheritors: Dict[str, List[str]] = {}
+
+        # Trace indexed class names and keys of files.
+        self.names: Dict[str, List[str]] = {}
+        self.keys: Dict[str, str] = {}
+
+    def update(
+        self: ClassIndex, path: str, *args: object, key: str,
+        classes: List[Tuple[str, int, str, Dict[str, FuncSummary]]],
+        **kargs: object,
+    ) -> None:
+        r"""
+        Update classes of a file.
+
+        Args
+        ----
+        - self
+        - path
+            Path of the file.
+        - *args
+        - key
+            Key of the file.
+        - classes
+            A list of module-qualified names, rows, module-qualified supers
+            and function summaries of all classes in the file.
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Replace all classes of the file.
+        self.remove(path)
+        self.names[path] = []
+        self.keys[path] = key
+        for name, row, supername, summary in classes:
+            self.locations[name] = (path, row)
+            self.summaries[name] = summary
+            self.supers[name] = supername
+            self.inheritors.setdefault(supername, []).append(name)
+            self.names[path].append(name)
+
+    def remove(
+        self: ClassIndex, path: str, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Remove classes of a file.
+
+        Args
+        ----
+        - self
+        - path
+            Path of the file.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Remove all classes of the file if it is indexed.
+        for name in self.names.get(path, []):
+            del self.locations[name]
+            del self.summaries[name]
+            supername = self.supers.pop(name)
+            self.inheritors[supername].remove(name)
+            if (len(self.inheritors[supername]) == 0):
+                del self.inheritors[supername]
+            else:
+                pass
+        self.names.pop(path, None)
+        self.keys.pop(path, None)
+
+    def prune(
+        self: ClassIndex, paths: List[str], *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Prune files which are not given.
+
+        Args
+        ----
+        - self
+        - paths
+            Paths of all existing files.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Remove files which no longer exist.
+        existing = set(paths)
+        for path in list(self.names.keys()):
+            if (path in existing):
+                pass
+            else:
+                self.remove(path)
+
+    def fresh(
+        self: ClassIndex, path: str, key: str, *args: object, **kargs: object,
+    ) -> bool:
+        r"""
+        Check if a file is indexed by its latest content.
+
+        Args
+        ----
+        - self
+        - path
+            Path of the file.
+        - key
+            Latest key of the file.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - flag
+            If True, indexed classes of the file are up to date.
+
+        Empty key is never up to date.
+        """
+        # Compare with the indexed key.
+        return len(key) > 0 and self.keys.get(path, "") == key
+
+    def inheriting(
+        self: ClassIndex, modules: List[str], *args: object, **kargs: object,
+    ) -> List[str]:
+        r"""
+        Get files defining classes which inherit classes of given modules.
+
+        Args
+        ----
+        - self
+        - modules
+            Module names.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - paths
+            Paths of files.
+
+        Supers are matched by their module names rather than indexed classes,
+        thus classes newly defined in given modules are also covered.
+        Only direct inheritors are given, since a class is only checked with
+        its direct super.
+        """
+        # Walk reverse edges from supers of given modules.
+        targets = set(modules)
+        paths = set()
+        for supername, names in self.inheritors.items():
+            if (supername.rsplit(".", 1)[0] in targets):
+                for name in names:
+                    paths.add(self.locations[name][0])
+            else:
+                pass
+        return sorted(paths)
+
+    def summary(
+        self: ClassIndex, name: str, *args: object, **kargs: object,
+    ) -> Union[Dict[str, FuncSummary], None]:
+        r"""
+        Get function summaries of a class.
+
+        Args
+        ----
+        - self
+        - name
+            Module-qualified class name.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - summary
+            Function summaries of the class.
+            If it is None, the class is not indexed.
+
+        """
+        # Get directly.
+        return self.summaries.get(name, None)
\ No newline at end of file
@@ -0,0 +1,208 @@
+# Import future.
+from __future__ import annotations
+
+# Import typing.
+from typing import Any
+from typing import Tuple as MultiReturn
+from typing import List, Dict, Callable
+
+# Import dependencies.
+import sys
+import os
+import time
+import json
+
+# Add development library to path.
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+))
+
+# Import logging.
+from pytorch.logging import debug, info1, info2, focus, warning, error
+
+# Import dependencies.
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Instrument Objects >>
+# Record wall time and number of calls of instrumented functions.
+#
+# Instrumentation is opt-in.
+# Functions are only wrapped after it is enabled, thus a normal run pays
+# nothing for it.
+#
+# Every record is put under a kind, which is a stage, a document class or a
+# file.
+# Both total time and own time excluding nested instrumented calls are
+# recorded, so that nested stages are not counted twice.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+class Record(object):
+    r"""
+    Record of an instrumented function.
+    """
+    # Define compact attributes.
+    __slots__ = ("calls", "total", "own")
+
+    def __init__(self: Record, *args: object, **kargs: object) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Every record starts from zero.
+        self.calls = 0
+        self.total = 0.0
+        self.own = 0.0
+
+
+# Records by kinds and names, and own time of running calls.
+RECORDS: Dict[str, Dict[str, Record]] = {}
+STACK: List[float] = []
+
+
+def wrap(
+    owner: Any, attr: str, *args: object, kind: str, name: str,
+    **kargs: object,
+) -> None:
+    r"""
+    Wrap a function of an owner by instrumentation.
+
+    Args
+    ----
+    - owner
+        Class or module owning the function.
+    - attr
+        Attribute name of the function.
+    - *args
+    - kind
+        Kind of records.
+    - name
+        Record name.
+        If it is empty, path of the first argument is used, which is either
+        a string or an object with path attribute.
+    - **kargs
+
+    Returns
+    -------
+
+    """
+    # Wrap the original function.
+    original = getattr(owner, attr)
+
+    def wrapper(*args: object, **kargs: object) -> Any:
+        r"""
+        Call with instrumentation.
+
+        Args
+        ----
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - ret
+            Return of the original function.
+
+        """
+        # Nested calls will exclude their time from this call.
+        STACK.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original(*args, **kargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = STACK.pop()
+            if (len(STACK) > 0):
+                STACK[-1] += elapsed
+            else:
+                pass
+            if (len(name) > 0):
+                key = name
+            elif (isinstance(args[0], str)):
+                key = os.path.relpath(args[0])
+            else:
+                key = getattr(args[0], "PATH")
+            record = RECORDS.setdefault(kind, {}).setdefault(key, Record())
+            record.calls += 1
+            record.total += elapsed
+            record.own += elapsed - nested
+    setattr(owner, attr, wrapper)
+
+
+def show(*args: object, num: int, **kargs: object) -> None:
+    r"""
+    Log the slowest records of every kind.
+
+    Args
+    ----
+    - *args
+    - num
+        Number of records to log for every kind.
+    - **kargs
+
+    Returns
+    -------
+
+    Records are sorted by own time except for files, which are sorted by
+    total time.
+    """
+    # Log kind by kind.
+    for kind in sorted(RECORDS.keys()):
+        records = RECORDS[kind]
+        if (kind == "file"):
+            order: Callable[[str], float] = lambda x: -records[x].total
+        else:
+            order = lambda x: -records[x].own
+        info1("Slowest {:s} records.", kind)
+        for name in sorted(records.keys(), key=order)[:num]:
+            record = records[name]
+            info1(
+                "Record \"{:s}\" has {:d} calls, {:.4f}s total and {:.4f}s "
+                "own.", name,
+                record.calls, record.total, record.own,
+            )
+
+
+def dump(path: str, *args: object, **kargs: object) -> None:
+    r"""
+    Dump all records as JSON.
+
+    Args
+    ----
+    - path
+        Path of JSON file.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+
+    """
+    # Save records by kinds and names.
+    obj = {
+        kind: {
+            name: {
+                "calls": record.calls, "total": record.total,
+                "own": record.own,
+            }
+            for name, record in records.items()
+        }
+        for kind, records in RECORDS.items()
+    }
+    file = open(path, "w")
+    json.dump(obj, file, indent=4)
+    file.close()
\ No newline at end of file
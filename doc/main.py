@@ -4,20 +4,28 @@ from __future__ import annotations
 # Import typing.
 from typing import Any
 from typing import Tuple as MultiReturn
-from typing import List, Union, Dict, Tuple
+from typing import List, Union, Dict, Tuple, Set
 
 # Import dependencies.
 import sys
 import os
 import re
 import token
+import time
+import argparse
+import importlib
+import tempfile
+import shutil
+import filecmp
+import collections
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, Future
 
 # Add development library to path.
-if (os.path.basename(os.getcwd()) == "MLRepo"):
-    sys.path.append(os.path.join("."))
-else:
-    print("Code must strictly work in \"MLRepo\".")
-    exit()
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+))
 
 # Import logging.
 from pytorch.logging import debug, info1, info2, focus, warning, error
@@ -26,6 +34,20 @@ from pytorch.logging import debug, info1, info2, focus, warning, error
 from doc.code import Code, Line
 from doc.code import MAX, UNIT, FIRST
 from doc.code import paragraphize
+from doc.code import RECOVERS, update_recover, recovering
+from doc.code import LINE_RULES
+from doc.config import Config, default
+from doc.cache import Cache, Resident, fingerprint
+from doc.watch import watcher
+from doc.server import Server
+from doc.fetch import Fetcher, update_fetcher, prefetch, forget, submit
+from doc.fetch import WINDOW
+from doc.index import ClassIndex, FuncSummary
+from doc.diagnose import Diagnostic, Stream, report, count, since, extend
+from doc.diagnose import update_collect, update_stream, collecting, summary
+from doc.diagnose import clear
+from doc.instrument import wrap, show, dump
+from doc.profiler import Profiler
 
 
 # =============================================================================
@@ -117,13 +139,9 @@ class FileSysDocument(Document):
     r"""
     Document for file system prototype.
     """
-    # Define Github constants.
-    PROJECT = "MLRepo"
-    FOLDER = "/u/antor/u12/gao462/{:s}".format(PROJECT)
-    GITHUB = "https://github.com/gao462/{:s}".format(PROJECT)
-
     def __init__(
-        self: Document, path: str, *args: object, **kargs: object,
+        self: Document, path: str, *args: object, config: Config,
+        **kargs: object,
     ) -> None:
         r"""
         Initialize.
@@ -134,6 +152,8 @@ class FileSysDocument(Document):
         - path
             Path of this document.
         - *args
+        - config
+            Configuration of the repository.
         - **kargs
 
         Returns
@@ -145,6 +165,7 @@ class FileSysDocument(Document):
 
         # Save necessary attributes
         self.PATH = path
+        self.CONFIG = config
 
 
 class DirectoryDocument(FileSysDocument):
@@ -152,7 +173,7 @@ class DirectoryDocument(FileSysDocument):
     Document for a directory.
     """
     def __init__(
-        self: DirectoryDocument, path: str, *args: object,
+        self: DirectoryDocument, path: str, *args: object, config: Config,
         rootdoc: Union[DirectoryDocument, None], **kargs: object,
     ) -> None:
         r"""
@@ -164,6 +185,8 @@ class DirectoryDocument(FileSysDocument):
         - path
             Path of this document.
         - *args
+        - config
+            Configuration of the repository.
         - rootdoc
             Document for root directory.
         - **kargs
@@ -173,16 +196,16 @@ class DirectoryDocument(FileSysDocument):
 
         """
         # Super.
-        FileSysDocument.__init__(self, path, *args, **kargs)
+        FileSysDocument.__init__(self, path, *args, config=config, **kargs)
 
         # Save necessary attributes.
         self.ROOTDOC = self if rootdoc is None else rootdoc
 
-        # File system should trace definitions.
-        self.classes: Dict[str, str] = {}
-        self.classdocs: Dict[str, ClassDocument] = {}
-
-    def parse(self: DirectoryDocument, *args: object, **kargs: object) -> None:
+    def parse(
+        self: DirectoryDocument, *args: object, jobs: int,
+        cache: Union[Cache, None], check: bool,
+        files: Union[List[str], None], **kargs: object,
+    ) -> None:
         r"""
         Parse content.
 
@@ -190,18 +213,317 @@ class DirectoryDocument(FileSysDocument):
         ----
         - self
         - *args
+        - jobs
+            Number of worker processes for parsing files.
+            If it is 1, files are parsed in current process.
+        - cache
+            Cache of parsed file documents.
+            If it is None, all files are parsed and all notes are generated.
+        - check
+            If True, only check definitions without generating notes.
+        - files
+            Paths of selected files to parse.
+            If it is None, all files in the tree are parsed.
         - **kargs
 
         Returns
         -------
 
+        Selected files which are not in the tree are ignored, and selection
+        should only be used for checking since notes of a directory require
+        all of its files.
+        Supers of selected classes are found by a class index persisted in
+        cache, and only files defining unindexed or outdated supers are
+        parsed again.
+        Files defining classes which inherit selected files are also
+        selected, and they are found by the same class index.
         """
-        # Traverse the tree.
+        # Traverse the tree to get all parsing files.
+        tasks = self.traverse()
+        self.CACHE = cache
+        self.CHECK = check
+        if (files is None):
+            selects = tasks
+        else:
+            selected = set(
+                os.path.abspath(self.CONFIG.path(itr)) for itr in files
+            )
+            selects = [itr for itr in tasks if itr[1] in selected]
+
+            # Selected file out of parsing files would never be checked.
+            for itr in sorted(selected - set(path for _, path in selects)):
+                report(
+                    os.path.relpath(itr, self.CONFIG.ROOT), row=0,
+                    column=-1, rule="unknown-file",
+                    message="expect a parsing python file in the tree",
+                )
+
+        # Load class index of last run, and forget files no longer existing.
+        if (cache is None):
+            index = None
+        else:
+            index = cache.load("class-index", cache.VERSION)
+        self.INDEX = ClassIndex() if index is None else index
+        self.INDEX.prune(
+            [os.path.relpath(path, self.CONFIG.ROOT) for _, path in tasks],
+        )
+
+        # Classes inheriting selected files should be checked again.
+        if (files is None):
+            pass
+        else:
+            inheriting = set(
+                os.path.abspath(self.CONFIG.path(itr))
+                for itr in self.INDEX.inheriting([
+                    os.path.splitext(
+                        os.path.relpath(path, self.CONFIG.ROOT),
+                    )[0].replace(os.sep, ".")
+                    for _, path in selects
+                ])
+            )
+            selected.update(inheriting)
+            selects = [itr for itr in tasks if itr[1] in selected]
+
+        # Attach parsed files to their directories in traversal order.
+        filedocs = self.load(selects, jobs=jobs, cache=cache)
+        for (dirdoc, _), filedoc in zip(selects, filedocs):
+            if (filedoc is None):
+                # Unrecoverable file is skipped.
+                continue
+            else:
+                dirdoc.files.append(filedoc)
+
+        # Selected files also require their supers, and files defining
+        # unindexed or outdated supers are parsed only to update the index.
+        if (files is None):
+            pass
+        else:
+            requires = set(
+                classdoc.resolve().rsplit(".", 1)[0]
+                for filedoc in filedocs if filedoc is not None
+                for classdoc in filedoc.classdocs.values()
+            )
+            refers = []
+            for itr in tasks:
+                path = os.path.relpath(itr[1], self.CONFIG.ROOT)
+                module = os.path.splitext(path)[0].replace(os.sep, ".")
+                if (itr[1] in selected or module not in requires):
+                    pass
+                elif (
+                    cache is not None and
+                    self.INDEX.fresh(path, cache.key(itr[1]))
+                ):
+                    pass
+                else:
+                    refers.append(itr)
+            for filedoc in self.load(refers, jobs=jobs, cache=cache):
+                if (filedoc is None):
+                    # Unrecoverable file is skipped.
+                    continue
+                else:
+                    self.INDEX.update(
+                        filedoc.PATH, key=filedoc.KEY,
+                        classes=filedoc.summarize(),
+                    )
+
+        # Register all definitions from documents in the tree, and save the
+        # class index for later runs.
+        self.register()
+        self.digest()
+        if (cache is None):
+            pass
+        else:
+            cache.save("class-index", cache.VERSION, self.INDEX)
+
+        # Root specific operations.
+        if (self.PATH == self.CONFIG.ROOT):
+            self.root()
+        else:
+            pass
+
+    def load(
+        self: DirectoryDocument, tasks: List[Tuple[DirectoryDocument, str]],
+        *args: object, jobs: int, cache: Union[Cache, None], **kargs: object,
+    ) -> List[Union[FileDocument, None]]:
+        r"""
+        Load file documents.
+
+        Args
+        ----
+        - self
+        - tasks
+            A list of directory documents and their python file paths to
+            parse.
+        - *args
+        - jobs
+            Number of worker processes for parsing files.
+            If it is 1, files are parsed in current process.
+        - cache
+            Cache of parsed file documents.
+            If it is None, all files are parsed.
+        - **kargs
+
+        Returns
+        -------
+        - filedocs
+            A list of file documents in the same order of tasks.
+            Unrecoverable file in collecting mode is None.
+
+        """
+        # Prefetched contents are always released, even if parsing fails.
+        paths = [path for _, path in tasks]
+        try:
+            filedocs, keys = self.load_files(tasks, jobs=jobs, cache=cache)
+        finally:
+            forget(paths)
+
+        # Attach parsed files to their directories.
+        for (dirdoc, _), key, filedoc in zip(tasks, keys, filedocs):
+            if (filedoc is None):
+                pass
+            else:
+                filedoc.ROOTDOC = dirdoc
+                filedoc.KEY = key
+        return filedocs
+
+    def load_files(
+        self: DirectoryDocument, tasks: List[Tuple[DirectoryDocument, str]],
+        *args: object, jobs: int, cache: Union[Cache, None], **kargs: object,
+    ) -> MultiReturn[List[Union[FileDocument, None]], List[str]]:
+        r"""
+        Load file documents with prefetched contents.
+
+        Args
+        ----
+        - self
+        - tasks
+            A list of directory documents and their python file paths to
+            parse.
+        - *args
+        - jobs
+            Number of worker processes for parsing files.
+            If it is 1, files are parsed in current process.
+        - cache
+            Cache of parsed file documents.
+            If it is None, all files are parsed.
+        - **kargs
+
+        Returns
+        -------
+        - filedocs
+            A list of file documents in the same order of tasks.
+            Unrecoverable file in collecting mode is None.
+        - keys
+            A list of cache keys in the same order of tasks.
+
+        Files are prefetched by a bounded window ahead of hashing, and again
+        ahead of serial parsing.
+        A file is forgotten right after it is used, and caller should forget
+        all files in the end.
+        """
+        # Load unchanged files from cache.
+        paths = [path for _, path in tasks]
+        keys = []
+        filedocs: List[Union[FileDocument, None]] = []
+        for i, path in enumerate(paths):
+            if (cache is None):
+                keys.append("")
+                filedocs.append(None)
+            else:
+                prefetch(paths[i:i + WINDOW])
+                keys.append(cache.key(path))
+                filedocs.append(cache.load(path, keys[i]))
+                forget([path])
+        missings = [i for i, itr in enumerate(filedocs) if itr is None]
+        if (cache is None):
+            pass
+        else:
+            info1(
+                "Parse {:d} files, and load {:d} files from cache.",
+                len(missings), len(tasks) - len(missings),
+            )
+
+        # Parse missing files serially or in a process pool.
+        if (jobs > 1):
+            # Resident cache only lives in current process.
+            shared = None if isinstance(cache, Resident) else cache
+
+            # Workers are never forked from current process which may own
+            # threads, thus settings are passed explicitly.
+            if ("forkserver" in multiprocessing.get_all_start_methods()):
+                context = multiprocessing.get_context("forkserver")
+            else:
+                context = multiprocessing.get_context("spawn")
+            initializer = functools.partial(
+                initialize, collect=collecting(), lazy=LAZY,
+                recover=recovering(), rules=sorted(set(
+                    getattr(itr, "__module__") for itr in LINE_RULES.values()
+                )),
+            )
+            with ProcessPoolExecutor(
+                max_workers=jobs, mp_context=context, initializer=initializer,
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        parse_file, tasks[i][1], config=self.CONFIG,
+                        cache=shared, key=keys[i],
+                    )
+                    for i in missings
+                ]
+                for i, itr in zip(missings, futures):
+                    # Failure is raised after its diagnostics are recorded.
+                    filedocs[i], diagnostics, failed = itr.result()
+                    extend(diagnostics)
+                    if (failed):
+                        pool.shutdown(cancel_futures=True)
+                        raise RuntimeError
+                    elif (
+                        cache is None or shared is cache or
+                        filedocs[i] is None or len(diagnostics) > 0
+                    ):
+                        pass
+                    else:
+                        cache.save(tasks[i][1], keys[i], filedocs[i])
+        else:
+            for j, i in enumerate(missings):
+                prefetch([paths[itr] for itr in missings[j:j + WINDOW]])
+                filedocs[i], _, failed = parse_file(
+                    tasks[i][1], config=self.CONFIG, cache=cache, key=keys[i],
+                )
+                forget([paths[i]])
+                if (failed):
+                    raise RuntimeError
+                else:
+                    pass
+        return filedocs, keys
+
+    def traverse(
+        self: DirectoryDocument, *args: object, **kargs: object,
+    ) -> List[Tuple[DirectoryDocument, str]]:
+        r"""
+        Traverse the tree.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - tasks
+            A list of directory documents and their python file paths to
+            parse in traversal order.
+
+        """
+        # Traverse the tree by directory entries whose types are usually
+        # known without extra system calls.
         self.subdirs = []
         self.files = []
-        for itr in os.listdir(self.PATH):
-            itr = os.path.join(self.PATH, itr)
-            if (os.path.isdir(itr)):
+        tasks = []
+        for entry in os.scandir(self.PATH):
+            itr = entry.path
+            if (entry.is_dir()):
                 base = os.path.basename(itr)
                 if (base == "__pycache__"):
                     # Some directory name should be ignored.
@@ -210,19 +532,19 @@ class DirectoryDocument(FileSysDocument):
                     # Hidden directory should be ignored.
                     pass
                 else:
-                    dirdoc = DirectoryDocument(itr, rootdoc=self.ROOTDOC)
-                    dirdoc.parse()
+                    dirdoc = DirectoryDocument(
+                        itr, config=self.CONFIG, rootdoc=self.ROOTDOC,
+                    )
+                    tasks.extend(dirdoc.traverse())
                     self.subdirs.append(dirdoc)
-            elif (os.path.isfile(itr)):
+            elif (entry.is_file()):
                 base, ext = os.path.splitext(itr)
                 base = os.path.basename(base)
                 if (ext == ".py"):
                     if (base == "__init__"):
                         warning("Skip \"{:s}\" for now.".format(itr))
                     else:
-                        filedoc = FileDocument(itr, rootdoc=self)
-                        filedoc.parse()
-                        self.files.append(filedoc)
+                        tasks.append((self, itr))
                 elif (ext in (".md", ".sh")):
                     # Some extension name should be ignored.
                     pass
@@ -230,26 +552,17 @@ class DirectoryDocument(FileSysDocument):
                     # Some no-extension file should be ignored.
                     pass
                 else:
-                    error(
-                        "At \"{:s}\", expect a python/Markdown/bash/Git file.",
-                        itr,
+                    report(
+                        os.path.relpath(itr, self.CONFIG.ROOT), row=0,
+                        column=-1, rule="unknown-file",
+                        message="expect a python/Markdown/bash/Git file",
                     )
-                    raise RuntimeError
             else:
-                error(
-                    "At \"{:s}\", expect a directory/file.",
-                    itr,
+                report(
+                    os.path.relpath(itr, self.CONFIG.ROOT), row=0, column=-1,
+                    rule="unknown-file", message="expect a directory/file",
                 )
-                raise RuntimeError
-
-        # Register all definitions from documents in the tree.
-        self.register()
-
-        # Root specific operations.
-        if (self.PATH == self.FOLDER):
-            self.root()
-        else:
-            pass
+        return tasks
 
     def register(
         self: DirectoryDocument, *args: object, **kargs: object,
@@ -269,20 +582,54 @@ class DirectoryDocument(FileSysDocument):
         """
         # Register definitions from sub directories.
         for dirdoc in self.subdirs:
-            for key, location in dirdoc.classes.items():
-                self.classes[key] = location
-            for key, holder in dirdoc.classdocs.items():
-                self.classdocs[key] = holder
+            dirdoc.register()
 
-        # Register definitions from files.
+        # Register definitions from files into class index of the tree.
         for filedoc in self.files:
-            for key, row in filedoc.classes.items():
-                location = "{:s}/blob/master/{:s}{:s}".format(
-                    self.GITHUB, filedoc.PATH, row,
-                )
-                self.classes["{:s}.{:s}".format(filedoc.ME, key)] = location
-            for key, holder in filedoc.classdocs.items():
-                self.classdocs["{:s}.{:s}".format(filedoc.ME, key)] = holder
+            getattr(self.ROOTDOC, "INDEX").update(
+                filedoc.PATH, key=filedoc.KEY, classes=filedoc.summarize(),
+            )
+
+    def digest(
+        self: DirectoryDocument, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Digest sources for incremental notes.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        Keys of files defining supers are also digested, since changing a
+        super requires checking its inheriting classes again.
+        It should be called after all definitions are registered.
+        """
+        # Digest sub directories first.
+        for dirdoc in self.subdirs:
+            dirdoc.digest()
+
+        # Get keys of files defining supers.
+        index = getattr(self.ROOTDOC, "INDEX")
+        supers = []
+        for filedoc in self.files:
+            for classdoc in filedoc.classdocs.values():
+                location = index.locations.get(classdoc.resolve(), None)
+                if (location is None):
+                    pass
+                else:
+                    supers.append(index.keys.get(location[0], ""))
+
+        # Digest all sources in the tree.
+        self.DIGEST = fingerprint(
+            [itr.DIGEST.encode() for itr in self.subdirs] +
+            [itr.KEY.encode() for itr in self.files] +
+            [itr.encode() for itr in supers],
+        )
 
     def notes(self: DirectoryDocument, *args: object, **kargs: object) -> None:
         r"""
@@ -305,23 +652,84 @@ class DirectoryDocument(FileSysDocument):
         for dirdoc in self.subdirs:
             dirdoc.notes()
 
-        # Generate file notes
+        # Unchanged tree with existing README needs no update.
+        cache = self.ROOTDOC.CACHE
+        path = os.path.join(self.PATH, "README.md")
+        if (
+            cache is not None and os.path.isfile(path) and
+            cache.load(self.PATH, self.DIGEST) is not None
+        ):
+            self.ROOTDOC.readmes += 1
+            return
+        else:
+            pass
+
+        # Generate and stream file notes one by one.
+        writer = ReadmeWriter(path)
         for filedoc in self.files:
             filedoc.notes()
-            self.markdown.extend(["", "---", ""])
-            self.markdown.extend(filedoc.markdown)
+            writer.write(
+                ["", "---", ""] + filedoc.markdown, headers=filedoc.headers,
+            )
 
-        # Generate table of content.
-        self.markdown = toc(self.markdown) + self.markdown
+            # Clear children notes for memory efficency.
+            filedoc.markdown.clear()
 
-        # Save markdown note as README.
-        file = open(os.path.join(self.PATH, "README.md"), "w")
-        file.write("\n".join(self.markdown))
-        file.close()
+        # Notes with any diagnostic should never overwrite README, and
+        # README is saved in background while notes of next directory are
+        # generated.
+        if (count() > 0):
+            writer.close(save=False)
+        else:
+            self.ROOTDOC.pending.append(
+                (self, path, submit(writer.close, save=True)),
+            )
 
-        # Clear children notes for memory efficency.
+    def wait(self: DirectoryDocument, *args: object, **kargs: object) -> None:
+        r"""
+        Wait for pending README files.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        Tree digest is remembered only after its README is saved.
+        """
+        # Count saved README files, and remember their tree digests.
+        for dirdoc, path, future in self.pending:
+            changed = future.result()
+            self.readmes += 1
+            self.changed += int(changed)
+            if (self.CACHE is None):
+                pass
+            else:
+                self.CACHE.save(dirdoc.PATH, dirdoc.DIGEST, path)
+        self.pending.clear()
+
+    def check(self: DirectoryDocument, *args: object, **kargs: object) -> None:
+        r"""
+        Check definitions.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Check sub directories and files.
+        for dirdoc in self.subdirs:
+            dirdoc.check()
         for filedoc in self.files:
-            filedoc.markdown.clear()
+            filedoc.check()
 
     def root(self: DirectoryDocument, *args: object, **kargs: object) -> None:
         r"""
@@ -337,8 +745,21 @@ class DirectoryDocument(FileSysDocument):
         -------
 
         """
-        # Generate notes.
-        self.notes()
+        # Generate notes unless it is only checking.
+        if (self.CHECK):
+            self.check()
+        else:
+            self.readmes = 0
+            self.changed = 0
+            self.pending: List[
+                MultiReturn[DirectoryDocument, str, Future]
+            ] = []
+            self.notes()
+            self.wait()
+            info1(
+                "Update {:d} of {:d} README files.", self.changed,
+                self.readmes,
+            )
 
 
 class FileDocument(FileSysDocument):
@@ -346,7 +767,7 @@ class FileDocument(FileSysDocument):
     Document for a file.
     """
     def __init__(
-        self: FileDocument, path: str, *args: object,
+        self: FileDocument, path: str, *args: object, config: Config,
         rootdoc: Union[DirectoryDocument, None], **kargs: object,
     ) -> None:
         r"""
@@ -358,6 +779,8 @@ class FileDocument(FileSysDocument):
         - path
             Path of this document.
         - *args
+        - config
+            Configuration of the repository.
         - rootdoc
             Document for root directory.
         - **kargs
@@ -367,14 +790,13 @@ class FileDocument(FileSysDocument):
 
         """
         # Super.
-        FileSysDocument.__init__(self, path, *args, **kargs)
+        FileSysDocument.__init__(self, path, *args, config=config, **kargs)
 
         # Save necessary attributes.
         self.ROOTDOC = self if rootdoc is None else rootdoc
 
         # Get module path from file path.
-        _, self.PATH = self.PATH.split(self.FOLDER)
-        self.PATH = self.PATH[1:]
+        self.PATH = os.path.relpath(self.PATH, self.CONFIG.ROOT)
         self.ME = self.PATH.replace(os.path.join(" ", " ")[1:-1], ".")
         self.ME, _ = os.path.splitext(self.ME)
 
@@ -382,6 +804,9 @@ class FileDocument(FileSysDocument):
         self.classes: Dict[str, str] = {}
         self.classdocs: Dict[str, ClassDocument] = {}
 
+        # Outlined definitions wait for materializing.
+        self.outlines: List[FunctionDocument] = []
+
         # Set code to parse on.
         self.code = Code()
 
@@ -410,7 +835,7 @@ class FileDocument(FileSysDocument):
 
         """
         # Load tokenized code and parse it.
-        self.code.load_file(self.PATH)
+        self.code.load_file(self.PATH, root=self.CONFIG.ROOT)
         self.code.reset()
         self.modules.parse(self.code)
         self.sections.parse(self.code)
@@ -446,6 +871,77 @@ class FileDocument(FileSysDocument):
                 else:
                     pass
 
+    def summarize(
+        self: FileDocument, *args: object, **kargs: object,
+    ) -> List[Tuple[str, int, str, Dict[str, FuncSummary]]]:
+        r"""
+        Summarize defined classes for class index.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - classes
+            A list of module-qualified names, rows, module-qualified supers
+            and function summaries of all classes in the file.
+
+        """
+        # Summarize by module-qualified names.
+        return [
+            (
+                "{:s}.{:s}".format(self.ME, name), classdoc.row,
+                classdoc.resolve(), classdoc.summarize(),
+            )
+            for name, classdoc in self.classdocs.items()
+        ]
+
+    def check(self: FileDocument, *args: object, **kargs: object) -> None:
+        r"""
+        Check definitions.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Check all classes.
+        for classdoc in self.classdocs.values():
+            classdoc.check()
+
+        # Review all outlined definitions.
+        self.materialize()
+
+    def materialize(
+        self: FileDocument, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Materialize all outlined definitions.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        Materializing a definition may outline its nested definitions, thus
+        it repeats until nothing is outlined.
+        """
+        # Materialize in outlining order.
+        while (len(self.outlines) > 0):
+            self.outlines.pop(0).materialize()
+
     def notes(self: FileDocument, *args: object, **kargs: object) -> None:
         r"""
         Generate notes.
@@ -463,6 +959,9 @@ class FileDocument(FileSysDocument):
         For most part of the notes, they will share the same Markdown syntex
         except that console notes will use ASCII color codes for some keywords.
         """
+        # Review all outlined definitions.
+        self.materialize()
+
         # Extend notes by global sections.
         self.sections.notes()
         self.markdown.extend(self.sections.markdown)
@@ -470,19 +969,428 @@ class FileDocument(FileSysDocument):
         # Extend notes by module imports.
         self.modules.notes()
 
-        # Generate file header and TOC.
-        index = [""] + toc(self.markdown)[2:]
+        # Generate file header and TOC, and keep headers for directory TOC.
+        head = "## File: {:s}".format(self.PATH)
+        self.headers = collect_headers([head] + self.markdown)
+        index = [""] + render_toc(self.headers[1:])[2:]
         self.markdown = index + [""] + self.markdown
-        self.markdown = ["## File: {:s}".format(self.PATH)] + self.markdown
+        self.markdown = [head] + self.markdown
 
         # Clear children notes for memory efficency.
         self.sections.markdown.clear()
         self.modules.markdown.clear()
 
 
-def toc(notes: List[str], *args: object, **kargs: object) -> List[str]:
+def initialize(
+    *args: object, collect: bool, lazy: bool, recover: str, rules: List[str],
+    **kargs: object,
+) -> None:
+    r"""
+    Initialize a worker process by settings of its parent process.
+
+    Args
+    ----
+    - *args
+    - collect
+        Collecting status.
+    - lazy
+        Lazy parsing status.
+    - recover
+        Recoverability verification level.
+    - rules
+        Modules registering line rules.
+    - **kargs
+
+    Returns
+    -------
+
+    Worker process may start from a fresh interpreter, thus nothing is
+    inherited from its parent process.
+    Importing rule modules registers their line rules, and modules already
+    imported are not imported again.
+    Memories of consistent pairs and Github references are only used by
+    notes, thus they are always cleared.
+    """
+    # Update parsing modes.
+    update_collect(val=collect)
+    update_lazy(val=lazy)
+    update_recover(val=recover)
+
+    # Register line rules by their modules.
+    for itr in rules:
+        importlib.import_module(itr)
+
+    # Worker process never shares file access threads or memories.
+    update_fetcher(val=None)
+    update_stream(val=None)
+    CONSISTENT.clear()
+    REFERS.clear()
+
+
+def parse_file(
+    path: str, *args: object, config: Config, cache: Union[Cache, None],
+    key: str, **kargs: object,
+) -> MultiReturn[Union[FileDocument, None], List[Diagnostic], bool]:
+    r"""
+    Parse a file document independently.
+
+    Args
+    ----
+    - path
+        Path of the file.
+    - *args
+    - config
+        Configuration of the repository.
+    - cache
+        Cache of parsed file documents.
+        If it is not None, parsed document will be saved into it.
+    - key
+        Cache key of the file.
+    - **kargs
+
+    Returns
+    -------
+    - filedoc
+        Parsed file document.
+        If it is None, the file is unrecoverable in collecting mode.
+    - diagnostics
+        Diagnostics reported during parsing.
+    - failed
+        If True, parsing fails out of collecting mode, and caller should
+        raise after its diagnostics are recorded.
+
+    The document is parsed without its directory, so that it can be parsed in
+    a worker process and sent back.
+    Its directory should be attached by caller, and its diagnostics should be
+    recorded by caller if it is parsed in a worker process.
+
+    Failure is returned rather than raised, thus diagnostics of a worker
+    process are never lost.
+    """
+    # Parse as a standalone document, and unrecoverable file is skipped.
+    start = count()
+    filedoc: Union[FileDocument, None] = FileDocument(
+        path, config=config, rootdoc=None,
+    )
+    try:
+        filedoc.parse()
+        failed = False
+    except RuntimeError:
+        filedoc = None
+        failed = not collecting()
+    diagnostics = since(start=start)
+
+    # Save standalone clean document for later runs.
+    if (cache is None or filedoc is None or len(diagnostics) > 0):
+        pass
+    else:
+        cache.save(path, key, filedoc)
+    return filedoc, diagnostics, failed
+
+
+def watch(
+    doc: DirectoryDocument, *args: object, jobs: int, cache: Cache,
+    check: bool, debounce: float, **kargs: object,
+) -> None:
+    r"""
+    Keep regenerating notes of the tree whenever files change.
+
+    Args
+    ----
+    - doc
+        Document for root directory.
+    - *args
+    - jobs
+        Number of worker processes for parsing files.
+        If it is 1, files are parsed in current process.
+    - cache
+        Cache keeping parsed file documents resident.
+    - check
+        If True, only check definitions without generating notes.
+    - debounce
+        Quiet time in seconds to end a burst of changes.
+    - **kargs
+
+    Returns
+    -------
+
+    Only changed files are parsed again, and only directories whose sources
+    or supers change are noted again.
+    It runs until it is interrupted from keyboard.
+    """
+    # Rebuild after every burst of changes.
+    observer = watcher(doc.PATH, interval=debounce)
+    try:
+        while (True):
+            # Watching continues even if a rebuild stops at a diagnostic.
+            try:
+                doc.parse(jobs=jobs, cache=cache, check=check, files=None)
+            except RuntimeError:
+                pass
+            summary()
+            clear()
+
+            # Wait for next burst of changes.
+            info1("Watch \"{:s}\" for changes.", doc.PATH)
+            changes = observer.wait(debounce=debounce)
+            info1("Rebuild for {:d} changed paths.", len(changes))
+    except KeyboardInterrupt:
+        info1("Stop watching.")
+    finally:
+        observer.close()
+
+
+def serve(
+    doc: DirectoryDocument, *args: object, jobs: int, cache: Cache,
+    path: str, timeout: float, **kargs: object,
+) -> None:
+    r"""
+    Serve lint and render requests on a Unix domain socket.
+
+    Args
+    ----
+    - doc
+        Document for root directory.
+    - *args
+    - jobs
+        Number of worker processes for parsing files.
+        If it is 1, files are parsed in current process.
+    - cache
+        Cache keeping parsed file documents resident.
+    - path
+        Path of the socket.
+    - timeout
+        Seconds a connection can wait for its next request.
+    - **kargs
+
+    Returns
+    -------
+
+    A lint request checks selected files or the whole tree, and a render
+    request regenerates all notes.
+    Both of them respond with diagnostics, and only changed files are parsed
+    again.
+    A render request also responds with README counts only if it is not
+    stopped by a diagnostic.
+    """
+    def handle(
+        request: Dict[str, Any], *args: object, **kargs: object,
+    ) -> Dict[str, Any]:
+        r"""
+        Handle a request.
+
+        Args
+        ----
+        - request
+            Request.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - response
+            Response.
+
+        """
+        # Get the method, and selected files should be a list of paths.
+        if (request["method"] == "lint"):
+            check = True
+            files = request.get("files", None)
+            if (files is None):
+                pass
+            elif (
+                not isinstance(files, list) or
+                not all(isinstance(itr, str) for itr in files)
+            ):
+                return {"ok": False, "error": "files should be a path list"}
+            else:
+                pass
+        elif (request["method"] == "render"):
+            check = False
+            files = None
+        else:
+            return {"ok": False, "error": "unknown method"}
+
+        # Run and collect diagnostics even if it stops at one of them.
+        clear()
+        start = time.perf_counter()
+        try:
+            doc.parse(jobs=jobs, cache=cache, check=check, files=files)
+            stopped = False
+        except RuntimeError:
+            stopped = True
+        except Exception as err:
+            # Unexpected failure only fails the request.
+            return {
+                "ok": False, "error": "{:s}: {:s}".format(
+                    type(err).__name__, str(err),
+                ),
+            }
+        diagnostics = [itr.serialize() for itr in since(start=0)]
+        response: Dict[str, Any] = {
+            "ok": len(diagnostics) == 0, "diagnostics": diagnostics,
+            "seconds": time.perf_counter() - start,
+        }
+        if (check or stopped):
+            # README counts only exist for a finished render.
+            pass
+        else:
+            response["readmes"] = getattr(doc, "readmes")
+            response["changed"] = getattr(doc, "changed")
+        return response
+
+    # Serve until shutdown or interruption.
+    server = Server(path, timeout=timeout)
+    info1("Serve \"{:s}\" on \"{:s}\".", doc.PATH, path)
+    try:
+        server.serve(handle)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    info1("Stop serving.")
+
+    # Diagnostics are already responded.
+    clear()
+
+
+def settings(
+    *args: object, config: Config, rules: List[str], **kargs: object,
+) -> List[str]:
+    r"""
+    Get settings changing parsed documents.
+
+    Args
+    ----
+    - *args
+    - config
+        Configuration of the repository.
+    - rules
+        Imported modules registering extra line rules.
+    - **kargs
+
+    Returns
+    -------
+    - settings
+        Settings as strings.
+
+    Cache keys fold these settings, since lazy parsing and recoverability
+    verification level change what is checked, and configuration changes
+    what is expected.
+    Extra line rules are folded by their module names and sources, since
+    they are only applied when a file is parsed.
+    """
+    # Collect parsing modes and configuration.
+    buf = [
+        "lazy={}".format(LAZY), "recover={:s}".format(recovering()),
+        "root={:s}".format(config.ROOT), "github={:s}".format(config.GITHUB),
+        "project={:s}".format(config.PROJECT),
+        "standalone={:s}".format(",".join(config.STANDALONE)),
+    ]
+
+    # Collect extra line rule modules.
+    for itr in rules:
+        path = getattr(sys.modules[itr], "__file__", None)
+        if (path is None):
+            content = b""
+        else:
+            file = open(path, "rb")
+            content = file.read()
+            file.close()
+        buf.append("rule={:s}:{:s}".format(itr, fingerprint([content])))
+    return buf
+
+
+def instrumentize(*args: object, **kargs: object) -> None:
+    r"""
+    Instrument stages, document classes and files.
+
+    Args
+    ----
+    - *args
+    - **kargs
+
+    Returns
+    -------
+
+    Only current process is instrumented, thus it should work with a single
+    job.
+    """
+    # Instrument stages of code scanner.
+    module = sys.modules[__name__]
+    for attr in (
+        "load_buffer", "load_texts", "rule_texts", "review", "recoverable",
+    ):
+        wrap(Code, attr, kind="stage", name="Code.{:s}".format(attr))
+
+    # Instrument stages of notes.
+    wrap(
+        module, "func_consistency", kind="stage", name="func_consistency",
+    )
+    wrap(
+        DirectoryDocument, "notes", kind="stage",
+        name="DirectoryDocument.notes",
+    )
+    wrap(ReadmeWriter, "write", kind="stage", name="ReadmeWriter.write")
+    wrap(ReadmeWriter, "close", kind="stage", name="ReadmeWriter.close")
+
+    # Instrument parsing and notes of every code document class.
+    classes = [CodeDocument]
+    while (len(classes) > 0):
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+        for attr in ("parse", "notes", "materialize"):
+            if (attr in cls.__dict__):
+                wrap(
+                    cls, attr, kind="document",
+                    name="{:s}.{:s}".format(cls.__name__, attr),
+                )
+            else:
+                pass
+
+    # Instrument files by their paths.
+    wrap(module, "parse_file", kind="file", name="")
+    wrap(FileDocument, "notes", kind="file", name="")
+
+
+# Precompiled patterns of Github header reference behavior.
+STYLE = re.compile(r"\033\[[^m]+m")
+IGNORE = re.compile(r"(\.|/)")
+ESCAPE = re.compile(r"\\_")
+CONCAT = re.compile(r"[^\w]+")
+
+
+# Recently used Github header references and maximum number of them.
+REFERS: collections.OrderedDict[str, str] = collections.OrderedDict()
+REFERS_MAX = 4096
+
+
+def toc(notes: List[str], *args: object, **kargs: object) -> List[str]:
+    r"""
+    Generate table of content from given notes.
+
+    Args
+    ----
+    - notes
+        Notes.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - toc
+        Notes for table of content.
+
+    """
+    # Collect headers and render.
+    return render_toc(collect_headers(notes))
+
+
+def collect_headers(
+    notes: List[str], *args: object, **kargs: object,
+) -> List[Tuple[int, str, str]]:
     r"""
-    Generate table of content from given notes.
+    Collect headers from given notes.
 
     Args
     ----
@@ -493,32 +1401,52 @@ def toc(notes: List[str], *args: object, **kargs: object) -> List[str]:
 
     Returns
     -------
-    - toc
-        Notes for table of content.
+    - headers
+        A list of levels, texts and Github references of headers.
 
     """
     # Registrate all headers by Github header reference behavior.
     headers: List[Tuple[int, str, str]] = []
-    has_file = False
-    has_section = False
     for itr in notes:
         # Header level matters.
-        level = 0
-        while (level < len(itr) and itr[level] == "#"):
-            level += 1
-        if (level == 0):
-            continue
-        else:
+        if (len(itr) > 0 and itr[0] == "#"):
             pass
+        else:
+            continue
+        level = len(itr) - len(itr.lstrip("#"))
 
         # Get header text.
         text = itr[level + 1:]
-        refer = text
 
         # Github reference ignores colorful ASCII even in console.
-        refer = re.sub(r"\033\[[^m]+m", "", refer)
-        refer = github_header(refer)
+        refer = github_header(STYLE.sub("", text))
         headers.append((level, text, refer))
+    return headers
+
+
+def render_toc(
+    headers: List[Tuple[int, str, str]], *args: object, **kargs: object,
+) -> List[str]:
+    r"""
+    Render table of content from given headers.
+
+    Args
+    ----
+    - headers
+        A list of levels, texts and Github references of headers.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - toc
+        Notes for table of content.
+
+    """
+    # Indentation depends on existence of file and section headers.
+    has_file = False
+    has_section = False
+    for _, _, refer in headers:
         if (len(refer) > 5 and refer[0:5] == "file-"):
             has_file = True
         elif (len(refer) > 8 and refer[0:8] == "section-"):
@@ -559,18 +1487,141 @@ def github_header(text: str, *args: object, **kargs: object) -> str:
         Reference text.
 
     """
+    # Reuse recently used reference.
+    if (text in REFERS):
+        REFERS.move_to_end(text)
+        return REFERS[text]
+    else:
+        pass
+
     # Github reference ignores "." or "/".
     refer = text
-    refer = re.sub(r"(\.|/)", "", refer).strip()
+    refer = IGNORE.sub("", refer).strip()
 
     # Github reference replaces escape characters.
-    refer = re.sub(r"\\_", "_", refer)
+    refer = ESCAPE.sub("_", refer)
 
     # Github reference should be lower case concatenated by "-".
-    refer = re.sub(r"[^\w]+", "-", refer.lower())
+    refer = CONCAT.sub("-", refer.lower())
+
+    # Remember reference, and forget the least recently used one if there
+    # are too many.
+    REFERS[text] = refer
+    if (len(REFERS) > REFERS_MAX):
+        REFERS.popitem(last=False)
+    else:
+        pass
     return refer
 
 
+class ReadmeWriter(object):
+    r"""
+    Streaming writer of README.
+    """
+    def __init__(
+        self: ReadmeWriter, path: str, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - path
+            Path of README.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Save necessary attributes.
+        self.PATH = path
+
+        # Notes are streamed into a temporary body, and only their headers
+        # are kept for table of content.
+        self.body = tempfile.TemporaryFile("w+")
+        self.headers: List[Tuple[int, str, str]] = []
+
+    def write(
+        self: ReadmeWriter, notes: List[str], *args: object,
+        headers: List[Tuple[int, str, str]], **kargs: object,
+    ) -> None:
+        r"""
+        Write notes.
+
+        Args
+        ----
+        - self
+        - notes
+            Notes.
+        - *args
+        - headers
+            Headers already collected from notes.
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Every chunk follows table of content or previous chunk.
+        self.body.write("\n")
+        self.body.write("\n".join(notes))
+        self.headers.extend(headers)
+
+    def close(
+        self: ReadmeWriter, *args: object, save: bool, **kargs: object,
+    ) -> bool:
+        r"""
+        Close writer.
+
+        Args
+        ----
+        - self
+        - *args
+        - save
+            If True, README is saved.
+            Otherwise, everything written is discarded.
+        - **kargs
+
+        Returns
+        -------
+        - changed
+            If True, README is changed.
+
+        Table of content is written before the body into a temporary file,
+        which then replaces README, thus README is never half written.
+        README with the same content is kept untouched.
+        """
+        # Discard directly.
+        if (save):
+            pass
+        else:
+            self.body.close()
+            return False
+
+        # Splice table of content and body.
+        temp = "{:s}.{:d}".format(self.PATH, os.getpid())
+        file = open(temp, "w")
+        file.write("\n".join(render_toc(self.headers)))
+        self.body.seek(0)
+        shutil.copyfileobj(self.body, file)
+        file.close()
+        self.body.close()
+
+        # Only replace README with different content.
+        if (
+            os.path.isfile(self.PATH) and
+            filecmp.cmp(temp, self.PATH, shallow=False)
+        ):
+            os.remove(temp)
+            return False
+        else:
+            os.replace(temp, self.PATH)
+            return True
+
+
 # =============================================================================
 # *****************************************************************************
 # -----------------------------------------------------------------------------
@@ -589,6 +1640,36 @@ BLOCK = 3
 BRANCH = 4
 
 
+# Lazy parsing status.
+LAZY = False
+
+
+def update_lazy(*args: object, val: bool, **kargs: object) -> None:
+    r"""
+    Update lazy parsing status.
+
+    Args
+    ----
+    - *args
+    - val
+        Lazy parsing status.
+    - **kargs
+
+    Returns
+    -------
+
+    In lazy parsing, a function definition is only outlined by its name and
+    row range, and it is materialized when its notes or checks are required.
+    Every outlined definition of a file is still materialized before notes
+    or checks of the file finish, thus no review is skipped.
+    Row range is found by blank line layout, thus a file breaking the layout
+    may be diagnosed differently from eager parsing.
+    """
+    # Replace directly.
+    global LAZY
+    LAZY = val
+
+
 class CodeDocument(Document):
     r"""
     Document for code prototype.
@@ -703,15 +1784,8 @@ class ModuleDocument(CodeDocument):
         -------
 
         """
-        # Define constant code text.
-        text = (
-            "# Add development library to path.\n" \
-            "if (os.path.basename(os.getcwd()) == \"MLRepo\"):\n" \
-            "    sys.path.append(os.path.join(\".\"))\n" \
-            "else:\n" \
-            "    print(\"Code must strictly work in \\\"MLRepo\\\".\")\n" \
-            "    exit()"
-        )
+        # Define constant code texts.
+        texts = self.FILEDOC.CONFIG.adding(self.FILEDOC.PATH)
 
         # Modules are constant.
         self.future = ImportBlockDocument(
@@ -728,7 +1802,7 @@ class ModuleDocument(CodeDocument):
         )
         self.adding = ConstBlockDocument(
             level=self.LEVEL, hierarchy=self.HIERARCHY, superior=self,
-            filedoc=self.FILEDOC, constant=text,
+            filedoc=self.FILEDOC, constants=texts,
         )
         self.logging = ImportBlockDocument(
             level=self.LEVEL, hierarchy=self.HIERARCHY, superior=self,
@@ -739,6 +1813,15 @@ class ModuleDocument(CodeDocument):
             filedoc=self.FILEDOC,
         )
 
+        # Standalone module has only standard library import blocks.
+        self.STANDALONE = self.FILEDOC.ME in self.FILEDOC.CONFIG.STANDALONE
+        self.blocks: List[CodeDocument] = [
+            self.future, self.typing, self.python,
+        ]
+        self.imports: List[ImportBlockDocument] = [
+            self.future, self.typing, self.python,
+        ]
+
         # Allocate buffer to trace imports.
         self.modules: Dict[str, List[str]] = {}
         self.identifiers: Dict[str, str] = {}
@@ -771,56 +1854,70 @@ class ModuleDocument(CodeDocument):
         self.typing.parse(self.code)
         self.code.blank_next(1)
         self.python.parse(self.code)
-        self.code.blank_next(1)
-        self.adding.parse(self.code)
-        self.code.blank_next(1)
-        self.logging.parse(self.code)
-        self.code.blank_next(1)
-        self.develop.parse(self.code)
+
+        # Standalone module stops after standard library imports.
+        if (self.STANDALONE):
+            pass
+        else:
+            self.code.blank_next(1)
+            self.adding.parse(self.code)
+            self.code.blank_next(1)
+            self.logging.parse(self.code)
+            self.code.blank_next(1)
+            self.develop.parse(self.code)
+            self.blocks.extend([self.adding, self.logging, self.develop])
+            self.imports.extend([self.logging, self.develop])
 
         # Some import blocks are strictly required.
-        assert (
-            len(self.future.comment.paragraphs) == 1 and
-            len(self.future.comment.paragraphs[0]) == 1 and
-            self.future.comment.paragraphs[0][0] == "Import future."
-        )
-        assert (
-            len(self.typing.comment.paragraphs) == 1 and
-            len(self.typing.comment.paragraphs[0]) == 1 and
-            self.typing.comment.paragraphs[0][0] == "Import typing."
-        )
-        assert (
-            len(self.python.comment.paragraphs) == 1 and
-            len(self.python.comment.paragraphs[0]) == 1 and
-            self.python.comment.paragraphs[0][0] == "Import dependencies."
-        )
-        assert (
-            len(self.logging.comment.paragraphs) == 1 and
-            len(self.logging.comment.paragraphs[0]) == 1 and
-            self.logging.comment.paragraphs[0][0] == "Import logging."
-        )
-        assert (
-            len(self.develop.comment.paragraphs) == 1 and
-            len(self.develop.comment.paragraphs[0]) == 1 and
-            self.develop.comment.paragraphs[0][0] == "Import dependencies."
-        )
+        for child, title in (
+            (self.future, "Import future."),
+            (self.typing, "Import typing."),
+            (self.python, "Import dependencies."),
+            (self.logging, "Import logging."),
+            (self.develop, "Import dependencies."),
+        ):
+            if (
+                child not in self.imports or
+                child.comment.paragraphs == [[title]]
+            ):
+                pass
+            else:
+                report(
+                    self.FILEDOC.PATH, row=child.row, column=-1,
+                    rule="import-block",
+                    message="import block requires only comment" \
+                    " \"{:s}\"".format(title),
+                )
 
         # Some import commands are strictly required.
-        assert (
+        if (
             len(self.future.statements) == 1 and
             self.future.check(0, "from __future__ import annotations")
-        )
-        assert (
+        ):
+            pass
+        else:
+            report(
+                self.FILEDOC.PATH, row=self.future.row, column=-1,
+                rule="import-command",
+                message="future import requires only annotations",
+            )
+        if (
             len(self.typing.statements) > 1 and
             self.typing.check(0, "from typing import Any") and
             self.typing.check(1, "from typing import Tuple as MultiReturn")
-        )
-
-        # Some import commands are required except for some files.
-        if (self.FILEDOC.ME == "pytorch.logging"):
+        ):
             pass
         else:
-            assert (
+            report(
+                self.FILEDOC.PATH, row=self.typing.row, column=-1,
+                rule="import-command",
+                message="typing import requires \"Any\" and" \
+                " \"MultiReturn\" first",
+            )
+
+        # Some import commands are required except for some files.
+        if (
+            self.STANDALONE or self.FILEDOC.ME == "pytorch.logging" or (
                 len(self.logging.statements) > 0 and
                 self.logging.check(
                     0,
@@ -828,11 +1925,17 @@ class ModuleDocument(CodeDocument):
                     ", warning, error",
                 )
             )
+        ):
+            pass
+        else:
+            report(
+                self.FILEDOC.PATH, row=self.logging.row, column=-1,
+                rule="import-command",
+                message="logging import requires all logging functions",
+            )
 
         # Merge all imports.
-        for child in (
-            self.future, self.typing, self.python, self.logging, self.develop,
-        ):
+        for child in self.imports:
             for name, members in child.modules.items():
                 if (name in self.modules):
                     pass
@@ -871,10 +1974,7 @@ class ModuleDocument(CodeDocument):
         # Import block just integrates its children notes with blank breaks.
         self.markdown.append("")
         self.markdown.append("  > ```python")
-        for child in (
-            self.future, self.typing, self.python, self.adding, self.logging,
-            self.develop,
-        ):
+        for child in self.blocks:
             child.notes()
             for itr in child.markdown:
                 if (len(itr) == 0):
@@ -885,10 +1985,7 @@ class ModuleDocument(CodeDocument):
         self.markdown[-1] = "  > ```"
 
         # Clear children notes for memory efficency.
-        for child in (
-            self.future, self.typing, self.python, self.adding, self.logging,
-            self.develop,
-        ):
+        for child in self.blocks:
             child.markdown.clear()
 
 
@@ -985,7 +2082,7 @@ class GlobalDocument(CodeDocument):
 
         # Clear children notes for memory efficency.
         for intro, series in self.sections:
-            intro.notes()
+            intro.markdown.clear()
             series.markdown.clear()
 
 
@@ -1193,10 +2290,9 @@ class ClassDocument(CodeDocument):
         if (self.HIERARCHY == GLOBAL):
             hierarchy = CLASS
         else:
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " class is limited to be global level.",
-                self.FILEDOC.PATH, "line {:d}".format(self.row),
+            report(
+                self.FILEDOC.PATH, row=self.row, column=-1, rule="class-level",
+                message="class is limited to be global level",
             )
             raise RuntimeError
 
@@ -1276,32 +2372,8 @@ class ClassDocument(CodeDocument):
         For most part of the notes, they will share the same Markdown syntex
         except that console notes will use ASCII color codes for some keywords.
         """
-        # Get imported global variables sorted by inverse length.
-        knowns = sorted(
-            getattr(self.FILEDOC.ROOTDOC, "classes").keys(),
-            key=lambda x: -len(x),
-        )
-
-        # Find the first variable matching the super name.
-        for itr in knowns:
-            if (itr in self.super):
-                modname = self.FILEDOC.modules.mapping[itr]
-                dirpath = os.path.join(
-                    self.FILEDOC.FOLDER, *modname.split(".")[:-1],
-                )
-                classname = self.super[len(modname) + 1:]
-                break
-            else:
-                modname = ""
-                dirpath = ""
-                classname = self.super
-        if (len(modname) == 0 and classname in self.FILEDOC.classes):
-            modname = self.FILEDOC.ME
-            dirpath = self.FILEDOC.ROOTDOC.PATH
-        else:
-            pass
-
         # Locate the super.
+        modname, dirpath, classname = self.locate()
         if (len(modname) == 0):
             # Python class has no reference.
             link = self.super
@@ -1312,21 +2384,20 @@ class ClassDocument(CodeDocument):
             refer = github_header(refer)
             link = "[{:s}](#{:s})".format(full, refer)
         else:
-            # Get Github page.
-            print(dirpath, modname, classname)
-            raise NotImplementedError
-
-        # Check inheritance.
-        if (len(modname) > 0):
+            # Get reference in README of another directory.
             full = "{:s}.{:s}".format(modname, classname)
-            superdoc = getattr(self.FILEDOC.ROOTDOC, "classdocs")[full]
-            self.check_inheritance(
-                superdoc,
-                myname="{:s}.{:s}".format(self.FILEDOC.ME, self.name),
-                suname=full,
+            refer = "Class: {:s}".format(full)
+            refer = github_header(refer)
+            page = os.path.relpath(
+                os.path.join(dirpath, "README.md"), self.FILEDOC.CONFIG.ROOT,
             )
-        else:
-            pass
+            page = os.path.join(
+                self.FILEDOC.CONFIG.GITHUB, "blob", "master", page,
+            )
+            link = "[{:s}]({:s}#{:s})".format(full, page, refer)
+
+        # Check inheritance.
+        self.check()
 
         # Title is class name.
         self.markdown.extend(["---", ""])
@@ -1336,7 +2407,7 @@ class ClassDocument(CodeDocument):
 
         # Super link to source code is required.
         source = os.path.join(
-            self.FILEDOC.GITHUB, "blob", "master", self.FILEDOC.PATH,
+            self.FILEDOC.CONFIG.GITHUB, "blob", "master", self.FILEDOC.PATH,
         )
         source = "{:s}#L{:d}".format(source, self.row)
         self.markdown.append("")
@@ -1361,32 +2432,178 @@ class ClassDocument(CodeDocument):
             ),
         )
 
-        # Get body note as a code block
-        self.body.notes()
-        buf = []
-        for itr in self.body.markdown:
-            if (len(itr) == 0 or itr[0] != "#"):
-                buf.append(itr)
-            elif (itr[3] in ("F", "B")):
-                buf.append("#" + itr)
-            else:
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " class can only documentize functions and blocks.",
-                    self.FILEDOC.PATH, "line {:d}".format(self.row),
-                )
-                raise RuntimeError
-        self.markdown.append("")
-        self.markdown.append("- Members:")
-        self.markdown.extend(toc(buf)[2:])
-        self.markdown.append("")
-        self.markdown.extend(buf)
+        # Get body note as a code block
+        self.body.notes()
+        buf = []
+        for itr in self.body.markdown:
+            if (len(itr) == 0 or itr[0] != "#"):
+                buf.append(itr)
+            elif (itr[3] in ("F", "B")):
+                buf.append("#" + itr)
+            else:
+                report(
+                    self.FILEDOC.PATH, row=self.row, column=-1,
+                    rule="class-member",
+                    message="class can only documentize functions and blocks",
+                )
+        self.markdown.append("")
+        self.markdown.append("- Members:")
+        self.markdown.extend(toc(buf)[2:])
+        self.markdown.append("")
+        self.markdown.extend(buf)
+
+        # Clear children notes for memory efficency.
+        self.body.markdown.clear()
+
+    def locate(
+        self: ClassDocument, *args: object, **kargs: object,
+    ) -> MultiReturn[str, str, str]:
+        r"""
+        Locate the super.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - modname
+            Module name of the super.
+            If it is empty, the super is a Python class.
+        - dirpath
+            Directory path of the super.
+        - classname
+            Class name of the super.
+
+        """
+        # Only indexed classes can be located.
+        full = self.resolve()
+        index = getattr(self.FILEDOC.ROOTDOC.ROOTDOC, "INDEX")
+        if (index.summary(full) is not None):
+            modname, classname = full.rsplit(".", 1)
+            dirpath = os.path.join(
+                self.FILEDOC.CONFIG.ROOT, *modname.split(".")[:-1],
+            )
+            return modname, dirpath, classname
+        else:
+            return "", "", self.super
+
+    def resolve(self: ClassDocument, *args: object, **kargs: object) -> str:
+        r"""
+        Resolve module-qualified name of the super.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - name
+            Module-qualified name of the super.
+            If it is empty, the super is neither defined in the same file nor
+            imported.
+
+        The super is resolved exactly by import records of the file.
+        """
+        # Super may be defined in the same file.
+        modules = self.FILEDOC.modules
+        if (self.super in self.FILEDOC.classes):
+            return "{:s}.{:s}".format(self.FILEDOC.ME, self.super)
+        else:
+            pass
+
+        # Super may be an imported identifier.
+        if (self.super in modules.identifiers):
+            return "{:s}.{:s}".format(
+                modules.identifiers[self.super], modules.mapping[self.super],
+            )
+        else:
+            pass
+
+        # Super may be an attribute of an imported module.
+        parts = self.super.split(".")
+        for i in range(len(parts) - 1, 0, -1):
+            head = ".".join(parts[:i])
+            if (
+                head in modules.mapping and
+                modules.mapping[head] in modules.modules
+            ):
+                return ".".join([modules.mapping[head]] + parts[i:])
+            else:
+                pass
+        return ""
+
+    def check(self: ClassDocument, *args: object, **kargs: object) -> None:
+        r"""
+        Check definitions.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        Super class is checked by its summary in class index.
+        """
+        # Check inheritance.
+        modname, _, classname = self.locate()
+        if (len(modname) > 0):
+            full = "{:s}.{:s}".format(modname, classname)
+            index = getattr(self.FILEDOC.ROOTDOC.ROOTDOC, "INDEX")
+            self.check_inheritance(
+                index.summary(full),
+                myname="{:s}.{:s}".format(self.FILEDOC.ME, self.name),
+                suname=full,
+            )
+        else:
+            pass
+
+    def summarize(
+        self: ClassDocument, *args: object, **kargs: object,
+    ) -> Dict[str, FuncSummary]:
+        r"""
+        Summarize function descriptions for class index.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - summary
+            Function summaries by function names.
 
-        # Clear children notes for memory efficency.
-        self.body.markdown.clear()
+        """
+        # Summarize all functions of the body.
+        summary = {}
+        for component in self.body.components:
+            if (isinstance(component, FunctionDocument)):
+                component.materialize()
+                description = component.description
+                summary[component.name] = FuncSummary(
+                    name=component.name, digest=description.digest,
+                    title=description.title_prints,
+                    arg_names=description.arg_names,
+                    arg_descs=description.arg_prints,
+                    return_names=description.return_names,
+                    return_descs=description.return_prints,
+                    attach=description.attach_prints,
+                )
+            else:
+                pass
+        return summary
 
     def check_inheritance(
-        self: ClassDocument, superdoc: ClassDocument, *args: object,
+        self: ClassDocument, sufuncs: Dict[str, FuncSummary], *args: object,
         myname: str, suname: str, **kargs: object,
     ) -> None:
         r"""
@@ -1395,8 +2612,8 @@ class ClassDocument(CodeDocument):
         Args
         ----
         - self
-        - superdoc
-            Document of super class.
+        - sufuncs
+            Function summaries of super class.
         - *args
         - myname
             Focusing class name.
@@ -1416,27 +2633,24 @@ class ClassDocument(CodeDocument):
             else:
                 pass
 
-        # Get functions of super.
-        self.sufuncs = {}
-        for component in superdoc.body.components:
-            if (isinstance(component, FunctionDocument)):
-                self.sufuncs[component.name] = component
-            else:
-                pass
-
-        # Get override items.
-        override = list(set(self.myfuncs.keys()) & set(self.sufuncs.keys()))
+        # Get override items in a fixed order.
+        override = sorted(set(self.myfuncs.keys()) & set(sufuncs.keys()))
 
         # Get inheritance checking items.
         for itr in override:
+            self.myfuncs[itr].materialize()
             func_consistency(
-                self.myfuncs[itr], su=self.sufuncs[itr], myname=myname,
+                self.myfuncs[itr], su=sufuncs[itr], myname=myname,
                 suname=suname,
             )
 
 
+# Pairs of description digests which are already consistent.
+CONSISTENT: Set[Tuple[str, str]] = set()
+
+
 def func_consistency(
-    my: FunctionDocument, *args: object, su: FunctionDocument,
+    my: FunctionDocument, *args: object, su: FuncSummary,
     myname: str, suname: str, **kargs: object,
 ) -> None:
     r"""
@@ -1448,7 +2662,7 @@ def func_consistency(
         Focusing class function document.
     - *args
     - su
-        Super class function document.
+        Super class function summary.
     - myname
         Focusing class name.
     - suname
@@ -1458,40 +2672,48 @@ def func_consistency(
     Returns
     -------
 
+    Paragraphs are compared by their fingerprints, and a consistent pair of
+    descriptions is remembered by their digests so that it is checked only
+    once.
     """
+    # Skip pairs which are already consistent.
+    pair = (my.description.digest, su.digest)
+    if (pair in CONSISTENT):
+        return
+    else:
+        start = count()
+
     # Get esssential items.
-    my_title = my.description.title
+    my_title = my.description.title_prints
     my_arg_names = my.description.arg_names
-    my_arg_descs = my.description.arg_descs
+    my_arg_descs = my.description.arg_prints
     my_ret_names = my.description.return_names
-    my_ret_descs = my.description.return_descs
-    my_attach = my.description.attach
-    su_title = su.description.title
-    su_arg_names = su.description.arg_names
-    su_arg_descs = su.description.arg_descs
-    su_ret_names = su.description.return_names
-    su_ret_descs = su.description.return_descs
-    su_attach = su.description.attach
+    my_ret_descs = my.description.return_prints
+    my_attach = my.description.attach_prints
+    su_title = su.title
+    su_arg_names = su.arg_names
+    su_arg_descs = su.arg_descs
+    su_ret_names = su.return_names
+    su_ret_descs = su.return_descs
+    su_attach = su.attach
 
     # Super texts should be a subset of my texts.
     if (is_subparagraphs(su_title, my_title)):
         pass
     else:
-        error(
-            "Title text of \"{:s}.{:s}\" should a subset of" \
-            " \"{:s}.{:s}\".",
-            myname, my.name, suname, su.name,
+        report(
+            my.FILEDOC.PATH, row=my.row, column=-1, rule="inheritance-subset",
+            message="title text of \"{:s}.{:s}\" should a subset of" \
+            " \"{:s}.{:s}\"".format(myname, my.name, suname, su.name),
         )
-        raise RuntimeError
     if (is_subparagraphs(su_attach, my_attach)):
         pass
     else:
-        error(
-            "Attached text of \"{:s}.{:s}\" should a subset of" \
-            " \"{:s}.{:s}\".",
-            myname, my.name, suname, su.name,
+        report(
+            my.FILEDOC.PATH, row=my.row, column=-1, rule="inheritance-subset",
+            message="attached text of \"{:s}.{:s}\" should a subset of" \
+            " \"{:s}.{:s}\"".format(myname, my.name, suname, su.name),
         )
-        raise RuntimeError
 
     # Break ordered and keyword things.
     my_arg_break = order_key_argbreak(my_arg_names)
@@ -1512,41 +2734,66 @@ def func_consistency(
     )):
         pass
     else:
-        error(
-            "Ordered argument of \"{:s}.{:s}\" should a subset of" \
-            " \"{:s}.{:s}\".",
-            myname, my.name, suname, su.name,
+        report(
+            my.FILEDOC.PATH, row=my.row, column=-1, rule="inheritance-subset",
+            message="ordered argument of \"{:s}.{:s}\" should a subset of" \
+            " \"{:s}.{:s}\"".format(myname, my.name, suname, su.name),
         )
-        raise RuntimeError
     if (is_subdefs(
         su_argkey_names, my_argkey_names,
         su_argkey_descs, my_argkey_descs,
     )):
         pass
     else:
-        error(
-            "Keyword argument of \"{:s}.{:s}\" should a subset of" \
-            " \"{:s}.{:s}\".",
-            myname, my.name, suname, su.name,
+        report(
+            my.FILEDOC.PATH, row=my.row, column=-1, rule="inheritance-subset",
+            message="keyword argument of \"{:s}.{:s}\" should a subset of" \
+            " \"{:s}.{:s}\"".format(myname, my.name, suname, su.name),
         )
-        raise RuntimeError
     if (is_subdefs(
         su_ret_names, my_ret_names,
         su_ret_descs, my_ret_descs,
     )):
         pass
     else:
-        error(
-            "Return of \"{:s}.{:s}\" should a subset of" \
-            " \"{:s}.{:s}\".",
-            myname, my.name, suname, su.name,
+        report(
+            my.FILEDOC.PATH, row=my.row, column=-1, rule="inheritance-subset",
+            message="return of \"{:s}.{:s}\" should a subset of" \
+            " \"{:s}.{:s}\"".format(myname, my.name, suname, su.name),
         )
-        raise RuntimeError
+
+    # Remember the pair only when nothing is reported.
+    if (count() == start):
+        CONSISTENT.add(pair)
+    else:
+        pass
+
+
+def fingerprint_paragraphs(
+    paragraphs: List[List[str]], *args: object, **kargs: object,
+) -> List[str]:
+    r"""
+    Get fingerprints of paragraphs.
+
+    Args
+    ----
+    - paragraphs
+        Paragraphs.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - prints
+        Fingerprints of paragraphs.
+
+    """
+    # Join words of a paragraph before hashing.
+    return [fingerprint([" ".join(itr).encode()]) for itr in paragraphs]
 
 
 def is_subparagraphs(
-    small: List[List[str]], large: List[List[str]],
-    *args: object, **kargs: object,
+    small: List[str], large: List[str], *args: object, **kargs: object,
 ) -> bool:
     r"""
     Is a subset list of paragraphs.
@@ -1554,9 +2801,9 @@ def is_subparagraphs(
     Args
     ----
     - small
-        Smaller paragraphs.
+        Fingerprints of smaller paragraphs.
     - large
-        Larger paragraphs.
+        Fingerprints of larger paragraphs.
     - *args
     - **kargs
 
@@ -1566,18 +2813,13 @@ def is_subparagraphs(
         If True, smaller one is subset of larger one.
 
     """
-    # Check line by line.
-    for i in range(len(small)):
-        if (i < len(large) and " ".join(small[i]) == " ".join(large[i])):
-            pass
-        else:
-            return False
-    return True
+    # Smaller paragraphs should be a prefix.
+    return small == large[:len(small)]
 
 
 def is_subdefs(
     small1: List[str], large1: List[str],
-    small2: List[List[List[str]]], large2: List[List[List[str]]],
+    small2: List[List[str]], large2: List[List[str]],
     *args: object, **kargs: object,
 ) -> bool:
     r"""
@@ -1590,9 +2832,9 @@ def is_subdefs(
     - large1
         Larger names.
     - small2
-        Smaller paragraphs.
+        Fingerprints of smaller paragraphs.
     - large2
-        Larger paragraphs.
+        Fingerprints of larger paragraphs.
     - *args
     - **kargs
 
@@ -1673,21 +2915,8 @@ class FunctionDocument(CodeDocument):
         -------
 
         """
-        # Hierarchy of function body may change.
-        if (self.HIERARCHY in (GLOBAL, CLASS)):
-            hierarchy = FUNCTION
-        else:
-            hierarchy = self.HIERARCHY
-
-        # Children are a description and a series of codes.
-        self.description = FuncDescDocument(
-            level=self.LEVEL + 1, hierarchy=hierarchy, superior=self,
-            filedoc=self.FILEDOC,
-        )
-        self.body = SeriesDocument(
-            level=self.LEVEL + 1, hierarchy=hierarchy, superior=self,
-            filedoc=self.FILEDOC,
-        )
+        # Children are allocated when the definition is materialized.
+        self.materialized = False
 
         # Number of blank breaks is based on hierarchy.
         self.NUM_BLANKS = 1 + int(self.HIERARCHY == GLOBAL)
@@ -1714,10 +2943,115 @@ class FunctionDocument(CodeDocument):
         CodeDocument.parse(self, code, *args, **kargs)
 
         # Get the function name.
+        self.head = self.code.scan
         obj = self.code.get()
         obj.reset()
         obj.match("def", level=self.LEVEL)
         self.name = obj.get().text
+
+        # Lazy parsing only outlines the definition.
+        if (LAZY):
+            self.outline()
+        else:
+            self.materialize()
+
+    def outline(
+        self: FunctionDocument, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Skip the definition and record its row range.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        The end of the body is found by blank lines followed by dedent rather
+        than parsing, thus it is only exact for a file following blank line
+        layout.
+        For a file breaking blank line layout, lazy parsing may skip or parse
+        different lines from eager parsing, and its diagnostics may differ.
+        """
+        # Outlined definition should be materialized by its file later.
+        self.FILEDOC.outlines.append(self)
+
+        # Header ends at the line ending the statement.
+        while (not self.code.get().memory[-1].check(token.NEWLINE)):
+            self.code.next()
+        self.code.next()
+
+        # Body components only break at blank lines, thus body ends at blank
+        # lines followed by dedent.
+        while (not self.code.eof()):
+            if (self.code.blank_top(1)):
+                end = self.code.scan
+            else:
+                self.code.next()
+                continue
+
+            # Fetch the first non-trivial line after blank lines.
+            while (not self.code.eof() and self.code.blank_top(1)):
+                self.code.next()
+            if (
+                self.code.eof() or self.code.get().level <= self.LEVEL or
+                self.code.get().text == "# " + "=" * (MAX - 2)
+            ):
+                self.code.scan = end
+                break
+            else:
+                pass
+        self.tail = self.code.scan
+
+    def materialize(
+        self: FunctionDocument, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Parse details of the definition.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        It only parses once, and scanning position is kept if the definition is
+        already outlined.
+        """
+        # Parse only once.
+        if (self.materialized):
+            return
+        else:
+            self.materialized = True
+
+        # Hierarchy of function body may change.
+        if (self.HIERARCHY in (GLOBAL, CLASS)):
+            hierarchy = FUNCTION
+        else:
+            hierarchy = self.HIERARCHY
+
+        # Children are a description and a series of codes.
+        self.description = FuncDescDocument(
+            level=self.LEVEL + 1, hierarchy=hierarchy, superior=self,
+            filedoc=self.FILEDOC,
+        )
+        self.body = SeriesDocument(
+            level=self.LEVEL + 1, hierarchy=hierarchy, superior=self,
+            filedoc=self.FILEDOC,
+        )
+
+        # Parse from the definition head.
+        resume = self.code.scan
+        self.code.scan = self.head
+        obj = self.code.get()
+        obj.reset()
+        obj.match("def", level=self.LEVEL)
         obj.match(token.NAME, level=self.LEVEL)
 
         # Get the arguments.
@@ -1743,6 +3077,12 @@ class FunctionDocument(CodeDocument):
         self.description.review(argdoc, returndoc)
         self.body.parse(self.code)
 
+        # Resume scanning of outlined definition.
+        if (resume == self.head):
+            pass
+        else:
+            self.code.scan = resume
+
     def notes(self: FunctionDocument, *args: object, **kargs: object) -> None:
         r"""
         Generate notes.
@@ -1767,6 +3107,7 @@ class FunctionDocument(CodeDocument):
             self.markdown.append("def {:s}(...):".format(self.name))
             self.markdown.append("{:s}...;".format(" " * UNIT))
             return
+        self.materialize()
 
         # Title is function name.
         self.markdown.extend(["---", ""])
@@ -1782,7 +3123,7 @@ class FunctionDocument(CodeDocument):
 
         # Super link to source code is required.
         source = os.path.join(
-            self.FILEDOC.GITHUB, "blob", "master", self.FILEDOC.PATH,
+            self.FILEDOC.CONFIG.GITHUB, "blob", "master", self.FILEDOC.PATH,
         )
         source = "{:s}#L{:d}".format(source, self.row)
         self.markdown.append("")
@@ -2020,7 +3361,7 @@ class OPBlockDocument(CodeDocument):
 
         # Super link to source code is required.
         source = os.path.join(
-            self.FILEDOC.GITHUB, "blob", "master", self.FILEDOC.PATH,
+            self.FILEDOC.CONFIG.GITHUB, "blob", "master", self.FILEDOC.PATH,
         )
         source = "{:s}#L{:d}".format(source, self.row)
         self.markdown.append("")
@@ -2123,19 +3464,17 @@ class TypeHintDocument(CodeDocument):
         self.name = self.parse_type(obj)
 
         # Get children type hint if it exists.
-        if (obj.check("[", level=self.LEVEL)):
+        if (obj.expect_text("[", self.LEVEL)):
             pass
         else:
             return
 
         # Match left.
-        obj.match("[", level=self.LEVEL)
-        if (obj.check(token.NL, level=self.LEVEL)):
+        obj.take_text("[", self.LEVEL)
+        if (obj.expect_type(token.NL, self.LEVEL)):
             multiple = True
-            obj.match(token.NL, level=self.LEVEL)
-            self.code.next()
-            obj = self.code.get()
-            obj.reset()
+            obj.take_type(token.NL, self.LEVEL)
+            obj = self.code.next_line()
         else:
             multiple = False
 
@@ -2143,7 +3482,7 @@ class TypeHintDocument(CodeDocument):
         level2 = self.LEVEL + int(multiple)
         while (not self.code.eof()):
             # Right means ending.
-            if (obj.check("]", level=self.LEVEL)):
+            if (obj.expect_text("]", self.LEVEL)):
                 break
             else:
                 pass
@@ -2157,22 +3496,20 @@ class TypeHintDocument(CodeDocument):
             self.children.append(hint)
 
             # Get break.
-            if (obj.check("]", level=self.LEVEL)):
+            if (obj.expect_text("]", self.LEVEL)):
                 break
             else:
-                obj.match(",", level=level2)
+                obj.take_text(",", level2)
 
             # May reach the end of a line.
-            if (obj.check(token.NL, level=level2)):
-                obj.match(token.NL, level=level2)
-                self.code.next()
-                obj = self.code.get()
-                obj.reset()
+            if (obj.expect_type(token.NL, level2)):
+                obj.take_type(token.NL, level2)
+                obj = self.code.next_line()
             else:
                 pass
 
         # Match right.
-        obj.match("]", level=self.LEVEL)
+        obj.take_text("]", self.LEVEL)
 
     def parse_type(
         self: TypeHintDocument, line: Line, *args: object, **kargs: object,
@@ -2195,12 +3532,10 @@ class TypeHintDocument(CodeDocument):
 
         """
         # Module is a list of names concatenated by ".".
-        buf = [line.get().text]
-        line.match(token.NAME, level=self.LEVEL)
-        while (line.check(".", level=self.LEVEL)):
-            line.match(".", level=self.LEVEL)
-            buf.append(line.get().text)
-            line.match(token.NAME, level=self.LEVEL)
+        buf = [line.take_type(token.NAME, self.LEVEL)]
+        while (line.expect_text(".", self.LEVEL)):
+            line.take_text(".", self.LEVEL)
+            buf.append(line.take_type(token.NAME, self.LEVEL))
         return ".".join(buf)
 
     def text(self: TypeHintDocument, *args: object, **kargs: object) -> str:
@@ -2312,12 +3647,10 @@ class ArgumentDocument(CodeDocument):
 
         # Match left.
         obj = self.code.get()
-        obj.match("(", level=self.LEVEL)
+        obj.take_text("(", self.LEVEL)
         if (self.MULTIPLE):
-            obj.match(token.NL, level=self.LEVEL)
-            self.code.next()
-            obj = self.code.get()
-            obj.reset()
+            obj.take_type(token.NL, self.LEVEL)
+            obj = self.code.next_line()
         else:
             pass
 
@@ -2325,28 +3658,27 @@ class ArgumentDocument(CodeDocument):
         level2 = self.LEVEL + int(self.MULTIPLE)
         while (not self.code.eof()):
             # Right means ending.
-            if (obj.check(")", level=self.LEVEL)):
+            if (obj.expect_text(")", self.LEVEL)):
                 break
             else:
                 pass
 
             # It is possible to have "*args" and "**kargs".
-            if (obj.check("*", level=level2)):
+            if (obj.expect_text("*", level2)):
                 prefix = "*"
-                obj.match("*", level=level2)
-            elif (obj.check("**", level=level2)):
+                obj.take_text("*", level2)
+            elif (obj.expect_text("**", level2)):
                 prefix = "**"
-                obj.match("**", level=level2)
+                obj.take_text("**", level2)
             else:
                 prefix = ""
 
             # Get argument name.
-            suffix = obj.get().text
-            obj.match(token.NAME, level=level2)
+            suffix = obj.take_type(token.NAME, level2)
             name = prefix + suffix
 
             # Get type hint.
-            obj.match(":", level=level2)
+            obj.take_text(":", level2)
             hint = TypeHintDocument(
                 level=level2, hierarchy=self.HIERARCHY, superior=self,
                 filedoc=self.FILEDOC,
@@ -2355,22 +3687,20 @@ class ArgumentDocument(CodeDocument):
             self.items.append((name, hint))
 
             # Get break.
-            if (obj.check(")", level=self.LEVEL)):
+            if (obj.expect_text(")", self.LEVEL)):
                 break
             else:
-                obj.match(",", level=level2)
+                obj.take_text(",", level2)
 
             # May reach the end of a line.
-            if (obj.check(token.NL, level=level2)):
-                obj.match(token.NL, level=level2)
-                self.code.next()
-                obj = self.code.get()
-                obj.reset()
+            if (obj.expect_type(token.NL, level2)):
+                obj.take_type(token.NL, level2)
+                obj = self.code.next_line()
             else:
                 pass
 
         # Match right.
-        obj.match(")", level=self.LEVEL)
+        obj.take_text(")", self.LEVEL)
 
 
 # =============================================================================
@@ -2634,7 +3964,7 @@ class ConstBlockDocument(CodeDocument):
         self: ConstBlockDocument, *args: object,
         level: int, hierarchy: int,
         superior: Union[CodeDocument, None], filedoc: FileDocument,
-        constant: str, **kargs: object,
+        constants: List[str], **kargs: object,
     ) -> None:
         r"""
         Initialize.
@@ -2651,8 +3981,9 @@ class ConstBlockDocument(CodeDocument):
             Superior code document.
         - filedoc
             Document of the file of the code.
-        - constant
-            Constant code text.
+        - constants
+            Accepted constant code texts.
+            The first one is preferred.
         - **kargs
 
         Returns
@@ -2666,7 +3997,7 @@ class ConstBlockDocument(CodeDocument):
         )
 
         # Save necessary attributes.
-        self.CONSTANT = constant.split("\n")
+        self.CONSTANTS = [itr.split("\n") for itr in constants]
 
     def allocate(
         self: ConstBlockDocument, *args: object, **kargs: object,
@@ -2708,21 +4039,24 @@ class ConstBlockDocument(CodeDocument):
         # Super.
         CodeDocument.parse(self, code, *args, **kargs)
 
-        # Get current line.
-        for i, itr in enumerate(self.CONSTANT):
+        # Match constant texts line by line until one of them is finished.
+        candidates = self.CONSTANTS
+        for i in range(max(len(itr) for itr in candidates)):
             # Get current line.
             obj = self.code.get()
 
-            # Directly match the constant text with current line.
-            if (obj.text == itr):
+            # Keep constant texts matching current line.
+            matches = [itr for itr in candidates if itr[i] == obj.text]
+            if (len(matches) > 0):
                 pass
             else:
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " expect\n\"\"\"\n{:s}\n\"\"\", but" \
-                    " get\n\"\"\"\n{:s}\"\"\".",
-                    self.FILEDOC.PATH, "line {:d}".format(obj.row),
-                    itr, obj.text,
+                report(
+                    self.FILEDOC.PATH, row=obj.row, column=-1,
+                    rule="constant-block",
+                    message="expect\n\"\"\"\n{:s}\n\"\"\", but" \
+                    " get\n\"\"\"\n{:s}\"\"\"".format(
+                        candidates[0][i], obj.text,
+                    ),
                 )
                 raise RuntimeError
 
@@ -2730,6 +4064,12 @@ class ConstBlockDocument(CodeDocument):
             self.memory.append(obj)
             self.code.next()
 
+            # Stop when a matching constant text is finished.
+            if (any(len(itr) == i + 1 for itr in matches)):
+                break
+            else:
+                candidates = matches
+
     def notes(
         self: ConstBlockDocument, *args: object, **kargs: object,
     ) -> None:
@@ -2857,16 +4197,9 @@ class CommentDocument(CodeDocument):
 
         """
         # Translate parsed text into paragraphs.
-        try:
-            self.paragraphs = paragraphize(texts)
-        except:
-            # Extend paragraph error report.
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " fail to translate paragraphs.",
-                self.FILEDOC.PATH, "line {:d}".format(self.row),
-            )
-            raise RuntimeError
+        self.paragraphs = paragraphize(
+            texts, path=self.FILEDOC.PATH, row=self.row,
+        )
 
     def notes(self: CommentDocument, *args: object, **kargs: object) -> None:
         r"""
@@ -2963,13 +4296,13 @@ class ImportDocument(CodeDocument):
         """
         # First word is fixed.
         self.type = "import"
-        line.match("import", level=self.LEVEL)
+        line.take_text("import", self.LEVEL)
 
         # Match the module name.
         module = self.parse_module(line)
         rename = self.parse_rename(line)
         self.append_module(module, rename)
-        line.match(token.NEWLINE, level=self.LEVEL)
+        line.take_type(token.NEWLINE, self.LEVEL)
 
     def parse_from(
         self: ImportDocument, line: Line, *args: object, **kargs: object,
@@ -2991,27 +4324,27 @@ class ImportDocument(CodeDocument):
         """
         # First word is fixed.
         self.type = "from"
-        line.match("from", level=self.LEVEL)
+        line.take_text("from", self.LEVEL)
 
         # Match the module name.
         module = self.parse_module(line)
 
         # Next word is fixed.
-        line.match("import", level=self.LEVEL)
+        line.take_text("import", self.LEVEL)
 
         # Match identifiers until the end of the line.
         first = True
         while (not line.eol()):
             if (first):
                 first = False
-            elif (line.check(",", level=self.LEVEL)):
-                line.match(",", level=self.LEVEL)
+            elif (line.expect_text(",", self.LEVEL)):
+                line.take_text(",", self.LEVEL)
             else:
                 break
             identifier = self.parse_identifier(line)
             rename = self.parse_rename(line)
             self.append_identifier(identifier, rename, module=module)
-        line.match(token.NEWLINE, level=self.LEVEL)
+        line.take_type(token.NEWLINE, self.LEVEL)
 
     def parse_module(
         self: ImportDocument, line: Line, *args: object, **kargs: object,
@@ -3034,12 +4367,10 @@ class ImportDocument(CodeDocument):
 
         """
         # Module is a list of names concatenated by ".".
-        buf = [line.get().text]
-        line.match(token.NAME, level=self.LEVEL)
-        while (line.check(".", level=self.LEVEL)):
-            line.match(".", level=self.LEVEL)
-            buf.append(line.get().text)
-            line.match(token.NAME, level=self.LEVEL)
+        buf = [line.take_type(token.NAME, self.LEVEL)]
+        while (line.expect_text(".", self.LEVEL)):
+            line.take_text(".", self.LEVEL)
+            buf.append(line.take_type(token.NAME, self.LEVEL))
         return ".".join(buf)
 
     def parse_identifier(
@@ -3063,8 +4394,7 @@ class ImportDocument(CodeDocument):
 
         """
         # Identifier is just a name.
-        name = line.get().text
-        line.match(token.NAME, level=self.LEVEL)
+        name = line.take_type(token.NAME, self.LEVEL)
         return name
 
     def parse_rename(
@@ -3088,14 +4418,13 @@ class ImportDocument(CodeDocument):
 
         """
         # First word is fixed or rename is not defined.
-        if (line.check("as", level=self.LEVEL)):
-            line.match("as", level=self.LEVEL)
+        if (line.expect_text("as", self.LEVEL)):
+            line.take_text("as", self.LEVEL)
         else:
             return None
 
         # Rename is just a name.
-        name = line.get().text
-        line.match(token.NAME, level=self.LEVEL)
+        name = line.take_type(token.NAME, self.LEVEL)
         return name
 
     def append_module(
@@ -3225,10 +4554,9 @@ class IntroDocument(CommentDocument):
         ):
             pass
         else:
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " introduction requires constant head and tail lines.",
-                self.FILEDOC.PATH, "line {:d}".format(self.row),
+            report(
+                self.FILEDOC.PATH, row=self.row, column=-1, rule="intro-head",
+                message="introduction requires constant head and tail lines",
             )
             raise RuntimeError
 
@@ -3236,27 +4564,21 @@ class IntroDocument(CommentDocument):
         words = texts[3][3:-3].split(" ")
         for itr in words:
             if (re.match(FIRST, itr) is None):
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " introduction requires title words to be capitalized.",
-                    self.FILEDOC.PATH, "line {:d}".format(self.row),
+                report(
+                    self.FILEDOC.PATH, row=self.row + 3, column=-1,
+                    rule="intro-title",
+                    message="introduction requires title words to be" \
+                    " capitalized",
                 )
-                raise RuntimeError
+                break
             else:
                 pass
         self.title = " ".join(words)
 
         # Translate parsed text into paragraphs.
-        try:
-            self.paragraphs = paragraphize(texts[4:-3])
-        except:
-            # Extend paragraph error report.
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " fail to translate paragraphs.",
-                self.FILEDOC.PATH, "line {:d}".format(self.row),
-            )
-            raise RuntimeError
+        self.paragraphs = paragraphize(
+            texts[4:-3], path=self.FILEDOC.PATH, row=self.row + 4,
+        )
 
     def notes(self: IntroDocument, *args: object, **kargs: object) -> None:
         r"""
@@ -3352,11 +4674,11 @@ class DescriptionDocument(CodeDocument):
             elif (obj.check(token.NEWLINE, level=self.LEVEL)):
                 break
             else:
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " description should occupy multiple lines without" \
-                    " anything else.",
-                    self.FILEDOC.PATH, "line {:d}".format(self.row),
+                report(
+                    self.FILEDOC.PATH, row=self.row, column=-1,
+                    rule="description-lines",
+                    message="description should occupy multiple lines" \
+                    " without anything else",
                 )
                 raise RuntimeError
         obj.match(token.NEWLINE, level=self.LEVEL)
@@ -3375,10 +4697,10 @@ class DescriptionDocument(CodeDocument):
         if (decoding[0] == "r\"\"\"" and decoding[-1] == "\"\"\""):
             pass
         else:
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " description has constant head and tail",
-                self.FILEDOC.PATH, "line {:d}".format(self.row),
+            report(
+                self.FILEDOC.PATH, row=self.row, column=-1,
+                rule="description-head",
+                message="description has constant head and tail",
             )
             raise RuntimeError
 
@@ -3452,16 +4774,9 @@ class ClassDescDocument(DescriptionDocument):
 
         """
         # Translate parsed text into paragraphs.
-        try:
-            self.title = paragraphize(texts)
-        except:
-            # Extend paragraph error report.
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " fail to translate paragraphs.",
-                self.FILEDOC.PATH, "line {:d}".format(self.row),
-            )
-            raise RuntimeError
+        self.title = paragraphize(
+            texts, path=self.FILEDOC.PATH, row=self.row + 1,
+        )
 
 
 class FuncDescDocument(DescriptionDocument):
@@ -3506,32 +4821,20 @@ class FuncDescDocument(DescriptionDocument):
         texts_2 = texts[breaks[2] + 1:]
 
         # Translate parsed text into paragraphs.
-        try:
-            self.title = paragraphize(texts_1)
-        except:
-            # Extend paragraph error report.
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " fail to translate paragraphs.",
-                self.FILEDOC.PATH, "line {:d}".format(self.row),
-            )
-            raise RuntimeError
+        self.title = paragraphize(
+            texts_1, path=self.FILEDOC.PATH, row=self.row + 1,
+        )
 
         # Translate parsed text into paragraphs.
-        try:
-            self.attach = paragraphize(texts_2)
-        except:
-            # Extend paragraph error report.
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " fail to translate paragraphs.",
-                self.FILEDOC.PATH, "line {:d}".format(self.row),
-            )
-            raise RuntimeError
+        self.attach = paragraphize(
+            texts_2, path=self.FILEDOC.PATH, row=self.row + breaks[2] + 2,
+        )
 
         # Save argument and return description for later review.
         self.texts_args = texts_args
         self.texts_returns = texts_returns
+        self.row_args = self.row + breaks[0] + 2
+        self.row_returns = self.row + breaks[1] + 2
 
     def review(
         self: FuncDescDocument, argdoc: ArgumentDocument,
@@ -3558,6 +4861,42 @@ class FuncDescDocument(DescriptionDocument):
         self.review_args(argdoc)
         self.review_returns(returndoc)
 
+        # Fingerprint reviewed paragraphs for inheritance check.
+        self.seal()
+
+    def seal(self: FuncDescDocument, *args: object, **kargs: object) -> None:
+        r"""
+        Fingerprint all paragraphs.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        Digest covers everything compared by inheritance check.
+        """
+        # Fingerprint paragraph by paragraph.
+        self.title_prints = fingerprint_paragraphs(self.title)
+        self.attach_prints = fingerprint_paragraphs(self.attach)
+        self.arg_prints = [
+            fingerprint_paragraphs(itr) for itr in self.arg_descs
+        ]
+        self.return_prints = [
+            fingerprint_paragraphs(itr) for itr in self.return_descs
+        ]
+
+        # Digest all fingerprints and names together.
+        self.digest = fingerprint([
+            repr((
+                self.title_prints, self.attach_prints, self.arg_names,
+                self.arg_prints, self.return_names, self.return_prints,
+            )).encode(),
+        ])
+
     def review_args(
         self: FuncDescDocument, argdoc: ArgumentDocument, *args: object,
         **kargs: object,
@@ -3584,10 +4923,10 @@ class FuncDescDocument(DescriptionDocument):
         if (texts[0] == "Args" and texts[1] == "----"):
             pass
         else:
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " argument document has constant head.",
-                self.FILEDOC.PATH, "line {:d}".format(self.row),
+            report(
+                self.FILEDOC.PATH, row=self.row_args, column=-1,
+                rule="args-head",
+                message="argument document has constant head",
             )
             raise RuntimeError
 
@@ -3603,14 +4942,15 @@ class FuncDescDocument(DescriptionDocument):
             name = texts[ptr][2:]
             ptr += 1
 
-            # Get definition.
+            # Get definition, and stop reviewing if it is missing.
             if (num == len(argdoc.items)):
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " defined arguments are less than described arguments.",
-                    self.FILEDOC.PATH, "line {:d}".format(self.row),
+                report(
+                    self.FILEDOC.PATH, row=self.row_args + 2 + ptr - 1,
+                    column=-1, rule="args-missing",
+                    message="defined arguments are less than described" \
+                    " arguments",
                 )
-                raise RuntimeError
+                break
             else:
                 pass
             given, hint = argdoc.items[num]
@@ -3620,14 +4960,12 @@ class FuncDescDocument(DescriptionDocument):
             if (name == given):
                 pass
             else:
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " defined argument \"{:s}\" does not match described" \
-                    " argument name \"{:s}\".",
-                    self.FILEDOC.PATH, "line {:d}".format(self.row),
-                    given, name,
+                report(
+                    self.FILEDOC.PATH, row=self.row_args + 2 + ptr - 1,
+                    column=-1, rule="args-name",
+                    message="defined argument \"{:s}\" does not match" \
+                    " described argument name \"{:s}\"".format(given, name),
                 )
-                raise RuntimeError
             self.arg_names.append(name)
             self.arg_hints.append(hint.text())
 
@@ -3647,15 +4985,10 @@ class FuncDescDocument(DescriptionDocument):
                     break
                 buf.append(texts[ptr][UNIT:])
                 ptr += 1
-            try:
-                attach = paragraphize(buf)
-            except:
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " fail to translate paragraphs.",
-                    self.FILEDOC.PATH, "line {:d}".format(self.row),
-                )
-                raise RuntimeError
+            attach = paragraphize(
+                buf, path=self.FILEDOC.PATH,
+                row=self.row_args + 2 + ptr - len(buf),
+            )
             self.arg_descs.append(attach)
         del self.texts_args
 
@@ -3663,13 +4996,12 @@ class FuncDescDocument(DescriptionDocument):
         if (num == len(argdoc.items)):
             pass
         else:
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " some defined arguments (\"{:s}\", ...)have no descriptions.",
-                self.FILEDOC.PATH, "line {:d}".format(self.row),
-                argdoc.items[num][0],
+            report(
+                self.FILEDOC.PATH, row=self.row_args, column=-1,
+                rule="args-undescribed",
+                message="some defined arguments (\"{:s}\", ...)have no" \
+                " descriptions".format(argdoc.items[num][0]),
             )
-            raise RuntimeError
 
     def review_returns(
         self: FuncDescDocument, returndoc: TypeHintDocument,
@@ -3697,10 +5029,10 @@ class FuncDescDocument(DescriptionDocument):
         if (texts[0] == "Returns" and texts[1] == "-------"):
             pass
         else:
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " return document has constant head.",
-                self.FILEDOC.PATH, "line {:d}".format(self.row),
+            report(
+                self.FILEDOC.PATH, row=self.row_returns, column=-1,
+                rule="returns-head",
+                message="return document has constant head",
             )
             raise RuntimeError
 
@@ -3724,14 +5056,14 @@ class FuncDescDocument(DescriptionDocument):
             name = texts[ptr][2:]
             ptr += 1
 
-            # Get definition.
+            # Get definition, and stop reviewing if it is missing.
             if (num == len(returnlist)):
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " defined returns are less than described returns.",
-                    self.FILEDOC.PATH, "line {:d}".format(self.row),
+                report(
+                    self.FILEDOC.PATH, row=self.row_returns + 2 + ptr - 1,
+                    column=-1, rule="returns-missing",
+                    message="defined returns are less than described returns",
                 )
-                raise RuntimeError
+                break
             else:
                 pass
             hint = returnlist[num]
@@ -3748,15 +5080,10 @@ class FuncDescDocument(DescriptionDocument):
                     break
                 buf.append(texts[ptr][UNIT:])
                 ptr += 1
-            try:
-                attach = paragraphize(buf)
-            except:
-                error(
-                    "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                    " fail to translate paragraphs.",
-                    self.FILEDOC.PATH, "line {:d}".format(self.row),
-                )
-                raise RuntimeError
+            attach = paragraphize(
+                buf, path=self.FILEDOC.PATH,
+                row=self.row_returns + 2 + ptr - len(buf),
+            )
             self.return_descs.append(attach)
         del self.texts_returns
 
@@ -3764,12 +5091,11 @@ class FuncDescDocument(DescriptionDocument):
         if (num == len(returnlist)):
             pass
         else:
-            error(
-                "At \"{:s}\", \033[31;1;47;1m{:s}\033[0m," \
-                " some defined returns have no descriptions.",
-                self.FILEDOC.PATH, "line {:d}".format(self.row),
+            report(
+                self.FILEDOC.PATH, row=self.row_returns, column=-1,
+                rule="returns-undescribed",
+                message="some defined returns have no descriptions",
             )
-            raise RuntimeError
 
 
 # =============================================================================
@@ -3784,8 +5110,234 @@ class FuncDescDocument(DescriptionDocument):
 
 # Main branch.
 if (__name__ == "__main__"):
-    # Generate all notes.
-    doc = DirectoryDocument(os.path.abspath("."), rootdoc=None)
-    doc.parse()
+    # Parse console arguments.
+    console = argparse.ArgumentParser(description="Documentize MLRepo.")
+    console.add_argument(
+        "--root", type=str, default=".",
+        help="Root directory of the repository.",
+    )
+    console.add_argument(
+        "--jobs", type=int, default=1,
+        help="Number of worker processes for parsing files.",
+    )
+    console.add_argument(
+        "--cache", type=str, default="",
+        help="Directory of parsed document cache (e.g., \".doccache\").",
+    )
+    console.add_argument(
+        "--rules", type=str, action="append", default=[],
+        help="Module registering extra line rules (can repeat).",
+    )
+    console.add_argument(
+        "--collect", action="store_true",
+        help="Collect all diagnostics rather than stop at the first one.",
+    )
+    console.add_argument(
+        "--diagnostics", type=str, default="",
+        help="File streaming diagnostics as soon as they are found.",
+    )
+    console.add_argument(
+        "--diagnostics-format", type=str, choices=["jsonl", "sarif"],
+        default="jsonl", help="Format of diagnostics file.",
+    )
+    console.add_argument(
+        "--check", action="store_true",
+        help="Only check files without generating any note.",
+    )
+    console.add_argument(
+        "--stdin", action="store_true",
+        help="Read selected files from standard input (e.g., git diff).",
+    )
+    console.add_argument(
+        "--recover", type=str, choices=RECOVERS, default="",
+        help="Recoverability verification level (default \"full\", or " \
+        "\"fast\" in watch or serve mode).",
+    )
+    console.add_argument(
+        "--lazy", action="store_true",
+        help="Outline definitions first, and parse them only on demand.",
+    )
+    console.add_argument(
+        "--watch", action="store_true",
+        help="Keep running and regenerate notes whenever files change.",
+    )
+    console.add_argument(
+        "--debounce", type=float, default=0.5,
+        help="Quiet seconds ending a burst of changes in watch mode.",
+    )
+    console.add_argument(
+        "--serve", type=str, default="",
+        help="Unix domain socket serving lint and render requests.",
+    )
+    console.add_argument(
+        "--serve-timeout", type=float, default=10.0,
+        help="Idle seconds dropping a connection in serve mode.",
+    )
+    console.add_argument(
+        "--io-workers", type=int, default=4,
+        help="Number of threads prefetching files and saving README files " \
+        "(0 for blocking I/O).",
+    )
+    console.add_argument(
+        "--instrument", action="store_true",
+        help="Record time and calls of stages, documents and files.",
+    )
+    console.add_argument(
+        "--instrument-top", type=int, default=10,
+        help="Number of the slowest records to log for every kind.",
+    )
+    console.add_argument(
+        "--instrument-json", type=str, default="",
+        help="JSON file dumping all instrumentation records.",
+    )
+    console.add_argument(
+        "--profile", type=str, default="",
+        help="Collapsed stack file of a profiled run for flame graphs.",
+    )
+    console.add_argument(
+        "--profile-interval", type=float, default=0.001,
+        help="Seconds of processor time between stack samples.",
+    )
+    console.add_argument(
+        "--profile-top", type=int, default=10,
+        help="Number of the slowest functions to log.",
+    )
+    console.add_argument(
+        "--profile-json", type=str, default="",
+        help="JSON file dumping profiling summary.",
+    )
+    console.add_argument(
+        "files", type=str, nargs="*",
+        help="Selected files to check (default all files).",
+    )
+    args = console.parse_args()
+
+    # Selected files can also be given line by line from standard input.
+    if (args.stdin):
+        args.files.extend(
+            itr.strip() for itr in sys.stdin if len(itr.strip()) > 0
+        )
+    else:
+        pass
+    if (len(args.files) == 0 and not args.stdin):
+        files = None
+    elif (args.watch or len(args.serve) > 0):
+        console.error("selected files can only be given by requests")
+    elif (args.check):
+        files = args.files
+    else:
+        console.error("selected files can only be checked (with --check)")
+    if (args.instrument and args.jobs > 1):
+        console.error("instrumentation only works with a single job")
+    else:
+        pass
+    if (len(args.profile) > 0 and args.jobs > 1):
+        console.error("profiling only works with a single job")
+    else:
+        pass
+    update_collect(val=args.collect)
+    update_lazy(val=args.lazy)
+    if (len(args.recover) > 0):
+        update_recover(val=args.recover)
+    elif (args.watch or len(args.serve) > 0):
+        update_recover(val="fast")
+    else:
+        update_recover(val="full")
+    if (len(args.diagnostics) > 0):
+        stream = Stream(args.diagnostics, form=args.diagnostics_format)
+        update_stream(val=stream)
+    else:
+        stream = None
+
+    # Import extra rule modules so that they can register themselves.
+    for itr in args.rules:
+        importlib.import_module(itr)
+
+    # Instrument after all rules are registered.
+    if (args.instrument):
+        instrumentize()
+    else:
+        pass
+
+    # Instrumentation records a single thread, thus I/O is blocking.
+    if (args.io_workers > 0 and not args.instrument):
+        fetcher = Fetcher(workers=args.io_workers)
+        update_fetcher(val=fetcher)
+    else:
+        fetcher = None
+
+    # Watching and serving keep parsed documents resident in memory.
+    config = default(args.root)
+    if (args.watch or len(args.serve) > 0):
+        cache = Resident(
+            args.cache, settings=settings(config=config, rules=args.rules),
+        )
+    elif (len(args.cache) > 0):
+        cache = Cache(
+            args.cache, settings=settings(config=config, rules=args.rules),
+        )
+    else:
+        cache = None
+
+    # Profile the whole run if it is required.
+    if (len(args.profile) > 0):
+        profiler = Profiler(interval=args.profile_interval)
+        profiler.start()
+    else:
+        profiler = None
+
+    # Generate all notes, and always complete diagnostics file.
+    doc = DirectoryDocument(config.ROOT, config=config, rootdoc=None)
+    try:
+        if (len(args.serve) > 0):
+            serve(
+                doc, jobs=args.jobs, cache=cache, path=args.serve,
+                timeout=args.serve_timeout,
+            )
+        elif (args.watch):
+            watch(
+                doc, jobs=args.jobs, cache=cache, check=args.check,
+                debounce=args.debounce,
+            )
+        else:
+            doc.parse(
+                jobs=args.jobs, cache=cache, check=args.check, files=files,
+            )
+    finally:
+        if (stream is None):
+            pass
+        else:
+            stream.close()
+        if (fetcher is None):
+            pass
+        else:
+            fetcher.close()
+
+        # Report instrumentation even if it stops at a diagnostic.
+        if (args.instrument):
+            show(num=args.instrument_top)
+        else:
+            pass
+        if (args.instrument and len(args.instrument_json) > 0):
+            dump(args.instrument_json)
+        else:
+            pass
+
+        # Report profiling even if it stops at a diagnostic.
+        if (profiler is None):
+            pass
+        else:
+            profiler.stop()
+            profiler.show(num=args.profile_top)
+            profiler.dump(
+                args.profile, num=args.profile_top,
+                summary=args.profile_json,
+            )
+
+    # Summarize diagnostics, and fail if there is any.
+    if (summary() > 0):
+        exit(1)
+    else:
+        pass
 else:
     pass
\ No newline at end of file
@@ -0,0 +1,340 @@
+# Import future.
+from __future__ import annotations
+
+# Import typing.
+from typing import Any
+from typing import Tuple as MultiReturn
+from typing import List, Dict, Callable
+
+# Import dependencies.
+import sys
+import os
+import json
+import signal
+import cProfile
+import pstats
+import collections
+
+# Add development library to path.
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+))
+
+# Import logging.
+from pytorch.logging import debug, info1, info2, focus, warning, error
+
+# Import dependencies.
+from doc.code import Word, Line, Code
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Profiler Objects >>
+# Profile a whole run for hot paths of the scanning interface.
+#
+# Calls and own time of every function are counted by deterministic
+# profiling, and they are summarized per token so that overhead of tiny
+# scanning methods is comparable between trees and over time.
+# Stacks are sampled by a timer of processor time in the same run, and they
+# are saved in collapsed format for flame graphs.
+#
+# Only current process and its main thread are profiled.
+# Deterministic profiling inflates time of tiny methods, thus own time is
+# only meaningful relatively.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+# Scanning interface summarized per token.
+SCANNERS: List[MultiReturn[str, Callable]] = [
+    ("Word.check", Word.check),
+    ("Line.check", Line.check),
+    ("Line.match", Line.match),
+    ("Line.get", Line.get),
+    ("Line.next", Line.next),
+    ("Line.eol", Line.eol),
+    ("Line.expect_type", Line.expect_type),
+    ("Line.expect_text", Line.expect_text),
+    ("Line.take_type", Line.take_type),
+    ("Line.take_text", Line.take_text),
+    ("Code.get", Code.get),
+    ("Code.next", Code.next),
+    ("Code.next_line", Code.next_line),
+    ("Code.eof", Code.eof),
+    ("Code.blank_top", Code.blank_top),
+]
+
+
+def locate(function: Callable, *args: object, **kargs: object) -> Any:
+    r"""
+    Locate a function in profiling statistics.
+
+    Args
+    ----
+    - function
+        Function.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - key
+        Key of the function in profiling statistics.
+
+    """
+    # Statistics are keyed by file, first row and name of code.
+    code = getattr(function, "__code__")
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+
+def label(code: Any, *args: object, **kargs: object) -> str:
+    r"""
+    Get frame label of a code.
+
+    Args
+    ----
+    - code
+        Code object.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - label
+        Label of file name and qualified name.
+
+    """
+    # Collapsed format reserves semicolons and spaces.
+    name = getattr(code, "co_qualname", code.co_name)
+    return "{:s}:{:s}".format(
+        os.path.basename(code.co_filename), name,
+    ).replace(";", ",").replace(" ", "")
+
+
+class Profiler(object):
+    r"""
+    Profiler of deterministic calls and sampled stacks.
+    """
+    def __init__(
+        self: Profiler, *args: object, interval: float, **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - *args
+        - interval
+            Sampling interval in seconds of processor time.
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Save necessary attributes.
+        self.INTERVAL = interval
+
+        # Allocate deterministic profile and sampled stacks.
+        self.profile = cProfile.Profile()
+        self.stacks: collections.Counter[str] = collections.Counter()
+
+    def sample(
+        self: Profiler, signum: int, frame: Any, *args: object,
+        **kargs: object,
+    ) -> None:
+        r"""
+        Sample a stack.
+
+        Args
+        ----
+        - self
+        - signum
+            Signal number.
+        - frame
+            Interrupted frame.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Collapse frames from the outermost one.
+        labels = []
+        while (frame is not None):
+            labels.append(label(frame.f_code))
+            frame = frame.f_back
+        self.stacks[";".join(reversed(labels))] += 1
+
+    def start(self: Profiler, *args: object, **kargs: object) -> None:
+        r"""
+        Start profiling.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Start sampling timer before deterministic profile.
+        signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(signal.ITIMER_PROF, self.INTERVAL, self.INTERVAL)
+        self.profile.enable()
+
+    def stop(self: Profiler, *args: object, **kargs: object) -> None:
+        r"""
+        Stop profiling.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Stop in reverse order of start.
+        self.profile.disable()
+        signal.setitimer(signal.ITIMER_PROF, 0.0, 0.0)
+        signal.signal(signal.SIGPROF, signal.SIG_DFL)
+
+    def summary(
+        self: Profiler, *args: object, num: int, **kargs: object,
+    ) -> Dict[str, Any]:
+        r"""
+        Summarize profiling.
+
+        Args
+        ----
+        - self
+        - *args
+        - num
+            Number of the slowest functions to summarize.
+        - **kargs
+
+        Returns
+        -------
+        - obj
+            Summary.
+
+        Tokens are counted by calls of setting words, since every token
+        creates exactly one word.
+        """
+        # Get calls of every function, and count tokens.
+        stats = getattr(pstats.Stats(self.profile), "stats")
+        _, tokens, _, _, _ = stats.get(locate(Word.set), (0, 0, 0.0, 0.0, {}))
+        base = max(tokens, 1)
+
+        # Summarize scanning interface per token.
+        scanners = {}
+        for name, function in SCANNERS:
+            _, calls, own, _, _ = stats.get(
+                locate(function), (0, 0, 0.0, 0.0, {}),
+            )
+            scanners[name] = {
+                "calls": calls, "per_token": calls / base, "own": own,
+            }
+
+        # Summarize the slowest functions by own time.
+        functions = {}
+        for key in sorted(stats.keys(), key=lambda x: -stats[x][2])[:num]:
+            path, row, name = key
+            _, calls, own, total, _ = stats[key]
+            functions["{:s}:{:d}({:s})".format(
+                os.path.basename(path), row, name,
+            )] = {
+                "calls": calls, "per_token": calls / base, "own": own,
+                "total": total,
+            }
+        return {
+            "tokens": tokens, "samples": sum(self.stacks.values()),
+            "scanners": scanners, "functions": functions,
+        }
+
+    def show(self: Profiler, *args: object, num: int, **kargs: object) -> None:
+        r"""
+        Log profiling summary.
+
+        Args
+        ----
+        - self
+        - *args
+        - num
+            Number of the slowest functions to log.
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Log scanning interface and the slowest functions.
+        obj = self.summary(num=num)
+        info1(
+            "Profile {:d} tokens by {:d} samples.", obj["tokens"],
+            obj["samples"],
+        )
+        info1(
+            "Scanning interface has {:.2f} calls per token.",
+            sum(itr["per_token"] for itr in obj["scanners"].values()),
+        )
+        for name, record in obj["scanners"].items():
+            info1(
+                "Function \"{:s}\" has {:d} calls, {:.2f} per token and " \
+                "{:.4f}s own.", name, record["calls"], record["per_token"],
+                record["own"],
+            )
+        info1("Slowest functions.")
+        for name, record in obj["functions"].items():
+            info1(
+                "Function \"{:s}\" has {:d} calls, {:.4f}s total and " \
+                "{:.4f}s own.", name, record["calls"], record["total"],
+                record["own"],
+            )
+
+    def dump(
+        self: Profiler, path: str, *args: object, num: int, summary: str,
+        **kargs: object,
+    ) -> None:
+        r"""
+        Dump sampled stacks and summary.
+
+        Args
+        ----
+        - self
+        - path
+            Path of collapsed stack file.
+        - *args
+        - num
+            Number of the slowest functions to summarize.
+        - summary
+            Path of JSON summary file.
+            If it is empty, summary is not dumped.
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Save a stack and its samples per line.
+        file = open(path, "w")
+        for stack, samples in sorted(self.stacks.items()):
+            file.write("{:s} {:d}\n".format(stack, samples))
+        file.close()
+
+        # Save summary for tracking over time.
+        if (len(summary) > 0):
+            file = open(summary, "w")
+            json.dump(self.summary(num=num), file, indent=4)
+            file.close()
+        else:
+            pass
\ No newline at end of file
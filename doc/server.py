@@ -0,0 +1,258 @@
+# Import future.
+from __future__ import annotations
+
+# Import typing.
+from typing import Any
+from typing import Tuple as MultiReturn
+from typing import Dict, Callable
+
+# Import dependencies.
+import os
+import json
+import socket
+import argparse
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Server Objects >>
+# Serve requests on a Unix domain socket for a long-running process.
+#
+# Every request and response is a JSON object on a single line, and a client
+# can send several requests on the same connection.
+# Requests are handled one by one, thus handler needs no lock.
+# A connection waiting longer than a timeout for its next request is dropped,
+# thus an idle client can not block other clients.
+# A request whose method is "shutdown" stops the server after its response.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+class Server(object):
+    r"""
+    Server on a Unix domain socket.
+    """
+    def __init__(
+        self: Server, path: str, *args: object, timeout: float,
+        **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - path
+            Path of the socket.
+        - *args
+        - timeout
+            Seconds a connection can wait for its next request.
+        - **kargs
+
+        Returns
+        -------
+
+        Stale socket of an earlier server is replaced.
+        """
+        # Save necessary attributes.
+        self.PATH = path
+        self.TIMEOUT = timeout
+
+        # Bind and listen.
+        if (os.path.exists(self.PATH)):
+            os.remove(self.PATH)
+        else:
+            pass
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.bind(self.PATH)
+        self.socket.listen()
+
+    def serve(
+        self: Server, handle: Callable, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Serve requests until shutdown.
+
+        Args
+        ----
+        - self
+        - handle
+            Handler from a request to its response.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Serve connections one by one.
+        self.running = True
+        while (self.running):
+            connection, _ = self.socket.accept()
+            connection.settimeout(self.TIMEOUT)
+            reader = connection.makefile("r")
+            writer = connection.makefile("w")
+            try:
+                self.respond(reader, writer, handle=handle)
+            except OSError:
+                # Client leaving early or idling too long only fails its own
+                # connection.
+                pass
+
+            # Closing a broken connection may fail again.
+            for itr in (reader, writer, connection):
+                try:
+                    itr.close()
+                except OSError:
+                    pass
+
+    def respond(
+        self: Server, reader: Any, writer: Any, *args: object,
+        handle: Callable, **kargs: object,
+    ) -> None:
+        r"""
+        Respond requests of a connection.
+
+        Args
+        ----
+        - self
+        - reader
+            Reading file of the connection.
+        - writer
+            Writing file of the connection.
+        - *args
+        - handle
+            Handler from a request to its response.
+        - **kargs
+
+        Returns
+        -------
+
+        Shutdown stops the server even if its response is not received.
+        """
+        # Respond line by line.
+        for line in reader:
+            # Broken request only fails itself.
+            try:
+                request = json.loads(line)
+            except ValueError:
+                request = {}
+            if (isinstance(request, dict) and "method" in request):
+                pass
+            else:
+                response = {"ok": False, "error": "invalid request"}
+                writer.write("{:s}\n".format(json.dumps(response)))
+                writer.flush()
+                continue
+
+            # Shutdown is handled by server itself.
+            if (request["method"] == "shutdown"):
+                self.running = False
+                writer.write("{:s}\n".format(json.dumps({"ok": True})))
+                writer.flush()
+                return
+            else:
+                response = handle(request)
+            writer.write("{:s}\n".format(json.dumps(response)))
+            writer.flush()
+
+    def close(self: Server, *args: object, **kargs: object) -> None:
+        r"""
+        Close server.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Release socket and its path.
+        self.socket.close()
+        if (os.path.exists(self.PATH)):
+            os.remove(self.PATH)
+        else:
+            pass
+
+
+def request(
+    path: str, obj: Dict[str, Any], *args: object, **kargs: object,
+) -> Dict[str, Any]:
+    r"""
+    Send a request to a server.
+
+    Args
+    ----
+    - path
+        Path of the socket.
+    - obj
+        Request.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - obj
+        Response.
+
+    """
+    # Send a line and receive a line.
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(path)
+    file = client.makefile("rw")
+    file.write("{:s}\n".format(json.dumps(obj)))
+    file.flush()
+    response = json.loads(file.readline())
+    file.close()
+    client.close()
+    return response
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Main >>
+# Main branch is a light client without loading document tool, thus it can
+# be used by editors and hooks directly.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+# Main branch.
+if (__name__ == "__main__"):
+    # Parse console arguments.
+    console = argparse.ArgumentParser(description="Request MLRepo server.")
+    console.add_argument(
+        "socket", type=str, help="Path of the socket.",
+    )
+    console.add_argument(
+        "method", type=str, choices=["lint", "render", "shutdown"],
+        help="Request method.",
+    )
+    console.add_argument(
+        "files", type=str, nargs="*",
+        help="Selected files to lint (default all files).",
+    )
+    args = console.parse_args()
+
+    # Print response, and fail if it is not clean.
+    # Selected files are resolved by caller rather than server.
+    obj: Dict[str, Any] = {"method": args.method}
+    if (len(args.files) > 0):
+        obj["files"] = [os.path.abspath(itr) for itr in args.files]
+    else:
+        pass
+    response = request(args.socket, obj)
+    print(json.dumps(response, indent=4))
+    if (response["ok"]):
+        pass
+    else:
+        exit(1)
+else:
+    pass
\ No newline at end of file
@@ -0,0 +1,462 @@
+# Import future.
+from __future__ import annotations
+
+# Import typing.
+from typing import Any
+from typing import Tuple as MultiReturn
+from typing import List, Dict, Set
+
+# Import dependencies.
+import sys
+import os
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+
+# Add development library to path.
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+))
+
+# Import logging.
+from pytorch.logging import debug, info1, info2, focus, warning, error
+
+# Import dependencies.
+
+
+# =============================================================================
+# *****************************************************************************
+# -----------------------------------------------------------------------------
+# << Watcher Objects >>
+# Watch file changes of a tree for long-running document generation.
+#
+# On Linux, changes are received from inotify through the C library directly.
+# Otherwise, the tree is polled by modification times and sizes of files.
+#
+# A burst of changes such as saving several files at once is debounced into
+# a single list of changed paths.
+# Generated README files and hidden or cache directories are never watched.
+# -----------------------------------------------------------------------------
+# *****************************************************************************
+# =============================================================================
+
+
+# Longest blocking time in seconds for the first change.
+BLOCK = 3600.0
+
+
+def ignored(path: str, *args: object, **kargs: object) -> bool:
+    r"""
+    Check if a path should be ignored.
+
+    Args
+    ----
+    - path
+        Path.
+    - *args
+    - **kargs
+
+    Returns
+    -------
+    - flag
+        If True, the path should be ignored.
+
+    """
+    # Generated README, hidden files and cache files should be ignored.
+    base = os.path.basename(path)
+    return (
+        base.startswith("README.md") or base.startswith(".") or
+        base == "__pycache__"
+    )
+
+
+class Watcher(object):
+    r"""
+    Watcher prototype.
+    """
+    def __init__(
+        self: Watcher, root: str, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - root
+            Root directory to watch.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Save necessary attributes.
+        self.ROOT = root
+
+    def poll(
+        self: Watcher, *args: object, timeout: float, **kargs: object,
+    ) -> List[str]:
+        r"""
+        Poll changed paths.
+
+        Args
+        ----
+        - self
+        - *args
+        - timeout
+            Longest waiting time in seconds.
+        - **kargs
+
+        Returns
+        -------
+        - paths
+            Changed paths.
+            If it is empty, nothing changes before timeout.
+
+        """
+        # Prototype may not implement everything.
+        error("Function is not implemented.")
+        raise NotImplementedError
+
+    def wait(
+        self: Watcher, *args: object, debounce: float, **kargs: object,
+    ) -> List[str]:
+        r"""
+        Wait for a burst of changes.
+
+        Args
+        ----
+        - self
+        - *args
+        - debounce
+            Quiet time in seconds to end a burst of changes.
+        - **kargs
+
+        Returns
+        -------
+        - paths
+            Changed paths in sorted order.
+
+        """
+        # Block until the first change.
+        changes: Set[str] = set()
+        while (len(changes) == 0):
+            changes.update(self.poll(timeout=BLOCK))
+
+        # Collect following changes until it is quiet enough.
+        while (True):
+            more = self.poll(timeout=debounce)
+            if (len(more) == 0):
+                break
+            else:
+                changes.update(more)
+        return sorted(changes)
+
+    def close(self: Watcher, *args: object, **kargs: object) -> None:
+        r"""
+        Close watcher.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Nothing to release by default.
+        pass
+
+
+class PollingWatcher(Watcher):
+    r"""
+    Watcher polling modification times.
+    """
+    def __init__(
+        self: PollingWatcher, root: str, *args: object, interval: float,
+        **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - root
+            Root directory to watch.
+        - *args
+        - interval
+            Polling interval in seconds.
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Super.
+        Watcher.__init__(self, root, *args, **kargs)
+
+        # Save necessary attributes.
+        self.INTERVAL = interval
+
+        # Take the first snapshot.
+        self.snapshot = self.stat()
+
+    def stat(
+        self: PollingWatcher, *args: object, **kargs: object,
+    ) -> Dict[str, MultiReturn[int, int]]:
+        r"""
+        Take a snapshot of the tree.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+        - snapshot
+            Modification times and sizes of all watched files.
+
+        """
+        # Walk the tree without ignored directories.
+        snapshot = {}
+        for root, dirs, files in os.walk(self.ROOT):
+            dirs[:] = [itr for itr in dirs if not ignored(itr)]
+            for itr in files:
+                if (ignored(itr)):
+                    continue
+                else:
+                    pass
+                path = os.path.join(root, itr)
+                try:
+                    status = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                snapshot[path] = (status.st_mtime_ns, status.st_size)
+        return snapshot
+
+    def poll(
+        self: PollingWatcher, *args: object, timeout: float, **kargs: object,
+    ) -> List[str]:
+        r"""
+        Poll changed paths.
+
+        Args
+        ----
+        - self
+        - *args
+        - timeout
+            Longest waiting time in seconds.
+        - **kargs
+
+        Returns
+        -------
+        - paths
+            Changed paths.
+            If it is empty, nothing changes before timeout.
+
+        """
+        # Compare snapshots until something changes or time is out.
+        deadline = time.time() + timeout
+        while (True):
+            snapshot = self.stat()
+            paths = [
+                itr for itr in set(snapshot.keys()) | set(self.snapshot.keys())
+                if snapshot.get(itr) != self.snapshot.get(itr)
+            ]
+            self.snapshot = snapshot
+            rest = deadline - time.time()
+            if (len(paths) > 0 or rest <= 0):
+                return paths
+            else:
+                time.sleep(min(self.INTERVAL, rest))
+
+
+# Inotify events of interest and flags.
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+
+class InotifyWatcher(Watcher):
+    r"""
+    Watcher receiving inotify events.
+    """
+    def __init__(
+        self: InotifyWatcher, root: str, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Initialize.
+
+        Args
+        ----
+        - self
+        - root
+            Root directory to watch.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        Operating system error is raised if inotify is not available.
+        """
+        # Super.
+        Watcher.__init__(self, root, *args, **kargs)
+
+        # Initialize inotify by C library.
+        self.libc = ctypes.CDLL(
+            ctypes.util.find_library("c") or "libc.so.6", use_errno=True,
+        )
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if (self.fd < 0):
+            raise OSError(ctypes.get_errno(), "inotify is not available")
+        else:
+            pass
+
+        # Watch all directories of the tree.
+        self.dirs: Dict[int, str] = {}
+        self.add(self.ROOT)
+
+    def add(
+        self: InotifyWatcher, path: str, *args: object, **kargs: object,
+    ) -> None:
+        r"""
+        Watch a directory and all its sub directories.
+
+        Args
+        ----
+        - self
+        - path
+            Path of the directory.
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Walk the tree without ignored directories.
+        for root, dirs, _ in os.walk(path):
+            dirs[:] = [itr for itr in dirs if not ignored(itr)]
+            wd = self.libc.inotify_add_watch(
+                self.fd, root.encode(), IN_MASK,
+            )
+            if (wd < 0):
+                raise OSError(ctypes.get_errno(), "fail to watch directory")
+            else:
+                self.dirs[wd] = root
+
+    def poll(
+        self: InotifyWatcher, *args: object, timeout: float, **kargs: object,
+    ) -> List[str]:
+        r"""
+        Poll changed paths.
+
+        Args
+        ----
+        - self
+        - *args
+        - timeout
+            Longest waiting time in seconds.
+        - **kargs
+
+        Returns
+        -------
+        - paths
+            Changed paths.
+            If it is empty, nothing changes before timeout.
+
+        """
+        # Wait for readable events.
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if (len(readable) == 0):
+            return []
+        else:
+            buf = os.read(self.fd, 65536)
+
+        # Decode events one by one.
+        paths = []
+        ptr = 0
+        while (ptr < len(buf)):
+            wd, mask, _, size = struct.unpack_from("iIII", buf, ptr)
+            name = buf[ptr + 16:ptr + 16 + size].rstrip(b"\0").decode()
+            ptr += 16 + size
+            if (mask & IN_Q_OVERFLOW):
+                # Overflow loses events, thus root is treated as changed.
+                paths.append(self.ROOT)
+                continue
+            elif (wd not in self.dirs or ignored(name)):
+                continue
+            else:
+                path = os.path.join(self.dirs[wd], name)
+            paths.append(path)
+
+            # New directory should also be watched.
+            if (mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO)):
+                self.add(path)
+            else:
+                pass
+        return paths
+
+    def close(self: InotifyWatcher, *args: object, **kargs: object) -> None:
+        r"""
+        Close watcher.
+
+        Args
+        ----
+        - self
+        - *args
+        - **kargs
+
+        Returns
+        -------
+
+        """
+        # Release inotify.
+        os.close(self.fd)
+
+
+def watcher(
+    root: str, *args: object, interval: float, **kargs: object,
+) -> Watcher:
+    r"""
+    Create a watcher of the tree.
+
+    Args
+    ----
+    - root
+        Root directory to watch.
+    - *args
+    - interval
+        Polling interval in seconds if inotify is not available.
+    - **kargs
+
+    Returns
+    -------
+    - watcher
+        Watcher.
+
+    """
+    # Prefer inotify, and fall back to polling.
+    if (sys.platform.startswith("linux")):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            warning("Inotify is not available, and fall back to polling.")
+    else:
+        pass
+    return PollingWatcher(root, interval=interval)
\ No newline at end of file
@@ -11,11 +11,9 @@ import os
 import logging
 
 # Add development library to path.
-if (os.path.basename(os.getcwd()) == "MLRepo"):
-    sys.path.append(os.path.join("."))
-else:
-    print("Code must strictly work in \"MLRepo\".")
-    exit()
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..",
+))
 
 # Import logging.
 